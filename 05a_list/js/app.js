@@ -4,6 +4,7 @@
 import { OBJECTS } from '../../shared/js/data.js';
 import { renderUI } from './ui.js';
 import * as store from '../../shared/js/store.js';
+import { bundleThumbs } from '../../shared/js/images.js';
 
 const state = {
   objects: OBJECTS,
@@ -28,6 +29,8 @@ function init() {
       Object.assign(state, changes);
       render();
     });
+    // Thumbnails switch to bundle pages as they scroll near the viewport
+    bundleThumbs(container);
   }
 }
 
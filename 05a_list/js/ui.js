@@ -8,7 +8,7 @@ import {
 } from '../../shared/js/store.js';
 import { TAG_DEFINITIONS } from '../../shared/js/data.js';
 import { formatLabel, pluralize } from '../../shared/js/colors.js';
-import { imageUrl } from '../../shared/js/images.js';
+import { setThumbSource } from '../../shared/js/images.js';
 
 // ─── Render the full UI ───
 
@@ -152,7 +152,7 @@ function renderObjectRow(obj, state, onStateChange) {
   // Icon / Thumbnail
   const iconWrap = el('div', 'obj-icon-wrap');
   const img = document.createElement('img');
-  img.src = imageUrl(obj.id, true);
+  setThumbSource(img, obj.id, '48px');
   img.alt = obj.name;
   img.className = 'obj-thumb';
   img.loading = 'lazy';
@@ -3,6 +3,7 @@
 
 import { OBJECTS } from '../../shared/js/data.js';
 import { sortBy } from '../../shared/js/store.js';
+import { bundleThumbs } from '../../shared/js/images.js';
 import { computeTags } from './tags.js';
 import { renderApp } from './ui.js';
 import { initSandbox } from './sandbox.js';
@@ -66,6 +67,8 @@ function init() {
       Object.assign(state, changes);
       render();
     });
+    // Thumbnails switch to bundle pages as they scroll near the viewport
+    bundleThumbs(container);
   }
 
   render();
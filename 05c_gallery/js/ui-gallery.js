@@ -3,7 +3,7 @@
 
 import { staleness } from '../../shared/js/store.js';
 import { formatLabel } from '../../shared/js/colors.js';
-import { imageUrl } from '../../shared/js/images.js';
+import { imageUrl, setThumbSource } from '../../shared/js/images.js';
 import { getTagDef } from './tags.js';
 import { getVisibleItems, getItemTags } from './app.js';
 import { el, addProp } from './ui-helpers.js';
@@ -252,7 +252,7 @@ function renderCard(item, state, onStateChange) {
   // Photo (cards are photo-only, text on hover)
   const photoArea = el('div', 'card-photo');
   const img = document.createElement('img');
-  img.src = imageUrl(item.id, true);
+  setThumbSource(img, item.id);
   img.alt = item.name;
   img.loading = 'lazy';
   img.className = 'card-img';
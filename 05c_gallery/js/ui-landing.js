@@ -1,7 +1,7 @@
 // ui-landing.js — Editorial landing page with horizontal scroll categories
 // Room-based browsing + curated tag exploration, Monte Cafe-inspired.
 
-import { imageUrl } from '../../shared/js/images.js';
+import { imageUrl, setThumbSource } from '../../shared/js/images.js';
 import { ROOM_COLORS, formatLabel } from '../../shared/js/colors.js';
 import { getTagDef, tagCounts } from './tags.js';
 import { getStackItems } from './app.js';
@@ -244,7 +244,7 @@ function buildTagCards(grid, state, onStateChange) {
 
   for (const item of mosaicItems.slice(0, 4)) {
     const thumb = document.createElement('img');
-    thumb.src = imageUrl(item.id, true);
+    setThumbSource(thumb, item.id);
     thumb.alt = item.name;
     thumb.className = 'landing-mosaic-img';
     thumb.loading = 'lazy';
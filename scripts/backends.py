@@ -0,0 +1,147 @@
+"""
+backends.py — Image generation backends for generate-photos.py.
+
+A backend turns a prompt into an image: generate(prompt, params) returns
+(b64 PNG payload, revised prompt) and raises on failure. It is shared by
+every fetch thread, so it must be thread-safe. Retries are not the
+backend's job; generate_image's shared Backoff handles 429s for all of them.
+
+OpenAIBackend calls the real API. MockBackend is an offline stand-in for
+measuring the pipeline (concurrency, backoff, encoding) without spending
+anything: deterministic synthetic 1024×1024 images, a configurable latency
+distribution, and injected 429 / 5xx errors shaped like the OpenAI SDK's.
+"""
+
+import base64
+import hashlib
+import math
+import random
+import threading
+import time
+from io import BytesIO
+
+BACKENDS = ("openai", "mock")
+
+
+class OpenAIBackend:
+    def __init__(self):
+        from openai import OpenAI
+        # Retries are handled by our shared Backoff, not per-request in the client.
+        self.client = OpenAI(max_retries=0)
+
+    def generate(self, prompt, params):
+        response = self.client.images.generate(prompt=prompt, n=1, response_format="b64_json", **params)
+        return response.data[0].b64_json, getattr(response.data[0], "revised_prompt", None)
+
+
+# ─── Mock ───
+
+class MockResponse:
+    def __init__(self, headers):
+        self.headers = headers
+
+
+class MockAPIError(Exception):
+    """Shaped like openai.APIStatusError: .status_code and .response.headers."""
+
+    def __init__(self, status_code, message, headers=None):
+        super().__init__(f"Error code: {status_code} - {message}")
+        self.status_code = status_code
+        self.response = MockResponse(headers or {})
+
+
+def parse_latency(spec):
+    """Parse a latency spec into a sampler taking a random.Random and returning seconds.
+
+    none | fixed:S | uniform:LOW,HIGH | lognormal:MEDIAN,SIGMA  (seconds)
+    """
+    kind, _, arg = spec.partition(":")
+    try:
+        values = [float(v) for v in arg.split(",")] if arg else []
+    except ValueError:
+        raise ValueError(f"Bad latency spec: {spec!r}")
+    if kind == "none" and not values:
+        return lambda rng: 0.0
+    if kind == "fixed" and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == "uniform" and len(values) == 2:
+        low, high = values
+        return lambda rng: rng.uniform(low, high)
+    if kind == "lognormal" and len(values) == 2:
+        median, sigma = values
+        return lambda rng: rng.lognormvariate(math.log(median), sigma)
+    raise ValueError(f"Bad latency spec: {spec!r} (none, fixed:S, uniform:LOW,HIGH, lognormal:MEDIAN,SIGMA)")
+
+
+def synthetic_png(seed, size=1024):
+    """A deterministic photo-like PNG: smooth colour fields from upscaled seeded noise."""
+    from PIL import Image
+
+    rng = random.Random(seed)
+    coarse = Image.frombytes("RGB", (16, 16), rng.randbytes(16 * 16 * 3)).resize((size, size), Image.BICUBIC)
+    grain = Image.frombytes("RGB", (size // 4, size // 4), rng.randbytes((size // 4) ** 2 * 3))
+    img = Image.blend(coarse, grain.resize((size, size), Image.BILINEAR), 0.12)
+    buffer = BytesIO()
+    # One is built per call: the fastest zlib level is ~6x cheaper, and its ~1.4MB is close to an API PNG
+    img.save(buffer, "PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+class MockBackend:
+    """Offline stand-in for the images API.
+
+    The image for a prompt is a synthetic PNG seeded by the prompt's hash,
+    so runs are reproducible and distinct prompts give unrelated images
+    (their perceptual hashes are far apart, so they are never flagged as
+    near-duplicates). Latency and errors come from one seeded RNG;
+    with concurrency the draw order, and so which call gets which, follows
+    thread scheduling, but the distribution and error rates are fixed.
+    The PNG is built within a call's latency rather than added to it, so
+    the pipeline's "api" stage measures the latency asked for (unless the
+    build alone takes longer); summary() reports the build time.
+    """
+
+    def __init__(self, seed=0, latency="lognormal:0.5,0.4", rate_429=0.0, rate_5xx=0.0,
+                 retry_after=None):
+        self.sample_latency = parse_latency(latency)
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.retry_after = retry_after
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.calls = 0
+        self.injected = {429: 0, 500: 0}
+        self.build_seconds = 0.0
+
+    def _payload(self, prompt):
+        digest = hashlib.sha256(prompt.encode()).hexdigest()
+        return base64.b64encode(synthetic_png(f"{self.seed}:{digest}")).decode("ascii")
+
+    def generate(self, prompt, params):
+        with self.lock:
+            self.calls += 1
+            delay = self.sample_latency(self.rng)
+            roll = self.rng.random()
+        start = time.perf_counter()
+        payload = self._payload(prompt) if roll >= self.rate_429 + self.rate_5xx else None
+        built = time.perf_counter() - start
+        with self.lock:
+            self.build_seconds += built
+        time.sleep(max(0.0, delay - built))
+
+        if roll < self.rate_429:
+            with self.lock:
+                self.injected[429] += 1
+            headers = {"retry-after": str(self.retry_after)} if self.retry_after is not None else {}
+            raise MockAPIError(429, "Rate limit exceeded (injected)", headers)
+        if roll < self.rate_429 + self.rate_5xx:
+            with self.lock:
+                self.injected[500] += 1
+            raise MockAPIError(500, "Internal server error (injected)")
+
+        return payload, f"{prompt} (mock)"
+
+    def summary(self):
+        return (f"Mock backend: {self.calls} calls | injected 429s: {self.injected[429]} | "
+                f"injected 5xx: {self.injected[500]} | image build {self.build_seconds:.1f}s within latency")
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+bench-catalog.py — Compare catalog load times: legacy character-walking
+JS→JSON rewrite of items.js vs single-pass regex conversion vs the
+precomputed catalog.json vs catalog.bin (all rooms, and one room).
+
+Usage:
+  python3 bench-catalog.py              # 20 rounds each
+  python3 bench-catalog.py --rounds 100
+
+Also checks that every path yields identical items, and that they match
+what the pages computed before catalog.json: the RAW.map expansion that
+shared/js/data.js ran with store.js deriveSize (re-run here in node).
+"""
+
+import argparse
+import json
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+STORE_JS = SCRIPT_DIR.parent / "shared" / "js" / "store.js"
+sys.path.insert(0, str(SCRIPT_DIR))
+from catalog import SOURCE_FILE, decode_catalog_bin, encode_catalog_bin, expand_items, load_items, parse_items
+
+# ─── Legacy loader (generate-photos.py before catalog.py), for comparison ───
+
+def _remove_line_comment(line):
+    """Remove // comments but only if they're outside of strings."""
+    in_string = False
+    escape = False
+    for i, ch in enumerate(line):
+        if escape:
+            escape = False
+            continue
+        if ch == '\\':
+            escape = True
+            continue
+        if ch == '"':
+            in_string = not in_string
+        if not in_string and ch == '/' and i + 1 < len(line) and line[i + 1] == '/':
+            return line[:i]
+    return line
+
+
+def _quote_js_keys(s):
+    """
+    Add double quotes around unquoted JS object keys.
+    Walks the string character by character to skip string contents.
+    """
+    result = []
+    i = 0
+    n = len(s)
+    in_string = False
+    escape = False
+
+    while i < n:
+        ch = s[i]
+
+        if escape:
+            result.append(ch)
+            escape = False
+            i += 1
+            continue
+
+        if ch == '\\' and in_string:
+            result.append(ch)
+            escape = True
+            i += 1
+            continue
+
+        if ch == '"':
+            in_string = not in_string
+            result.append(ch)
+            i += 1
+            continue
+
+        if in_string:
+            result.append(ch)
+            i += 1
+            continue
+
+        # Outside of strings: look for unquoted key pattern
+        # An unquoted key is a word char sequence followed by optional whitespace then ':'
+        if ch.isalpha() or ch == '_':
+            # Check if this is an unquoted key
+            j = i
+            while j < n and (s[j].isalnum() or s[j] == '_'):
+                j += 1
+            # Skip whitespace after the word
+            k = j
+            while k < n and s[k] in ' \t':
+                k += 1
+            # If followed by ':', this is a key — quote it
+            if k < n and s[k] == ':':
+                key = s[i:j]
+                result.append(f'"{key}"')
+                i = j  # continue from after the key (before the colon)
+                continue
+
+        result.append(ch)
+        i += 1
+
+    return ''.join(result)
+
+
+def legacy_parse_items(source):
+    match = re.search(r'const RAW\s*=\s*\[([\s\S]*?)\n\];', source)
+    lines = []
+    for line in match.group(1).split('\n'):
+        stripped = _remove_line_comment(line)
+        if stripped.strip():
+            lines.append(stripped)
+    json_str = f'[{_quote_js_keys(chr(10).join(lines))}]'
+    json_str = re.sub(r',\s*}', '}', json_str)
+    json_str = re.sub(r',\s*\]', ']', json_str)
+    return expand_items(json.loads(json_str))
+
+
+# ─── Page expansion (shared/js/data.js before catalog.json), for equality ───
+
+JS_EXPANSION = """
+import { readFileSync } from 'fs';
+import { pathToFileURL } from 'url';
+const [itemsPath, storePath] = process.argv.slice(1);
+const { deriveSize } = await import(pathToFileURL(storePath));
+const source = readFileSync(itemsPath, 'utf8');
+const RAW = new Function(`return ${source.match(/const RAW\\s*=\\s*(\\[[\\s\\S]*?\\n\\]);/)[1]}`)();
+let idCounter = 0;
+const OBJECTS = RAW.map(raw => {
+  idCounter++;
+  const id = `obj-${String(idCounter).padStart(3, '0')}`;
+  const volume = raw.v;
+  return {
+    id,
+    name: raw.n,
+    tags: raw.t,
+    volume_liters: volume,
+    size: deriveSize(volume),
+    dateObtained: raw.d,
+    lastUsed: raw.l,
+    usageFrequency: raw.u,
+    attachment: raw.a,
+    status: 'keeping',
+    description: raw.desc,
+    icon: raw.i,
+    detail: raw.det || null,
+  };
+});
+process.stdout.write(JSON.stringify(OBJECTS));
+"""
+
+
+def js_expand_items():
+    """Items as the pages expanded them, or None if node is not installed."""
+    node = shutil.which("node")
+    if not node:
+        return None
+    proc = subprocess.run([node, "--input-type=module", "-e", JS_EXPANSION, str(SOURCE_FILE), str(STORE_JS)],
+                          capture_output=True, text=True, encoding="utf-8", check=True)
+    return json.loads(proc.stdout)
+
+
+def diff_items(expected, actual):
+    """Human-readable differences between two item lists, one per differing field."""
+    if len(expected) != len(actual):
+        return [f"{len(actual)} items, expected {len(expected)}"]
+    return [f"{a['id']} {field}: {a.get(field)!r}, expected {e.get(field)!r}"
+            for e, a in zip(expected, actual) for field in e.keys() | a.keys() if e.get(field) != a.get(field)]
+
+
+# ─── Benchmark ───
+
+def timed(fn, rounds):
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark catalog loading")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    legacy = lambda: legacy_parse_items(SOURCE_FILE.read_text(encoding="utf-8"))
+    single = lambda: parse_items(SOURCE_FILE.read_text(encoding="utf-8"))
+    artifact = lambda: load_items(quiet=True)
+
+    expected = legacy()
+    if single() != expected or artifact().items != expected:
+        print("MISMATCH: single-pass or catalog.json output differs from the legacy loader")
+        sys.exit(1)
+    pages = js_expand_items()
+    if pages is None:
+        print("node not found: skipping the check against the page expansion\n")
+    else:
+        differences = diff_items(pages, expected)
+        if differences:
+            print(f"MISMATCH: {len(differences)} fields differ from the page expansion (store.js), e.g.")
+            print("\n".join(f"  {line}" for line in differences[:10]))
+            sys.exit(1)
+    binary = encode_catalog_bin(expected)
+    if decode_catalog_bin(binary) != expected:
+        print("MISMATCH: catalog.bin decodes to different items")
+        sys.exit(1)
+    room = expected[0]["tags"]["room"]
+
+    print(f"{len(expected)} items, {SOURCE_FILE.stat().st_size / 1024:.0f}KB items.js, {args.rounds} rounds\n")
+    print(f"  {'':<24}{'median':>10}{'min':>10}")
+    results = [("legacy (JS→JSON)", timed(legacy, args.rounds)),
+               ("single pass", timed(single, args.rounds)),
+               ("catalog.json", timed(artifact, args.rounds)),
+               ("catalog.bin", timed(lambda: decode_catalog_bin(binary), args.rounds)),
+               (f"catalog.bin ({room})", timed(lambda: decode_catalog_bin(binary, [room]), args.rounds))]
+    baseline = statistics.median(results[0][1])
+    for label, samples in results:
+        median = statistics.median(samples)
+        print(f"  {label:<24}{median:>8.2f}ms{min(samples):>8.2f}ms  ({baseline / median:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+bench-memory.py — Peak memory of the fetch → encode handoff, before and after streaming.
+
+  legacy    Each fetched base64 string waits in the encode queue until a
+            worker b64decodes it whole, wraps the bytes in BytesIO and
+            decodes the PNG (generate-photos.py before the fetch threads
+            streamed payloads into the originals store).
+  streamed  Each payload is decoded chunk by chunk into the originals store
+            as it arrives and dropped; the queue holds digests and the PNG
+            is decoded from the stored file (imaging.store_original).
+
+Each variant runs in its own process over `--items` synthetic 1024px
+payloads, `--inflight` at a time (the fetch concurrency plus whatever is
+queued for the encoders). Reports the peak of Python allocations
+(tracemalloc) and the peak RSS above the process's baseline.
+
+Usage:
+  python3 bench-memory.py
+  python3 bench-memory.py --inflight 16 --items 48
+"""
+
+import argparse
+import base64
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from io import BytesIO
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.insert(0, str(SCRIPT_DIR))
+from backends import synthetic_png
+from imaging import original_path, store_original
+
+VARIANTS = ("legacy", "streamed")
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def fresh_payload(png):
+    """A new base64 string per response, as the API client hands back."""
+    return base64.b64encode(png).decode("ascii")
+
+
+def run_legacy(png, items, inflight, originals_dir):
+    from PIL import Image
+    for _ in range(0, items, inflight):
+        queued = [fresh_payload(png) for _ in range(inflight)]
+        while queued:
+            data = base64.b64decode(queued.pop())
+            (Path(originals_dir) / "legacy.png").write_bytes(data)
+            img = Image.open(BytesIO(data))
+            img.load()
+            del data, img
+
+
+def run_streamed(png, items, inflight, originals_dir):
+    from PIL import Image
+    for _ in range(0, items, inflight):
+        queued = []
+        for _ in range(inflight):
+            payload = fresh_payload(png)
+            queued.append(store_original(payload, originals_dir))
+            del payload
+        while queued:
+            with Image.open(original_path(originals_dir, queued.pop())) as img:
+                img.load()
+
+
+def child(variant, png_path, items, inflight):
+    png = Path(png_path).read_bytes()
+    from PIL import Image  # noqa: F401 — imported before the baseline in both variants
+    baseline = peak_rss_mb()
+    tracemalloc.start()
+    with tempfile.TemporaryDirectory(prefix="bench-memory-") as originals_dir:
+        (run_legacy if variant == "legacy" else run_streamed)(png, items, inflight, originals_dir)
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(json.dumps({"traced_mb": traced_peak / 1024 / 1024, "rss_mb": peak_rss_mb() - baseline,
+                      "png_mb": len(png) / 1024 / 1024}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare peak memory of whole-payload vs streamed base64 handling")
+    parser.add_argument("--items", type=int, default=32, help="Payloads per variant (default: 32)")
+    parser.add_argument("--inflight", type=int, default=8, help="Payloads held at once (default: 8)")
+    parser.add_argument("--variant", choices=VARIANTS, help=argparse.SUPPRESS)
+    parser.add_argument("--png", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.variant:
+        child(args.variant, args.png, args.items, args.inflight)
+        return
+
+    print(f"{args.items} payloads, {args.inflight} in flight\n")
+    print(f"  {'variant':<10}{'traced peak MB':>16}{'RSS above base MB':>20}")
+    # Synthesised here so building it doesn't raise the children's RSS baseline
+    with tempfile.NamedTemporaryFile(suffix=".png") as png:
+        png.write(synthetic_png("bench-memory"))
+        png.flush()
+        for variant in VARIANTS:
+            proc = subprocess.run([sys.executable, __file__, "--variant", variant, "--png", png.name,
+                                   "--items", str(args.items), "--inflight", str(args.inflight)],
+                                  capture_output=True, text=True, check=True)
+            r = json.loads(proc.stdout)
+            print(f"  {variant:<10}{r['traced_mb']:>16.1f}{r['rss_mb']:>20.1f}")
+    print(f"\nPNG payload: {r['png_mb']:.2f} MB ({r['png_mb'] * 4 / 3:.2f} MB as base64)")
+
+
+if __name__ == "__main__":
+    main()
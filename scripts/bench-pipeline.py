@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+bench-pipeline.py — End-to-end throughput of generate-photos.py on the mock backend.
+
+Runs the full catalog (or --limit N items) through the real pipeline —
+fetch threads, shared rate limit and backoff, encode processes, journal,
+ladder index and thumbnail bundle — with `--backend mock` into a scratch
+directory, once per concurrency level. Nothing is sent to the API and
+shared/images is never touched.
+
+Reports items/s, CPU seconds and peak RSS per run for its whole process
+tree: the generator, its forkserver and the encode workers forked from it.
+They are sampled from /proc, since forkserver workers are not the
+generator's children and os.wait4 on it would miss them; elsewhere only
+the generator itself is measured.
+
+Usage:
+  python3 bench-pipeline.py                                  # Full catalog, concurrency 1,4,8
+  python3 bench-pipeline.py --concurrency 8,16 --latency lognormal:2,0.5
+  python3 bench-pipeline.py --latency none --limit 100       # Encode-bound: how fast can the CPU go
+  python3 bench-pipeline.py --formats webp --limit 50        # Skip AVIF, the slowest encoder
+  python3 bench-pipeline.py --mock-429 0.05 --retry-after 1  # Watch the shared backoff
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+GENERATOR = SCRIPT_DIR / "generate-photos.py"
+sys.path.insert(0, str(SCRIPT_DIR))
+from catalog import load_items
+
+
+SAMPLE_INTERVAL = 0.05
+
+
+def process_tree(root):
+    """pid → (CPU seconds, RSS bytes) for `root` and its descendants, from /proc."""
+    tick = os.sysconf("SC_CLK_TCK")
+    page = os.sysconf("SC_PAGE_SIZE")
+    stats = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # comm (in parens) may contain spaces; the fields after it don't
+                fields = f.read().rpartition(")")[2].split()
+        except OSError:
+            continue  # exited mid-scan
+        stats[int(entry)] = int(fields[1]), (int(fields[11]) + int(fields[12])) / tick, int(fields[21]) * page
+    tree, frontier = {}, [root]
+    while frontier:
+        pid = frontier.pop()
+        if pid in stats:
+            tree[pid] = stats[pid][1:]
+            frontier += [child for child, (ppid, *_) in stats.items() if ppid == pid]
+    return tree
+
+
+def run_measured(command):
+    """Run a command to completion. Returns (exit code, output, CPU seconds, peak RSS bytes).
+
+    With /proc, CPU is the last sample of every process seen in the tree
+    (so accurate to one sampling interval per process) and the peak is the
+    largest summed RSS of the tree at any sample. Without it, os.wait4
+    gives the command's own usage and its largest single process.
+    """
+    with tempfile.TemporaryFile(mode="w+") as output:
+        proc = subprocess.Popen(command, stdout=output, stderr=subprocess.STDOUT, text=True)
+        cpu, peak = {}, 0
+        while True:
+            # WNOHANG: the child stays a zombie, so its /proc entry outlives each check
+            pid, status, usage = os.wait4(proc.pid, os.WNOHANG)
+            if pid:
+                break
+            if os.path.isdir("/proc"):
+                tree = process_tree(proc.pid)
+                for each, (seconds, _) in tree.items():
+                    cpu[each] = seconds
+                peak = max(peak, sum(rss for _, rss in tree.values()))
+            time.sleep(SAMPLE_INTERVAL)
+        proc.returncode = os.waitstatus_to_exitcode(status)
+        output.seek(0)
+        if not cpu:
+            # ru_maxrss is KB on Linux, bytes on macOS
+            cpu[proc.pid] = usage.ru_utime + usage.ru_stime
+            peak = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+        return proc.returncode, output.read(), sum(cpu.values()), peak
+
+
+def run_once(concurrency, ids, args):
+    """One generate-photos.py run in a fresh output dir. Returns a result row."""
+    with tempfile.TemporaryDirectory(prefix="bench-pipeline-") as out:
+        command = [
+            sys.executable, str(GENERATOR),
+            "--backend", "mock", "--out", out,
+            "--concurrency", str(concurrency), "--rpm", str(args.rpm),
+            "--mock-latency", args.latency, "--mock-429", str(args.mock_429), "--mock-5xx", str(args.mock_5xx),
+            "--mock-seed", str(args.seed),
+        ]
+        if args.retry_after is not None:
+            command += ["--mock-retry-after", str(args.retry_after)]
+        if args.encode_workers:
+            command += ["--encode-workers", str(args.encode_workers)]
+        if args.formats:
+            command += ["--formats", args.formats]
+        if ids:
+            command += ["--ids", ",".join(ids)]
+
+        start = time.perf_counter()
+        returncode, output, cpu, peak = run_measured(command)
+        wall = time.perf_counter() - start
+
+    if returncode != 0:
+        sys.exit(f"generate-photos.py failed ({returncode}):\n{output}")
+    done = re.search(r"Generated: (\d+) \| Failed: (\d+)", output)
+    calls = re.search(r"Mock backend: (\d+) calls", output)
+    success, failed = (int(done.group(1)), int(done.group(2))) if done else (0, 0)
+    return {
+        "concurrency": concurrency,
+        "items": success,
+        "failed": failed,
+        "calls": int(calls.group(1)) if calls else 0,
+        "wall": wall,
+        "cpu": cpu,
+        "peak_mb": peak / (1024 * 1024),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark generate-photos.py end to end on the mock backend")
+    parser.add_argument("--concurrency", default="1,4,8", help="Comma-separated fetch concurrency levels (default: %(default)s)")
+    parser.add_argument("--limit", type=int, default=0, help="Only the first N catalog items (default: all)")
+    parser.add_argument("--latency", default="lognormal:0.5,0.4", help="Mock latency spec (default: %(default)s)")
+    parser.add_argument("--mock-429", type=float, default=0.0, help="Fraction of calls answered with 429")
+    parser.add_argument("--mock-5xx", type=float, default=0.0, help="Fraction of calls answered with 500")
+    parser.add_argument("--retry-after", type=float, help="Retry-After seconds on injected 429s")
+    parser.add_argument("--rpm", type=float, default=100000, help="Rate limit passed through (default: effectively unlimited)")
+    parser.add_argument("--encode-workers", type=int, help="Encode processes (default: generate-photos.py's)")
+    parser.add_argument("--formats", help="Ladder formats (default: generate-photos.py's; webp alone is much cheaper than avif)")
+    parser.add_argument("--seed", type=int, default=0, help="Mock seed (default: 0)")
+    args = parser.parse_args()
+
+    try:
+        levels = [int(c) for c in args.concurrency.split(",") if c.strip()]
+    except ValueError:
+        parser.error("--concurrency must be comma-separated integers")
+
+    items = load_items(quiet=True)
+    ids = [item["id"] for item in items[:args.limit]] if args.limit else None
+    count = len(ids) if ids else len(items)
+    print(f"{count} items | latency {args.latency} | 429s {args.mock_429:g} | 5xx {args.mock_5xx:g} | "
+          f"{os.cpu_count()} CPUs\n")
+
+    print(f"  {'conc':>5}{'items':>7}{'failed':>8}{'calls':>7}{'wall s':>9}{'items/s':>9}{'cpu s':>9}{'cpu %':>8}{'peak MB':>9}")
+    for concurrency in levels:
+        r = run_once(concurrency, ids, args)
+        rate = r["items"] / r["wall"] if r["wall"] else 0
+        print(f"  {r['concurrency']:>5}{r['items']:>7}{r['failed']:>8}{r['calls']:>7}{r['wall']:>9.1f}{rate:>9.2f}"
+              f"{r['cpu']:>9.1f}{r['cpu'] / r['wall'] * 100:>7.0f}%{r['peak_mb']:>9.0f}")
+
+    print("\ncpu % is the run's whole process tree over wall time (100% = one core). Peak MB is")
+    print("the tree's largest combined RSS in that run.")
+
+
+if __name__ == "__main__":
+    main()
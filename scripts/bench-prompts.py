@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+bench-prompts.py — Benchmark and golden-check prompt building.
+
+Usage:
+  python3 bench-prompts.py                   # Time build_prompt vs build_prompts (cold/warm)
+  python3 bench-prompts.py --check           # Fail unless both paths match golden/prompts.json
+  python3 bench-prompts.py --update-golden   # Re-record golden/prompts.json after an intended change
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+GOLDEN_FILE = SCRIPT_DIR / "golden" / "prompts.json"
+
+sys.path.insert(0, str(SCRIPT_DIR))
+from catalog import load_items
+from prompt_builder import build_prompt, build_prompts, clear_prompt_cache
+
+
+def check(items):
+    """Compare single-item and batch prompts with the golden file. Returns mismatch count."""
+    golden = json.loads(GOLDEN_FILE.read_text(encoding="utf-8"))
+    clear_prompt_cache()
+    batch = build_prompts(items)
+    mismatches = 0
+
+    for item, batched in zip(items, batch):
+        single = build_prompt(item)
+        expected = golden.get(item["id"])
+        if single != expected or batched != expected:
+            mismatches += 1
+            print(f"MISMATCH {item['id']}:")
+            print(f"  golden: {expected}")
+            print(f"  single: {single}")
+            print(f"  batch:  {batched}")
+
+    missing = set(golden) - {item["id"] for item in items}
+    for item_id in sorted(missing):
+        mismatches += 1
+        print(f"MISSING {item_id}: in golden file but not in catalog")
+    return mismatches
+
+
+def timed(fn, rounds, before=None):
+    samples = []
+    for _ in range(rounds):
+        if before:
+            before()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark and golden-check prompt building")
+    parser.add_argument("--rounds", type=int, default=50)
+    parser.add_argument("--check", action="store_true", help="Verify prompts against the golden file")
+    parser.add_argument("--update-golden", action="store_true", help="Rewrite the golden file from build_prompt")
+    args = parser.parse_args()
+
+    items = list(load_items(quiet=True))
+
+    if args.update_golden:
+        golden = {item["id"]: build_prompt(item) for item in items}
+        GOLDEN_FILE.parent.mkdir(parents=True, exist_ok=True)
+        GOLDEN_FILE.write_text(json.dumps(golden, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"Wrote {len(golden)} prompts to {GOLDEN_FILE}")
+        return
+
+    if args.check:
+        mismatches = check(items)
+        if mismatches:
+            print(f"\n{mismatches} prompts differ from {GOLDEN_FILE.name}")
+            sys.exit(1)
+        print(f"OK: {len(items)} prompts byte-identical to {GOLDEN_FILE.name} (single and batch)")
+        return
+
+    single = timed(lambda: [build_prompt(item) for item in items], args.rounds)
+    cold = timed(lambda: build_prompts(items), args.rounds, before=clear_prompt_cache)
+    build_prompts(items)
+    warm = timed(lambda: build_prompts(items), args.rounds)
+
+    print(f"{len(items)} items, median of {args.rounds} rounds\n")
+    for label, ms in (("build_prompt × n", single), ("build_prompts (cold)", cold), ("build_prompts (warm)", warm)):
+        print(f"  {label:<22}{ms:>8.3f}ms  ({single / ms:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
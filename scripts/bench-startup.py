@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+bench-startup.py — Startup time of the commands that never touch pixels or the network.
+
+Runs each command in a fresh interpreter, takes the median wall time, and
+reads `python -X importtime` to total the import cost and to confirm that
+heavy modules (Pillow, openai, multiprocessing, cProfile) were not loaded.
+They are imported lazily on the code paths that encode images, call the
+API, spawn process pools or profile.
+
+The threshold applies to each command's time above a bare interpreter that
+only imports argparse, measured in the same run, so it holds on slower
+machines too.
+
+Usage:
+  python3 bench-startup.py                 # Table of wall / import times and the heaviest imports
+  python3 bench-startup.py --check         # Exit 1 if a command exceeds --threshold or loads a heavy module
+  python3 bench-startup.py --threshold 40
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+
+# Interpreter startup plus argparse, which every command pays
+BASELINE = ["-c", "import argparse"]
+COMMANDS = (
+    ("dry-run (1 item)", ["generate-photos.py", "--dry-run", "--ids", "obj-001"]),
+    ("dry-run (room)", ["generate-photos.py", "--dry-run", "--include-generated", "--room", "kitchen"]),
+    ("report", ["generate-photos.py", "report"]),
+    ("catalog --check", ["build-catalog.py", "--check"]),
+)
+# Top-level packages none of COMMANDS should import
+HEAVY_MODULES = ("PIL", "openai", "multiprocessing", "cProfile", "numpy")
+
+
+def run(args, importtime=False):
+    """Run a script (or `-c` code) in a fresh interpreter. Returns (wall seconds, stderr)."""
+    target = args if args[0] == "-c" else [str(SCRIPT_DIR / args[0])] + args[1:]
+    command = [sys.executable] + (["-X", "importtime"] if importtime else []) + target
+    start = time.perf_counter()
+    proc = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    wall = time.perf_counter() - start
+    if proc.returncode != 0:
+        sys.exit(f"{' '.join(args)} failed ({proc.returncode}):\n{proc.stderr}")
+    return wall, proc.stderr
+
+
+def parse_importtime(stderr):
+    """-X importtime lines → (total import µs, {module: cumulative µs}) for every module imported."""
+    modules = {}
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        us = int(cumulative)
+        modules[name.strip()] = us
+        # Unindented names are top-level imports; their cumulative times don't overlap
+        if not name[1:].startswith(" "):
+            total += us
+    return total, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark startup of dry-run and catalog commands")
+    parser.add_argument("--rounds", type=int, default=7, help="Runs per command; the median is reported (default: 7)")
+    parser.add_argument("--threshold", type=float, default=60,
+                        help="Max median wall ms per command above interpreter + argparse alone (default: 60)")
+    parser.add_argument("--check", action="store_true", help="Exit 1 on a threshold or heavy-import regression")
+    args = parser.parse_args()
+
+    run(BASELINE)
+    baseline = statistics.median(run(BASELINE)[0] for _ in range(args.rounds)) * 1000
+    print(f"Median of {args.rounds} runs; threshold {args.threshold:g}ms above "
+          f"interpreter + argparse alone ({baseline:.0f}ms)\n")
+    print(f"  {'command':<20}{'wall ms':>9}{'above':>8}{'imports ms':>12}  heaviest imports")
+
+    failures = []
+    for label, command in COMMANDS:
+        run(command)  # Warm the page cache and __pycache__
+        wall = statistics.median(run(command)[0] for _ in range(args.rounds)) * 1000
+        total, modules = parse_importtime(run(command, importtime=True)[1])
+        heaviest = sorted(((us, name) for name, us in modules.items() if "." not in name), reverse=True)[:3]
+        print(f"  {label:<20}{wall:>9.0f}{wall - baseline:>+8.0f}{total / 1000:>12.1f}  " +
+              ", ".join(f"{name} {us / 1000:.1f}" for us, name in heaviest))
+
+        if wall - baseline > args.threshold:
+            failures.append(f"{label}: {wall - baseline:.0f}ms above baseline > {args.threshold:g}ms")
+        loaded = sorted({name.split(".")[0] for name in modules} & set(HEAVY_MODULES))
+        if loaded:
+            failures.append(f"{label}: imports {', '.join(loaded)}")
+
+    if failures:
+        print("\nRegressions:\n" + "\n".join(f"  {failure}" for failure in failures))
+        if args.check:
+            sys.exit(1)
+    elif args.check:
+        print(f"\nOK: every command within {args.threshold:g}ms of the baseline, without heavy imports")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+build-catalog.py — Expand shared/data/items.js into the precomputed catalog.
+
+Writes shared/data/catalog.json (read by shared/js/data.js and by the
+Python scripts) and, with --binary, the columnar shared/data/catalog.bin.
+Run it after editing items.js; the Python scripts also rebuild on their own
+when they notice the source has changed.
+
+Usage:
+  python3 build-catalog.py            # Rebuild catalog.json (and catalog.bin if it exists)
+  python3 build-catalog.py --binary   # Also write catalog.bin
+  python3 build-catalog.py --check    # Exit 1 if an artifact is out of date with items.js
+"""
+
+import argparse
+import gzip
+import sys
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+sys.path.insert(0, str(SCRIPT_DIR))
+from catalog import CATALOG_BIN, CATALOG_FILE, SOURCE_FILE, build_catalog, catalog_is_current, encode_catalog_bin
+
+
+def describe(path):
+    data = path.read_bytes()
+    return f"{path.name:<14}{len(data) / 1024:>8.1f} KB{len(gzip.compress(data, 9)) / 1024:>8.1f} KB gzip"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the precomputed item catalog")
+    parser.add_argument("--binary", action="store_true", help=f"Also write {CATALOG_BIN.name}")
+    parser.add_argument("--check", action="store_true", help="Only verify the artifacts are current")
+    args = parser.parse_args()
+
+    if args.check:
+        artifact = catalog_is_current()
+        stale = [] if artifact else [CATALOG_FILE.name]
+        if artifact and CATALOG_BIN.exists() and CATALOG_BIN.read_bytes() != encode_catalog_bin(artifact["items"]):
+            stale.append(CATALOG_BIN.name)
+        if stale:
+            print(f"Out of date with {SOURCE_FILE.name}: {', '.join(stale)} (run build-catalog.py)")
+            sys.exit(1)
+        print(f"OK: catalog is current with {SOURCE_FILE.name}")
+        return
+
+    binary = CATALOG_BIN if args.binary or CATALOG_BIN.exists() else None
+    items = build_catalog(SOURCE_FILE, CATALOG_FILE, binary)
+    print(f"Built {len(items)} items\n")
+    for path in (SOURCE_FILE, CATALOG_FILE, binary):
+        if path:
+            print(f"  {describe(path)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+bundle.py — Pack {id}-thumb.webp files into a few binary pages.
+
+A page is the raw WebP bytes of up to `page_size` thumbnails laid end to
+end; shared/images/thumbs.json maps each id to [page, offset, length].
+images.js fetches the pages a view needs and slices them into blob URLs,
+so a grid of 470 thumbnails costs a handful of requests instead of 470.
+The WebP bytes are stored unchanged, so nothing is re-encoded.
+
+Items are assigned to pages by catalog position, so an item keeps its page
+as others are added or regenerated. A rebuild rewrites only the pages
+whose content hash changed; unchanged pages keep their bytes and ETag.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+BUNDLE_INDEX = "thumbs.json"
+BUNDLE_VERSION = 1
+PAGE_SIZE = 64
+
+
+def page_name(page):
+    return f"thumbs-{page:02d}.bin"
+
+
+def _write_atomic(path, data):
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def read_bundle_index(images_dir):
+    try:
+        index = json.loads((Path(images_dir) / BUNDLE_INDEX).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return index if index.get("version") == BUNDLE_VERSION else None
+
+
+def write_thumb_bundle(images_dir, item_ids, page_size=PAGE_SIZE, force=False):
+    """Pack the thumbnails of `item_ids` (in catalog order) into pages.
+
+    Items without a thumbnail on disk leave a gap in their page's slots
+    rather than shifting later items onto other pages. Returns
+    (pages written, pages unchanged, items bundled).
+    """
+    images_dir = Path(images_dir)
+    old = read_bundle_index(images_dir)
+    old_pages = {} if force or not old or old.get("pageSize") != page_size else old["pages"]
+
+    members = {}  # page → [(id, bytes)]
+    for pos, item_id in enumerate(item_ids):
+        thumb = images_dir / f"{item_id}-thumb.webp"
+        if thumb.exists():
+            members.setdefault(pos // page_size, []).append((item_id, thumb.read_bytes()))
+
+    pages = {}
+    items = {}
+    written = unchanged = 0
+    for page in sorted(members):
+        digest = hashlib.sha256()
+        offset = 0
+        for item_id, data in members[page]:
+            digest.update(item_id.encode() + b"\0" + data)
+            items[item_id] = [page, offset, len(data)]
+            offset += len(data)
+        name = page_name(page)
+        entry = {"file": name, "bytes": offset, "sha256": digest.hexdigest()[:16]}
+        previous = old_pages.get(str(page))
+        if previous == entry and (images_dir / name).exists():
+            unchanged += 1
+        else:
+            _write_atomic(images_dir / name, b"".join(data for _, data in members[page]))
+            written += 1
+        pages[str(page)] = entry
+
+    # Pages that no longer hold any thumbnail
+    for page, entry in (old["pages"] if old else {}).items():
+        if page not in pages:
+            (images_dir / entry["file"]).unlink(missing_ok=True)
+
+    index = {"version": BUNDLE_VERSION, "pageSize": page_size, "pages": pages, "items": items}
+    _write_atomic(images_dir / BUNDLE_INDEX, (json.dumps(index, separators=(",", ":")) + "\n").encode())
+    return written, unchanged, len(items)
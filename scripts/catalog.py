@@ -0,0 +1,457 @@
+"""
+catalog.py — Build and load the item catalog.
+
+Items are authored in compact form (the RAW array in shared/data/items.js).
+build_catalog expands them once — ids, derived sizes, defaults — into
+shared/data/catalog.json, the canonical artifact that both the pages
+(via shared/js/data.js) and these scripts read; nothing else repeats the
+expansion. An optional columnar binary form (catalog.bin) groups rows by
+room, with per-room offsets, so a reader can decode one room's items
+without touching the rest.
+
+The RAW literal is converted in a single regex pass (no per-character
+Python loops) and decoded by the C json module.
+
+load_items returns a Catalog: the item list plus hash indexes by id and by
+each filterable field, so conjunctive filters cost time proportional to
+the matching sets rather than the whole catalog.
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import struct
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+DATA_DIR = SCRIPT_DIR.parent / "shared" / "data"
+SOURCE_FILE = DATA_DIR / "items.js"
+CATALOG_FILE = DATA_DIR / "catalog.json"
+CATALOG_BIN = DATA_DIR / "catalog.bin"
+
+# Bump when expand_items output or either artifact format changes, so stale
+# artifacts are rebuilt rather than trusted.
+CATALOG_VERSION = 2
+
+
+# ─── JS Literal Parser ───
+
+# One alternation, scanned once: strings are matched whole (and so never
+# rewritten), comments and trailing commas are dropped, bare keys get quotes.
+_JS_TOKEN = re.compile(r"""
+    "[^"\\\n]*(?:\\.[^"\\\n]*)*"    # double-quoted string, kept as is
+  | //[^\n]*                        # line comment
+  | ([A-Za-z_$][\w$]*)(?=\s*:)      # unquoted object key
+  | ,(?=\s*[}\]])                   # trailing comma
+""", re.VERBOSE)
+
+
+def _js_token_to_json(m):
+    key = m.group(1)
+    if key is not None:
+        return f'"{key}"'
+    token = m.group()
+    return token if token[0] == '"' else ""
+
+
+def parse_js_literal(literal):
+    """Convert a JS array/object literal (as items.js writes them) to Python objects.
+
+    A single regex pass rewrites it to JSON and the C json decoder builds
+    the objects. A pure-Python tokenizer that built objects directly was
+    benchmarked ~4x slower than this on the catalog source.
+    """
+    return json.loads(_JS_TOKEN.sub(_js_token_to_json, literal))
+
+
+# ─── Expansion ───
+
+def derive_size(volume):
+    """Size label for a volume in liters: the deriveSize thresholds in shared/js/store.js.
+
+    The pages derived sizes with those before catalog.json existed, and
+    getSizeRange and the size filters still assume them.
+    """
+    if volume < 1: return "XS"
+    if volume < 5: return "S"
+    if volume < 25: return "M"
+    if volume < 100: return "L"
+    return "XL"
+
+
+def expand_items(raw_items):
+    """Expand compact RAW entries into full item objects — the one place this happens."""
+    objects = []
+    for i, raw in enumerate(raw_items):
+        volume = raw["v"]
+        objects.append({
+            "id": f"obj-{i + 1:03d}",
+            "name": raw["n"],
+            "tags": raw["t"],
+            "volume_liters": volume,
+            "size": derive_size(volume),
+            "dateObtained": raw["d"],
+            "lastUsed": raw["l"],
+            "usageFrequency": raw["u"],
+            "attachment": raw["a"],
+            "status": "keeping",
+            "description": raw.get("desc", ""),
+            "icon": raw["i"],
+            "detail": raw.get("det"),
+        })
+    return objects
+
+
+def parse_items(source):
+    """Parse items.js source text into expanded items."""
+    match = re.search(r"const RAW\s*=\s*(\[[\s\S]*?\n\]);", source)
+    if not match:
+        raise RuntimeError("Could not find RAW array in items.js")
+    return expand_items(parse_js_literal(match.group(1)))
+
+
+# ─── Catalog Index ───
+
+# Indexed field → function giving an item's bucket for it
+INDEX_FIELDS = {
+    "room": lambda item: item["tags"]["room"],
+    "category": lambda item: item["tags"]["category"],
+    "subcategory": lambda item: item["tags"].get("subcategory"),
+    "usage": lambda item: item["usageFrequency"],
+    "attachment": lambda item: item["attachment"],
+    "obtained": lambda item: item["dateObtained"][:4],
+    "lastUsed": lambda item: item["lastUsed"][:4] if item["lastUsed"] else "never",
+}
+
+
+class Catalog:
+    """Expanded items in catalog order, with hash indexes for fast lookups.
+
+    Behaves like a read-only list of items. Indexes map each INDEX_FIELDS
+    value to the set of item positions that have it; select() intersects
+    them smallest-first. Each field's index is built once, on first use,
+    so loading stays cheap for runs that never filter.
+    """
+
+    def __init__(self, items):
+        self.items = items
+        self.positions = {item["id"]: pos for pos, item in enumerate(items)}
+        self.indexes = {}
+
+    def index(self, field):
+        """value → set of positions for one INDEX_FIELDS field."""
+        if field not in self.indexes:
+            if field not in INDEX_FIELDS:
+                raise KeyError(f"Unknown catalog field: {field}")
+            key = INDEX_FIELDS[field]
+            buckets = {}
+            for pos, item in enumerate(self.items):
+                buckets.setdefault(key(item), set()).add(pos)
+            self.indexes[field] = buckets
+        return self.indexes[field]
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def get(self, item_id):
+        pos = self.positions.get(item_id)
+        return None if pos is None else self.items[pos]
+
+    def values(self, field):
+        """Distinct values of an indexed field."""
+        return sorted(v for v in self.index(field) if v is not None)
+
+    def select(self, ids=None, **criteria):
+        """Items matching every criterion, in catalog order.
+
+        `criteria` are INDEX_FIELDS names → wanted value; `ids` is an
+        iterable of item ids. With no filters, returns every item.
+        """
+        sets = []
+        if ids is not None:
+            sets.append({self.positions[i] for i in ids if i in self.positions})
+        for field, value in criteria.items():
+            sets.append(self.index(field).get(value, set()))
+
+        if not sets:
+            return list(self.items)
+        sets.sort(key=len)
+        matched = sets[0].intersection(*sets[1:])
+        return [self.items[pos] for pos in sorted(matched)]
+
+
+# ─── Stratified Sampling ───
+
+SAMPLE_LEVELS = ("room", "category", "subcategory")
+
+
+def _allocate(sizes, count, allocation, rng):
+    """Split `count` picks across groups of the given sizes, never exceeding a group's size.
+
+    proportional: largest-remainder quotas by group size.
+    equal: the same share for every group, with any share a small group
+    can't use passed on to the others.
+    Ties are broken by `rng`, so results are reproducible for a seed.
+    """
+    keys = list(sizes)
+    total = sum(sizes.values())
+    count = min(count, total)
+    if allocation == "proportional":
+        quotas = {k: count * sizes[k] // total for k in keys}
+        leftover = count - sum(quotas.values())
+        rng.shuffle(keys)
+        keys.sort(key=lambda k: (count * sizes[k]) % total, reverse=True)
+        for k in keys[:leftover]:
+            quotas[k] += 1
+        return quotas
+
+    # equal: fill smallest groups first so their unused share flows to the
+    # larger ones; each later group's share is recomputed from what's left.
+    rng.shuffle(keys)
+    keys.sort(key=lambda k: sizes[k])
+    quotas = {}
+    remaining = count
+    for i, k in enumerate(keys):
+        quotas[k] = min(sizes[k], remaining // (len(keys) - i))
+        remaining -= quotas[k]
+    return quotas
+
+
+def stratified_sample(items, count, seed=None, allocation="equal", exclude=()):
+    """Pick `count` items balanced across room × category × subcategory, in O(n).
+
+    Quotas are allocated level by level (rooms, then categories within each
+    room, then subcategories), so no room is under-filled while another
+    has spare items. Items whose id is in `exclude` are never picked. The
+    same seed always yields the same sample; it is returned in input order.
+    """
+    rng = random.Random(seed)
+    exclude = set(exclude)
+    pool = [item for item in items if item["id"] not in exclude]
+
+    def split(group, level):
+        if level == len(SAMPLE_LEVELS):
+            return None
+        key = INDEX_FIELDS[SAMPLE_LEVELS[level]]
+        buckets = {}
+        for item in group:
+            buckets.setdefault(key(item), []).append(item)
+        return buckets
+
+    chosen = []
+
+    def take(group, quota, level):
+        if quota <= 0:
+            return
+        if quota >= len(group):
+            chosen.extend(group)
+            return
+        buckets = split(group, level)
+        if buckets is None:
+            chosen.extend(rng.sample(group, quota))
+            return
+        quotas = _allocate({k: len(v) for k, v in buckets.items()}, quota, allocation, rng)
+        for k, bucket in buckets.items():
+            take(bucket, quotas[k], level + 1)
+
+    take(pool, count, 0)
+    picked = {item["id"] for item in chosen}
+    return [item for item in pool if item["id"] in picked]
+
+
+# ─── Columnar Binary ───
+#
+# catalog.bin, little-endian:
+#   header   "CATB", u16 version, u16 room count, u32 row count, u32 string count
+#   rooms    per room: u32 name string, u32 first row, u32 row count
+#   columns  f64 volume_liters, u32 position, then one u32 string id per
+#            BIN_STRING_FIELDS field (8-byte aligned, each row-count long)
+#   strings  u32 offsets (count + 1) into a UTF-8 blob; string 0 is null
+# Rows are grouped by room, in catalog order within each room.
+
+BIN_MAGIC = b"CATB"
+_BIN_HEADER = struct.Struct("<4sHHII")
+_BIN_ROOM = struct.Struct("<III")
+
+# One u32 string column each, in file order; detail is stored as JSON text
+BIN_STRING_FIELDS = ("id", "name", "room", "category", "subcategory", "size", "dateObtained", "lastUsed",
+                     "usageFrequency", "attachment", "status", "description", "icon", "detail")
+
+
+def _bin_strings(item):
+    tags = item["tags"]
+    detail = item["detail"]
+    return (item["id"], item["name"], tags["room"], tags["category"], tags.get("subcategory"),
+            item["size"], item["dateObtained"], item["lastUsed"], item["usageFrequency"],
+            item["attachment"], item["status"], item["description"], item["icon"],
+            None if detail is None else json.dumps(detail, ensure_ascii=False))
+
+
+def _pad8(n):
+    return -n % 8
+
+
+def encode_catalog_bin(items):
+    """Serialize expanded items to the columnar catalog.bin layout."""
+    rows = sorted(range(len(items)), key=lambda pos: INDEX_FIELDS["room"](items[pos]))
+    rooms = []
+    for row, pos in enumerate(rows):
+        room = INDEX_FIELDS["room"](items[pos])
+        if not rooms or rooms[-1][0] != room:
+            rooms.append([room, row, 0])
+        rooms[-1][2] += 1
+
+    strings = {None: 0}
+    def intern(value):
+        return strings.setdefault(value, len(strings))
+
+    per_row = [[intern(value) for value in _bin_strings(items[pos])] for pos in rows]
+    string_columns = list(zip(*per_row)) if per_row else [() for _ in BIN_STRING_FIELDS]
+    room_ids = [intern(room) for room, _, _ in rooms]
+
+    out = bytearray(_BIN_HEADER.pack(BIN_MAGIC, CATALOG_VERSION, len(rooms), len(rows), len(strings)))
+    for name_id, (_, first, count) in zip(room_ids, rooms):
+        out += _BIN_ROOM.pack(name_id, first, count)
+    out += bytes(_pad8(len(out)))
+    out += struct.pack(f"<{len(rows)}d", *(items[pos]["volume_liters"] for pos in rows))
+    out += struct.pack(f"<{len(rows)}I", *rows)
+    for column in string_columns:
+        out += struct.pack(f"<{len(rows)}I", *column)
+
+    blob = bytearray()
+    offsets = [0]
+    for value in list(strings)[1:]:
+        blob += value.encode("utf-8")
+        offsets.append(len(blob))
+    offsets.insert(0, 0)  # string 0 (null) is empty
+    out += struct.pack(f"<{len(offsets)}I", *offsets)
+    out += blob
+    return bytes(out)
+
+
+def decode_catalog_bin(data, rooms=None):
+    """Decode catalog.bin back into expanded items, in catalog order.
+
+    With `rooms`, only those rooms' row ranges are decoded.
+    """
+    magic, version, room_count, row_count, string_count = _BIN_HEADER.unpack_from(data)
+    if magic != BIN_MAGIC or version != CATALOG_VERSION:
+        raise ValueError("Not a catalog.bin of this version")
+    view = memoryview(data)
+    at = _BIN_HEADER.size
+    room_ranges = []
+    for _ in range(room_count):
+        room_ranges.append(_BIN_ROOM.unpack_from(data, at))
+        at += _BIN_ROOM.size
+    at += _pad8(at)
+
+    volumes = view[at:at + 8 * row_count].cast("d")
+    at += 8 * row_count
+    positions = view[at:at + 4 * row_count].cast("I")
+    at += 4 * row_count
+    columns = []
+    for _ in BIN_STRING_FIELDS:
+        columns.append(view[at:at + 4 * row_count].cast("I"))
+        at += 4 * row_count
+    offsets = view[at:at + 4 * (string_count + 1)].cast("I")
+    blob = view[at + 4 * (string_count + 1):]
+
+    decoded = {0: None}
+    def string(sid):
+        if sid not in decoded:
+            decoded[sid] = str(blob[offsets[sid]:offsets[sid + 1]], "utf-8")
+        return decoded[sid]
+
+    wanted = None if rooms is None else set(rooms)
+    items = []
+    for name_id, first, count in room_ranges:
+        if wanted is not None and string(name_id) not in wanted:
+            continue
+        for row in range(first, first + count):
+            (item_id, name, room, category, subcategory, size, obtained, last_used,
+             usage, attachment, status, description, icon, detail) = (string(col[row]) for col in columns)
+            tags = {"room": room, "category": category}
+            if subcategory is not None:
+                tags["subcategory"] = subcategory
+            volume = volumes[row]
+            items.append((positions[row], {
+                "id": item_id,
+                "name": name,
+                "tags": tags,
+                "volume_liters": int(volume) if volume.is_integer() else volume,
+                "size": size,
+                "dateObtained": obtained,
+                "lastUsed": last_used,
+                "usageFrequency": usage,
+                "attachment": attachment,
+                "status": status,
+                "description": description,
+                "icon": icon,
+                "detail": None if detail is None else json.loads(detail),
+            }))
+    items.sort(key=lambda pair: pair[0])
+    return [item for _, item in items]
+
+
+# ─── Artifact ───
+
+def _write_atomic(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def build_catalog(source_file=SOURCE_FILE, catalog_file=CATALOG_FILE, binary_file=None):
+    """Expand items.js into catalog.json (and catalog.bin if given). Returns the items.
+
+    catalog.json records the sha256 of the source it was built from, so
+    readers can tell when it is out of date.
+    """
+    raw = Path(source_file).read_bytes()
+    items = parse_items(raw.decode("utf-8"))
+    artifact = {"version": CATALOG_VERSION, "source": hashlib.sha256(raw).hexdigest(), "items": items}
+    _write_atomic(Path(catalog_file), json.dumps(artifact, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    if binary_file:
+        _write_atomic(Path(binary_file), encode_catalog_bin(items))
+    return items
+
+
+def catalog_is_current(catalog_file=CATALOG_FILE, source_file=SOURCE_FILE):
+    """The loaded artifact if it matches the source's version and hash, else None."""
+    try:
+        artifact = json.loads(Path(catalog_file).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if artifact.get("version") != CATALOG_VERSION:
+        return None
+    try:
+        digest = hashlib.sha256(Path(source_file).read_bytes()).hexdigest()
+    except OSError:
+        return artifact  # artifact shipped without its source: trust it
+    return artifact if artifact.get("source") == digest else None
+
+
+def load_items(catalog_file=CATALOG_FILE, source_file=SOURCE_FILE, quiet=False):
+    """Load the Catalog from catalog.json, rebuilding it first if items.js has changed."""
+    catalog_file = Path(catalog_file)
+    artifact = catalog_is_current(catalog_file, source_file)
+    if artifact is not None:
+        items = artifact["items"]
+    else:
+        binary_file = catalog_file.with_suffix(".bin")
+        items = build_catalog(source_file, catalog_file, binary_file if binary_file.exists() else None)
+        if not quiet:
+            print(f"Rebuilt {catalog_file.name} from {Path(source_file).name}")
+
+    if not quiet:
+        print(f"Loaded {len(items)} items from {catalog_file.name}")
+    return Catalog(items)
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+compress-assets.py — Write precompressed .br / .gz siblings for text assets.
+
+server.py serves these in place of the original when the client's
+Accept-Encoding allows, so nothing is compressed per request. Sources are
+hashed into scripts/.cache/compress-index.json and only changed files are
+recompressed. Brotli needs the optional `brotli` package; without it only
+gzip siblings are written.
+
+Usage:
+  python3 compress-assets.py            # Compress new/changed assets
+  python3 compress-assets.py --force    # Recompress everything
+  python3 compress-assets.py --clean    # Remove every .br / .gz sibling
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SCRIPT_DIR = Path(__file__).parent
+ROOT_DIR = SCRIPT_DIR.parent
+INDEX_FILE = SCRIPT_DIR / ".cache" / "compress-index.json"
+
+sys.path.insert(0, str(ROOT_DIR))
+from server import COMPRESSIBLE_EXTENSIONS, PRECOMPRESSED
+
+SKIP_DIRS = {".git", "scripts", "screenshots", "node_modules", "__pycache__", ".cache"}
+# Below this, headers outweigh the savings
+MIN_SIZE = 1024
+
+COMPRESSORS = {
+    "gzip": lambda data: gzip.compress(data, compresslevel=9, mtime=0),
+    "br": (lambda data: brotli.compress(data, quality=11, mode=brotli.MODE_TEXT)) if brotli else None,
+}
+
+
+def find_assets(root):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS)
+        for name in sorted(filenames):
+            if name.endswith(COMPRESSIBLE_EXTENSIONS):
+                yield Path(dirpath) / name
+
+
+def write_atomic(path, data):
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def compress_asset(path, digest, index, force):
+    """Bring one asset's siblings up to date. Returns (source bytes, bytes per encoding)."""
+    rel = path.relative_to(ROOT_DIR).as_posix()
+    data = None
+    sizes = {}
+    for encoding, suffix in PRECOMPRESSED:
+        compress = COMPRESSORS[encoding]
+        if compress is None:
+            continue
+        sibling = path.with_name(path.name + suffix)
+        if not force and index.get(rel) == digest and sibling.exists():
+            # Unchanged source: just make sure the sibling isn't considered stale
+            if sibling.stat().st_mtime_ns < path.stat().st_mtime_ns:
+                os.utime(sibling)
+            sizes[encoding] = sibling.stat().st_size
+            continue
+        if data is None:
+            data = path.read_bytes()
+        packed = compress(data)
+        if len(packed) >= len(data):
+            sibling.unlink(missing_ok=True)
+            continue
+        write_atomic(sibling, packed)
+        sizes[encoding] = len(packed)
+    index[rel] = digest
+    return sizes
+
+
+def clean(root):
+    removed = 0
+    for path in find_assets(root):
+        for _, suffix in PRECOMPRESSED:
+            sibling = path.with_name(path.name + suffix)
+            if sibling.exists():
+                sibling.unlink()
+                removed += 1
+    INDEX_FILE.unlink(missing_ok=True)
+    print(f"Removed {removed} precompressed files")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompress text assets for server.py")
+    parser.add_argument("--force", action="store_true", help="Recompress even unchanged files")
+    parser.add_argument("--clean", action="store_true", help="Delete all .br/.gz siblings and the index")
+    args = parser.parse_args()
+
+    if args.clean:
+        clean(ROOT_DIR)
+        return
+
+    if brotli is None:
+        print("Note: brotli not installed (pip install brotli) — writing gzip only")
+
+    try:
+        index = json.loads(INDEX_FILE.read_text())
+    except (OSError, ValueError):
+        index = {}
+
+    totals = {"source": 0}
+    files = skipped = 0
+    seen = set()
+    for path in find_assets(ROOT_DIR):
+        data = path.read_bytes()
+        if len(data) < MIN_SIZE:
+            skipped += 1
+            continue
+        seen.add(path.relative_to(ROOT_DIR).as_posix())
+        sizes = compress_asset(path, hashlib.sha256(data).hexdigest(), index, args.force)
+        files += 1
+        totals["source"] += len(data)
+        for encoding, size in sizes.items():
+            totals[encoding] = totals.get(encoding, 0) + size
+
+    index = {rel: digest for rel, digest in index.items() if rel in seen}
+    INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(INDEX_FILE, json.dumps(index, indent=2, sort_keys=True).encode())
+
+    print(f"{files} assets ({skipped} under {MIN_SIZE} bytes skipped), {totals['source'] / 1024:.1f} KB")
+    for encoding, _ in PRECOMPRESSED:
+        if encoding in totals:
+            print(f"  {encoding:<5}{totals[encoding] / 1024:>10.1f} KB  ({totals[encoding] / totals['source']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -19,61 +19,16 @@ import { buildPrompt } from './prompt-builder.mjs';
 const __dirname = dirname(fileURLToPath(import.meta.url));
 const SHARED_DIR = join(__dirname, '..', 'shared');
 const IMAGES_DIR = join(SHARED_DIR, 'images');
-const DATA_FILE = join(SHARED_DIR, 'js', 'data.js');
+const CATALOG_FILE = join(SHARED_DIR, 'data', 'catalog.json');
 const MANIFEST_FILE = join(IMAGES_DIR, 'manifest.json');
 
-// ─── Parse Data ───
-
-function deriveSize(volume) {
-  if (volume <= 1) return 'XS';
-  if (volume <= 10) return 'S';
-  if (volume <= 50) return 'M';
-  if (volume <= 200) return 'L';
-  return 'XL';
-}
+// ─── Load Data ───
 
+// Expanded by scripts/build-catalog.py from shared/data/items.js
 function loadItems() {
-  const source = readFileSync(DATA_FILE, 'utf-8');
-
-  // Extract the RAW array from data.js
-  // Find "const RAW = [" and match until the closing "];"
-  const rawMatch = source.match(/const RAW\s*=\s*\[([\s\S]*?)\n\];/);
-  if (!rawMatch) {
-    throw new Error('Could not find RAW array in data.js');
-  }
-
-  // The RAW entries use shorthand keys. We need to evaluate them.
-  // Wrap in an array and use Function constructor for safe-ish evaluation.
-  const rawArrayStr = `[${rawMatch[1]}]`;
-
-  // Use Function to evaluate (safer than eval, no access to scope)
-  const RAW = new Function(`return ${rawArrayStr}`)();
-
-  // Expand to full objects (same logic as data.js lines 546-566)
-  let idCounter = 0;
-  const objects = RAW.map(raw => {
-    idCounter++;
-    const id = `obj-${String(idCounter).padStart(3, '0')}`;
-    const volume = raw.v;
-    return {
-      id,
-      name: raw.n,
-      tags: raw.t,
-      volume_liters: volume,
-      size: deriveSize(volume),
-      dateObtained: raw.d,
-      lastUsed: raw.l,
-      usageFrequency: raw.u,
-      attachment: raw.a,
-      status: 'keeping',
-      description: raw.desc,
-      icon: raw.i,
-      detail: raw.det || null,
-    };
-  });
-
-  console.log(`Loaded ${objects.length} items from data.js`);
-  return objects;
+  const { items } = JSON.parse(readFileSync(CATALOG_FILE, 'utf-8'));
+  console.log(`Loaded ${items.length} items from catalog.json`);
+  return items;
 }
 
 // ─── Manifest ───
@@ -0,0 +1,1091 @@
+"""
+generate_photos.py — Generate DALL-E 3 photos for household inventory items.
+
+Run it as generate-photos.py, a launcher that imports this module so its
+bytecode is cached instead of compiled on every start.
+
+Usage:
+  python3 generate-photos.py --dry-run              # Print prompts without calling API
+  python3 generate-photos.py --sample 25             # Generate a 25-item stratified sample
+  python3 generate-photos.py --sample 25 --seed 7 --include-generated --dry-run  # Reproducible QA sample
+  python3 generate-photos.py --room kitchen          # Generate for a specific room
+  python3 generate-photos.py --category clothing     # Generate for a specific category
+  python3 generate-photos.py --ids obj-001,obj-005   # Generate specific items
+  python3 generate-photos.py --stale                 # Regenerate items whose prompt changed
+  python3 generate-photos.py --duplicates            # Regenerate items flagged as near-duplicates
+  python3 generate-photos.py --concurrency 4 --rpm 15  # 4 workers sharing a 15 req/min budget
+  python3 generate-photos.py --budget '$5' --priority usage  # Most-used items first, stop at $5 of API calls
+  python3 generate-photos.py --budget 40 --priority usage=3,missing=5  # 40 images, custom weights
+  python3 generate-photos.py --profile --cprofile run.pstats  # Per-stage timings + cProfile dump
+  python3 generate-photos.py --backend mock --out /tmp/photos --concurrency 8 --rpm 6000  # Offline run, synthetic images
+  python3 generate-photos.py                         # Generate all missing items
+  python3 generate-photos.py reprocess               # Rebuild derivatives from stored originals
+  python3 generate-photos.py report                  # Ladder vs legacy byte-size report
+  python3 generate-photos.py compact                 # Fold the manifest journal into manifest.json
+  python3 generate-photos.py bundle                  # Repack thumbnails into shared/images/thumbs-NN.bin
+  python3 generate-photos.py dupes                   # Hash every image and flag near-duplicates
+  python3 generate-photos.py verify --repair         # Check files against the manifest; rebuild broken ones
+
+Requires OPENAI_API_KEY environment variable (except with --backend mock).
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import nullcontext
+from pathlib import Path
+
+# ─── Paths ───
+
+SCRIPT_DIR = Path(__file__).parent
+SHARED_DIR = SCRIPT_DIR.parent / "shared"
+IMAGES_DIR = SHARED_DIR / "images"
+MANIFEST_FILE = IMAGES_DIR / "manifest.json"
+JOURNAL_FILE = IMAGES_DIR / "manifest.journal.jsonl"
+LADDER_MODULE = IMAGES_DIR / "ladder.js"
+# Everything that determines an image besides the prompt; part of the prompt cache key
+IMAGE_PARAMS = {"model": "dall-e-3", "size": "1024x1024", "quality": "standard", "style": "natural"}
+# Dollars per API call at IMAGE_PARAMS; used for the estimate and for --budget $N
+COST_PER_IMAGE = 0.04
+# 1024px API originals, content-addressed; kept out of shared/ so they aren't served
+ORIGINALS_DIR = SCRIPT_DIR / ".cache" / "originals"
+# --profile JSON reports, unless --profile-out says otherwise
+PROFILE_DIR = SCRIPT_DIR / ".cache" / "profiles"
+# verify's per-file hash/decode results, keyed by path and valid while mtime and size match
+VERIFY_CACHE = SCRIPT_DIR / ".cache" / "verify-cache.json"
+
+# ─── Local modules ───
+
+sys.path.insert(0, str(SCRIPT_DIR))
+from backends import BACKENDS, MockBackend, OpenAIBackend, parse_latency
+from bundle import PAGE_SIZE, write_thumb_bundle
+from catalog import load_items, stratified_sample
+from phash import DUPLICATE_RADIUS, DuplicateIndex, find_near_duplicates, item_phash
+from integrity import VerifyCache, entry_problems, find_orphans, legacy_files, scan_files
+from imaging import (
+    LADDER_FORMATS, LADDER_WIDTHS, available_formats, copy_derivatives, is_up_to_date, legacy_source,
+    original_path, rebuild_derivatives, size_report, store_original, write_ladder_module,
+)
+from profiling import NULL_TIMER, RunProfile, StageTimer, profiled_call
+from priority import POLICIES, apply_budget, order_jobs, parse_policy, score_items
+from prompt_builder import build_prompts
+from throttle import Backoff, TokenBucket, is_rate_limited, retry_after_seconds
+
+# ─── Manifest ───
+#
+# manifest.json is only rewritten on compaction. During a run each finished
+# item is appended to manifest.journal.jsonl and fsynced, so the write cost
+# per image is constant and a crash loses at most the line being written.
+# load_manifest replays the journal, so an interrupted run resumes exactly
+# where it stopped.
+
+def load_manifest():
+    if MANIFEST_FILE.exists():
+        manifest = json.loads(MANIFEST_FILE.read_text())
+    else:
+        manifest = {"generated": None, "count": 0, "items": {}}
+
+    replayed = replay_journal(manifest)
+    if replayed:
+        print(f"Replayed {replayed} manifest journal entries")
+    return manifest
+
+
+def replay_journal(manifest):
+    """Apply journal lines on top of manifest.json. Returns how many were applied."""
+    if not JOURNAL_FILE.exists():
+        return 0
+    applied = 0
+    with JOURNAL_FILE.open(encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A torn final line from a crash mid-append; everything before it is intact.
+                continue
+            manifest["items"][record["id"]] = record["entry"]
+            applied += 1
+    return applied
+
+
+def record_item(manifest, item_id, entry):
+    """Store an item's entry in memory and durably append it to the journal."""
+    manifest["items"][item_id] = entry
+    line = json.dumps({"id": item_id, "entry": entry}, separators=(",", ":"))
+    with JOURNAL_FILE.open("a", encoding="utf-8") as f:
+        f.write(line + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def save_manifest(manifest):
+    """Compact: atomically rewrite manifest.json, then drop the journal it now contains."""
+    manifest["generated"] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    manifest["count"] = len(manifest["items"])
+
+    tmp = MANIFEST_FILE.with_suffix(".json.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write(json.dumps(manifest, indent=2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, MANIFEST_FILE)
+
+    # Replaying after a crash here is harmless: the journal only repeats what was just written.
+    if JOURNAL_FILE.exists():
+        JOURNAL_FILE.unlink()
+
+
+# ─── Item Filtering ───
+
+def filter_items(items, args, manifest):
+    """Apply CLI filters to the Catalog via its indexes, then skip/sample."""
+    criteria = {}
+    for field, value in (("room", args.room), ("category", args.category),
+                         ("subcategory", args.subcategory), ("usage", args.usage)):
+        if value:
+            criteria[field] = value
+    ids = [s.strip() for s in args.ids.split(",")] if args.ids else None
+
+    filtered = items.select(ids=ids, **criteria)
+    if criteria or ids:
+        described = ", ".join(f"{field}: {value}" for field, value in criteria.items())
+        if ids:
+            described = ", ".join(filter(None, [described, f"{len(ids)} IDs"]))
+        print(f"Filtered to {len(filtered)} items ({described})")
+
+    # Skip already-generated (unless specific IDs requested). With --stale,
+    # only items whose recorded prompt still matches build_prompt are skipped.
+    if args.ids or args.include_generated:
+        skip = ()
+    elif args.duplicates:
+        flagged = {item_id for item_id, entry in manifest["items"].items() if entry.get("nearDuplicateOf")}
+        skip = {item["id"] for item in filtered if item["id"] not in flagged}
+        print(f"Near-duplicates: {len(flagged)} generated items are flagged")
+    elif args.stale:
+        recorded = manifest["items"]
+        skip = {item["id"] for item, prompt in zip(filtered, build_prompts(filtered))
+                if recorded.get(item["id"], {}).get("prompt") == prompt}
+        stale = sum(1 for item in filtered if item["id"] in recorded and item["id"] not in skip)
+        print(f"Stale: {stale} generated items have a changed prompt")
+    else:
+        skip = manifest["items"].keys()
+    # Items whose files failed verify count as not generated
+    broken = {item_id for item_id, entry in manifest["items"].items() if entry.get("broken")}
+    if skip and broken:
+        skip = set(skip) - broken
+        print(f"Broken: {len(broken)} generated items failed verify and will be regenerated")
+
+    # Sample diverse items
+    if args.sample and args.sample > 0:
+        seed = args.seed if args.seed is not None else random.randrange(2 ** 32)
+        filtered = stratified_sample(filtered, args.sample, seed=seed,
+                                     allocation=args.allocation, exclude=skip)
+        print(f"Selected {args.allocation} stratified sample of {len(filtered)} items "
+              f"(seed {seed}; re-run with --seed {seed})")
+    elif skip:
+        before = len(filtered)
+        filtered = [i for i in filtered if i["id"] not in skip]
+        skipped = before - len(filtered)
+        if skipped > 0:
+            print(f"Skipping {skipped} already-generated items")
+
+    return filtered
+
+
+# ─── Image Generation ───
+
+def print_dry_run(item, prompt, score=None):
+    print(f"\n─── {item['id']}: {item['name']} ───")
+    print(f"Room: {item['tags']['room']} | Category: {item['tags']['category']} | Size: {item['size']}")
+    if score is not None:
+        print(f"Priority: {score:.3f}")
+    print(f"Prompt ({len(prompt)} chars):")
+    print(prompt)
+
+
+def generate_image(item, prompt, backend, bucket, backoff, timer=NULL_TIMER, stop=None):
+    """Fetch one photo from the image backend.
+
+    Safe to call from several threads at once: the backend is shared,
+    `bucket` paces calls across all of them and `backoff` holds the run's
+    shared 429 state. Returns (b64 payload, revised prompt); the caller
+    streams the payload into the originals store. `timer` splits
+    time spent waiting on the rate limit from time in API calls. Once
+    the `stop` event is set, raises CancelledError instead of calling.
+    """
+    for attempt in range(1, backoff.max_attempts + 1):
+        with timer("throttle"):
+            backoff.wait()
+            bucket.acquire()
+        if stop is not None and stop.is_set():
+            from concurrent.futures import CancelledError
+            raise CancelledError("interrupted before the API call")
+        try:
+            with timer("api"):
+                result = backend.generate(prompt, IMAGE_PARAMS)
+            backoff.succeeded()
+            return result
+        except Exception as e:
+            if not is_rate_limited(e) or attempt == backoff.max_attempts:
+                raise
+            delay = backoff.throttled(retry_after_seconds(e))
+            log(item, f"Rate limited (attempt {attempt}/{backoff.max_attempts}). Pausing all workers {delay:.1f}s...")
+
+
+# ─── Prompt Cache ───
+#
+# An image is determined by its prompt plus IMAGE_PARAMS, so that pair is
+# hashed into a promptKey. Items sharing a key within a run make one API
+# call; a key already in the manifest makes none — its result is re-encoded
+# from the stored original, or its files are copied.
+
+def prompt_key(prompt, params=IMAGE_PARAMS):
+    blob = json.dumps([prompt, params], sort_keys=True)
+    return hashlib.sha256(blob.encode()).hexdigest()[:16]
+
+
+def prompt_cache(manifest, wanted=None):
+    """promptKey → (item id, entry) for every manifest entry whose images are on disk.
+
+    With `wanted` (promptKey → prompt), only entries for those keys are
+    looked up, so a small run doesn't hash every older entry's prompt or
+    stat every image.
+    """
+    prompts = set(wanted.values()) if wanted is not None else None
+    cache = {}
+    for item_id, entry in manifest["items"].items():
+        prompt = entry.get("prompt")
+        if not prompt or entry.get("broken"):
+            continue
+        key = entry.get("promptKey")
+        if prompts is not None and (key not in wanted if key else prompt not in prompts):
+            continue
+        key = key or prompt_key(prompt)
+        if key not in cache and legacy_source(IMAGES_DIR, item_id).exists():
+            cache[key] = (item_id, entry)
+    return cache
+
+
+def plan_jobs(to_generate, manifest, use_cache=True, regenerate=False):
+    """Group items by promptKey. Each job is one API call or one cache reuse.
+
+    Returns (jobs, unchanged). Jobs are dicts: key, prompt, items (every
+    item that gets the result), and source — None to call the API, else
+    (item id, entry) of the manifest result to reuse. `unchanged` lists
+    items whose own manifest entry already matches their prompt; with
+    `regenerate` (items asked for explicitly) those get a fresh API call.
+    """
+    prompts = build_prompts(to_generate)
+    keys = [prompt_key(prompt) for prompt in prompts]
+    cache = prompt_cache(manifest, dict(zip(keys, prompts))) if use_cache else {}
+    jobs = {}
+    unchanged = []
+    for item, prompt, key in zip(to_generate, prompts, keys):
+        source = cache.get(key)
+        if source and source[0] == item["id"]:
+            if not regenerate:
+                unchanged.append(item)
+                continue
+            source = None
+        job = jobs.get(key)
+        if job is None:
+            job = jobs[key] = {"key": key, "prompt": prompt, "items": [], "source": source}
+        elif source is None:
+            # The cached result is this item's own image; reusing it would not regenerate it
+            job["source"] = None
+        job["items"].append(item)
+    return list(jobs.values()), unchanged
+
+
+# ─── Priority & Budget ───
+
+def parse_budget(value):
+    """--budget: "$N" caps dollars of API calls, a plain integer caps images. Returns (max calls, max images)."""
+    if value.startswith("$"):
+        dollars = float(value[1:])
+        if not math.isfinite(dollars) or dollars < 0:
+            raise ValueError
+        return int(dollars / COST_PER_IMAGE + 1e-9), None
+    images = int(value)
+    if images < 0:
+        raise ValueError
+    return None, images
+
+
+def prioritize(jobs, manifest, args):
+    """Order jobs by --priority and cut them to --budget. Returns (kept jobs, dropped jobs, scores)."""
+    weights = parse_policy(args.priority)
+    scores = {}
+    if weights:
+        prompts = {item["id"]: job["prompt"] for job in jobs for item in job["items"]}
+
+        def status(item):
+            entry = manifest["items"].get(item["id"])
+            missing = entry is None or bool(entry.get("broken"))
+            return missing, not missing and entry.get("prompt") != prompts[item["id"]]
+
+        scores = score_items([item for job in jobs for item in job["items"]], weights, status)
+        jobs = order_jobs(jobs, scores)
+    if not args.budget:
+        return jobs, [], scores
+    max_calls, max_images = parse_budget(args.budget)
+    kept, dropped = apply_budget(jobs, max_calls, max_images)
+    return kept, dropped, scores
+
+
+def new_entry(item, job, revised_prompt, **fields):
+    return {
+        "name": item["name"],
+        "prompt": job["prompt"],
+        "promptKey": job["key"],
+        "generated": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "revisedPrompt": revised_prompt,
+        **fields,
+    }
+
+
+# ─── Concurrent Runner ───
+
+_print_lock = threading.Lock()
+
+
+def log(item, message):
+    """Print one line tagged with the item id; lines from workers never interleave."""
+    with _print_lock:
+        print(f"  {item['id']}: {message}")
+
+
+def run_generation(jobs, manifest, args, backend, backoff, profile=None):
+    """Run planned jobs as a two-stage pipeline. Returns (success, failed), counted per item.
+
+    Fetch threads call the API and decode each payload straight into the
+    originals store; a process pool encodes it for every item sharing the
+    prompt, overlapping the next calls. Cached jobs go straight to encoding.
+    Results are duplicate-checked and journaled as they arrive, so an
+    interrupted run keeps everything finished so far.
+    """
+    from concurrent.futures import FIRST_COMPLETED, CancelledError, ProcessPoolExecutor, ThreadPoolExecutor, wait
+    import multiprocessing
+    import signal
+    # Encoders start on the first submit, when fetch threads are running: forking then can copy
+    # a lock another thread holds. forkserver forks them from a clean single-threaded server.
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else None
+    bucket = TokenBucket(args.rpm, capacity=args.concurrency)
+    stop = threading.Event()
+    # Photos to compare new ones against; items about to be replaced drop out
+    regenerating = {item["id"] for job in jobs for item in job["items"]}
+    duplicates = DuplicateIndex(args.radius)
+    for item_id, entry in manifest["items"].items():
+        if item_id not in regenerating:
+            duplicates.add(item_id, entry)
+    total = sum(len(job["items"]) for job in jobs)
+    done = 0
+    success = 0
+    failed = 0
+
+    def fetch(job):
+        item = job["items"][0]
+        shared = f" (shared by {len(job['items'])} items)" if len(job["items"]) > 1 else ""
+        log(item, f"generating {item['name']}{shared}...")
+        timer = StageTimer(enabled=profile is not None)
+        try:
+            with profile.profile_thread() if profile else nullcontext():
+                payload, revised_prompt = generate_image(item, job["prompt"], backend, bucket, backoff, timer, stop)
+                return store_original(payload, ORIGINALS_DIR, timer), revised_prompt
+        finally:
+            if profile:
+                # Every item sharing the prompt waited for this one call
+                for each in job["items"]:
+                    profile.merge(each["id"], timer.export())
+
+    def fail(item, e):
+        nonlocal done, failed
+        done += 1
+        failed += 1
+        backoff.failed()
+        with _print_lock:
+            print(f"[{done}/{total}] Error generating {item['id']}: {e}")
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as fetchers, \
+            ProcessPoolExecutor(max_workers=args.encode_workers,
+                                mp_context=multiprocessing.get_context(start_method),
+                                # Ctrl+C reaches the whole process group; only this process handles it
+                                initializer=signal.signal, initargs=(signal.SIGINT, signal.SIG_IGN)) as encoders:
+        # future → (stage, job or item, entry)
+        pending = {}
+
+        to_fetch = iter([job for job in jobs if job["source"] is None])
+        fetching = 0
+        stopping = False
+
+        def encode(fn, *fn_args):
+            return submit_encode(encoders, profile, fn, *fn_args)
+
+        def submit_fetches():
+            # Only `concurrency` calls are queued at a time, in priority order, so a
+            # cancelled run stops after those instead of working through the rest
+            nonlocal fetching
+            if stopping:
+                return
+            for job in to_fetch:
+                pending[fetchers.submit(fetch, job)] = ("fetch", job, None)
+                fetching += 1
+                if fetching >= args.concurrency:
+                    return
+
+        for job in jobs:
+            if job["source"] is None:
+                continue
+            source_id, source = job["source"]
+            digest = source.get("original")
+            for item in job["items"]:
+                entry = new_entry(item, job, source.get("revisedPrompt"), reusedFrom=source_id)
+                if digest and original_path(ORIGINALS_DIR, digest).exists():
+                    entry["original"] = digest
+                    future = encode(rebuild_derivatives, item["id"], digest, str(IMAGES_DIR),
+                                    str(ORIGINALS_DIR), args.widths, args.formats)
+                else:
+                    future = encode(copy_derivatives, source_id, item["id"], str(IMAGES_DIR), source)
+                pending[future] = ("encode", item, entry)
+
+        try:
+            submit_fetches()
+            while pending:
+                try:
+                    finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                except KeyboardInterrupt:
+                    if stopping:
+                        raise
+                    # Keep what was already paid for: drop queued calls and cache copies, but let
+                    # calls in flight finish and encode everything fetched before leaving
+                    stopping = True
+                    stop.set()
+                    print("\nInterrupted — finishing calls in flight (Ctrl+C again to abort)", file=sys.stderr)
+                    for future, (stage, _, entry) in list(pending.items()):
+                        if (stage == "fetch" or "reusedFrom" in entry) and future.cancel():
+                            del pending[future]
+                    continue
+                for future in finished:
+                    stage, target, entry = pending.pop(future)
+                    if stage == "fetch":
+                        fetching -= 1
+                        submit_fetches()
+                    try:
+                        result = future.result()
+                    except CancelledError:
+                        continue
+                    except Exception as e:
+                        for item in (target["items"] if stage == "fetch" else [target]):
+                            fail(item, e)
+                        continue
+
+                    if stage == "fetch":
+                        digest, revised_prompt = result
+                        for item in target["items"]:
+                            future = encode(rebuild_derivatives, item["id"], digest,
+                                            str(IMAGES_DIR), str(ORIGINALS_DIR), args.widths, args.formats)
+                            pending[future] = ("encode", item, new_entry(item, target, revised_prompt, original=digest))
+                        continue
+
+                    timings = result.pop("profile", None)
+                    entry.update(result)
+                    hit = duplicates.check(target["id"], entry)
+                    if hit:
+                        entry["nearDuplicateOf"], entry["duplicateDistance"] = hit
+                    duplicates.add(target["id"], entry)
+                    with profile.time(target["id"], "journal") if profile else nullcontext():
+                        record_item(manifest, target["id"], entry)
+                    if profile:
+                        profile.merge(target["id"], timings)
+                        profile.item_done()
+                    done += 1
+                    success += 1
+                    cached = f" (cached from {entry['reusedFrom']})" if "reusedFrom" in entry else ""
+                    lookalike = f" — looks like {hit[0]} ({hit[1]} bits apart)" if hit else ""
+                    with _print_lock:
+                        print(f"[{done}/{total}] {target['id']}: {target['name']} — "
+                              f"Full: {entry['fullSize'] / 1024:.1f}KB | Thumb: {entry['thumbSize'] / 1024:.1f}KB{cached}{lookalike}")
+        except BaseException:
+            # A crash or a second Ctrl+C: drop queued work so leaving the pools only waits for calls in flight
+            stop.set()
+            fetchers.shutdown(wait=False, cancel_futures=True)
+            encoders.shutdown(wait=False, cancel_futures=True)
+            raise
+        if stopping:
+            raise KeyboardInterrupt
+
+    return success, failed
+
+
+def submit_encode(pool, profile, fn, *fn_args):
+    """Submit an imaging call, asking it for stage timings (and cProfile stats) when profiling."""
+    if profile is None:
+        return pool.submit(fn, *fn_args)
+    if profile.worker_stats_dir:
+        return pool.submit(profiled_call, profile.worker_stats_dir, fn, *fn_args, profile=True)
+    return pool.submit(fn, *fn_args, profile=True)
+
+
+# ─── Reprocess ───
+
+def reprocess(manifest, args, profile=None):
+    """Rebuild derivatives from stored originals across all cores. No API calls.
+
+    Items generated before originals were kept get their ladder built from
+    the legacy 512px WebP instead.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    ids = {s.strip() for s in args.ids.split(",")} if args.ids else None
+    todo = []
+    missing = 0
+    current = 0
+
+    for item_id, entry in manifest["items"].items():
+        if ids is not None and item_id not in ids:
+            continue
+        digest = entry.get("original")
+        if digest and not original_path(ORIGINALS_DIR, digest).exists():
+            digest = None
+        if not digest and not legacy_source(IMAGES_DIR, item_id).exists():
+            missing += 1
+            continue
+        if not args.force and is_up_to_date(item_id, entry, IMAGES_DIR, args.widths, args.formats):
+            current += 1
+            continue
+        todo.append((item_id, digest))
+
+    print(f"Up to date: {current} | No source image: {missing} | To rebuild: {len(todo)}")
+    if not todo:
+        return 0, 0
+
+    success = 0
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            submit_encode(pool, profile, rebuild_derivatives, item_id, digest, str(IMAGES_DIR),
+                          str(ORIGINALS_DIR), args.widths, args.formats): item_id
+            for item_id, digest in todo
+        }
+        for i, future in enumerate(as_completed(futures)):
+            item_id = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"[{i + 1}/{len(todo)}] Error rebuilding {item_id}: {e}")
+                continue
+            timings = result.pop("profile", None)
+            with profile.time(item_id, "journal") if profile else nullcontext():
+                record_item(manifest, item_id, {**manifest["items"][item_id], **result})
+            if profile:
+                profile.merge(item_id, timings)
+                profile.item_done()
+            success += 1
+            ladder_bytes = sum(sum(sizes.values()) for sizes in result["variants"].values())
+            print(f"[{i + 1}/{len(todo)}] {item_id} — Ladder: {ladder_bytes / 1024:.1f}KB")
+
+    return success, failed
+
+
+# ─── Near-Duplicates ───
+
+def scan_duplicates(manifest, args):
+    """Hash every manifest item that has no phash yet, then re-flag near-duplicates across all of them.
+
+    Flags from earlier scans or runs are replaced, so an item stops being
+    flagged once it (or its look-alike) has been regenerated.
+    """
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    todo = []
+    missing = 0
+    for item_id, entry in manifest["items"].items():
+        if entry.get("phash") and not args.rehash:
+            continue
+        digest = entry.get("original")
+        original = original_path(ORIGINALS_DIR, digest) if digest else None
+        if original and not original.exists():
+            original = None
+        if not original and not legacy_source(IMAGES_DIR, item_id).exists():
+            missing += 1
+            continue
+        todo.append((item_id, str(original) if original else None))
+
+    hashed = 0
+    if todo:
+        with ProcessPoolExecutor(max_workers=args.workers) as pool:
+            futures = {pool.submit(item_phash, item_id, original, str(IMAGES_DIR)): item_id
+                       for item_id, original in todo}
+            for future in as_completed(futures):
+                item_id = futures[future]
+                try:
+                    manifest["items"][item_id]["phash"] = future.result()
+                    hashed += 1
+                except Exception as e:
+                    print(f"  Error hashing {item_id}: {e}")
+    print(f"Hashed: {hashed} | Already hashed: {len(manifest['items']) - len(todo) - missing} | "
+          f"No image: {missing}")
+
+    start = time.perf_counter()
+    flagged = find_near_duplicates(manifest["items"], args.radius)
+    elapsed = time.perf_counter() - start
+    for item_id, entry in manifest["items"].items():
+        entry.pop("nearDuplicateOf", None)
+        entry.pop("duplicateDistance", None)
+        if item_id in flagged:
+            entry["nearDuplicateOf"], entry["duplicateDistance"] = flagged[item_id]
+
+    indexed = sum(1 for entry in manifest["items"].values() if entry.get("phash"))
+    print(f"Indexed {indexed} hashes and queried each within {args.radius} bits in {elapsed * 1000:.1f}ms\n")
+    items = manifest["items"]
+    for item_id, (other_id, distance) in sorted(flagged.items(), key=lambda kv: (kv[1][1], kv[0])):
+        print(f"  {item_id} looks like {other_id} ({distance} bits): {items[item_id]['name']} / {items[other_id]['name']}")
+    return len(flagged)
+
+
+# ─── Verify ───
+
+def verify(manifest, args):
+    """Check every manifest entry's files against what it recorded. Returns ({item id: [problem]}, changed).
+
+    Each entry's "broken" field is set or cleared to match this scan;
+    filter_items treats broken items as not yet generated. Intact entries
+    written before content hashes were recorded adopt their files' hashes.
+    `changed` counts the entries this altered; 0 for an intact tree.
+    """
+    cache = VerifyCache(VERIFY_CACHE)
+    paths = [path for item_id in manifest["items"] for path in legacy_files(item_id, IMAGES_DIR)]
+    start = time.perf_counter()
+    records = scan_files(paths, cache, args.workers)
+    elapsed = time.perf_counter() - start
+    cache.save(records)
+
+    broken = {}
+    adopted = 0
+    changed = 0
+    for item_id, entry in manifest["items"].items():
+        was_broken = entry.pop("broken", None)
+        problems = entry_problems(item_id, entry, IMAGES_DIR, records)
+        if problems:
+            entry["broken"] = "; ".join(problems)
+            broken[item_id] = problems
+        elif not entry.get("fullHash"):
+            full, thumb = legacy_files(item_id, IMAGES_DIR)
+            entry["fullHash"] = records[str(full)]["hash"]
+            entry["thumbHash"] = records[str(thumb)]["hash"]
+            adopted += 1
+            changed += 1
+            continue
+        changed += entry.get("broken") != was_broken
+
+    print(f"Checked {len(paths)} files in {elapsed * 1000:.0f}ms ({cache.hits} unchanged since the last scan)")
+    print(f"Intact: {len(manifest['items']) - len(broken)} | Broken: {len(broken)} | Hashes recorded: {adopted}")
+    for item_id, problems in broken.items():
+        print(f"  {item_id}: {'; '.join(problems)}")
+
+    orphans = find_orphans(IMAGES_DIR, manifest)
+    if orphans:
+        action = "Deleted" if args.clean else "Orphans (no manifest entry; delete with --clean)"
+        print(f"\n{action}: {len(orphans)} files")
+        for path in orphans:
+            print(f"  {path.name}")
+            if args.clean:
+                path.unlink()
+    return broken, changed
+
+
+def repair(manifest, broken, args):
+    """Rebuild broken items that still have their stored original, offline. Returns how many were fixed."""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    todo = [(item_id, manifest["items"][item_id]["original"]) for item_id in broken
+            if manifest["items"][item_id].get("original")
+            and original_path(ORIGINALS_DIR, manifest["items"][item_id]["original"]).exists()]
+    if not todo:
+        return 0
+    fixed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(rebuild_derivatives, item_id, digest, str(IMAGES_DIR), str(ORIGINALS_DIR),
+                               args.widths, args.formats): item_id for item_id, digest in todo}
+        for future in as_completed(futures):
+            item_id = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"  Error rebuilding {item_id}: {e}")
+                continue
+            entry = {**manifest["items"][item_id], **result}
+            entry.pop("broken", None)
+            record_item(manifest, item_id, entry)
+            fixed += 1
+            print(f"  {item_id}: rebuilt from its original")
+    return fixed
+
+
+# ─── Size Report ───
+
+def print_size_report(manifest):
+    count, rows = size_report(manifest)
+    if not count:
+        print("No items have ladder variants yet. Run: python3 generate-photos.py reprocess")
+        return
+
+    print(f"Compared over {count} items with both layouts:\n")
+    print(f"  {'':<26}{'legacy':>12}{'ladder':>12}{'saved':>10}")
+    for label, legacy, ladder in rows:
+        saved = (1 - ladder / legacy) * 100 if legacy else 0
+        print(f"  {label:<26}{legacy / 1024:>10.0f}KB{ladder / 1024:>10.0f}KB{saved:>9.0f}%")
+    print("\nOn-disk ladder bytes are in addition to the legacy pair, which is still written.")
+
+
+# ─── Main ───
+
+def rebuild_bundle(items, page_size=PAGE_SIZE, force=False):
+    written, unchanged, bundled = write_thumb_bundle(IMAGES_DIR, [item["id"] for item in items], page_size, force)
+    print(f"Thumbnail bundle: {bundled} thumbnails, {written} pages written, {unchanged} unchanged")
+
+
+def set_output_dir(out):
+    """Point every output path (images, manifest, journal, ladder index, originals, caches, profiles) under `out`.
+
+    The verify cache only keeps the files of its last scan, so a tree
+    sharing it with shared/images would keep discarding the other's.
+    """
+    global IMAGES_DIR, MANIFEST_FILE, JOURNAL_FILE, LADDER_MODULE, ORIGINALS_DIR, PROFILE_DIR, VERIFY_CACHE
+    IMAGES_DIR = Path(out)
+    MANIFEST_FILE = IMAGES_DIR / "manifest.json"
+    JOURNAL_FILE = IMAGES_DIR / "manifest.journal.jsonl"
+    LADDER_MODULE = IMAGES_DIR / "ladder.js"
+    ORIGINALS_DIR = IMAGES_DIR / ".originals"
+    PROFILE_DIR = IMAGES_DIR / ".profiles"
+    VERIFY_CACHE = IMAGES_DIR / ".verify-cache.json"
+
+
+def make_backend(args):
+    if args.backend == "mock":
+        return MockBackend(seed=args.mock_seed, latency=args.mock_latency, rate_429=args.mock_429,
+                           rate_5xx=args.mock_5xx, retry_after=args.mock_retry_after)
+    return OpenAIBackend()
+
+
+def start_profile(args):
+    if not (args.profile or args.cprofile):
+        return None
+    return RunProfile(cprofile_path=args.cprofile)
+
+
+def finish_profile(profile, args, command):
+    """Stop timing, print the per-stage summary and write the JSON report."""
+    if profile is None:
+        return
+    profile.finish()
+    profile.print_summary()
+    out = Path(args.profile_out) if args.profile_out else PROFILE_DIR / f"{command}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+    profile.write_report(out, command=command, concurrency=getattr(args, "concurrency", None),
+                         encodeWorkers=getattr(args, "encode_workers", None),
+                         widths=list(args.widths), formats=list(args.formats))
+    print(f"  Report: {out}")
+    if args.cprofile:
+        print(f"  cProfile: {args.cprofile} (python3 -m pstats {args.cprofile})")
+
+
+def add_ladder_args(parser):
+    parser.add_argument("--widths", default=",".join(map(str, LADDER_WIDTHS)),
+                        help="Responsive ladder widths in px (default: %(default)s)")
+    parser.add_argument("--formats",
+                        help=f"Ladder formats, preferred first (default: {','.join(LADDER_FORMATS)}, "
+                             f"less any this Pillow build can't encode)")
+
+
+def parse_ladder_args(parser, args, probe=True):
+    """Turn --widths/--formats strings into tuples of formats Pillow can encode.
+
+    Formats given with --formats must all be encodable. Default formats
+    that aren't (AVIF on Pillow < 11.3 without pillow-avif-plugin) are
+    dropped with a warning, leaving the WebP fallback. Runs that encode
+    nothing pass probe=False and don't load Pillow at all.
+    """
+    try:
+        args.widths = tuple(sorted({int(w) for w in args.widths.split(",") if w.strip()}))
+    except ValueError:
+        parser.error("--widths must be comma-separated integers")
+    explicit = args.formats is not None
+    formats = args.formats if explicit else ",".join(LADDER_FORMATS)
+    args.formats = tuple(f.strip().lower() for f in formats.split(",") if f.strip())
+    unsupported = [f for f in args.formats if f not in available_formats()] if probe else []
+    if unsupported and explicit:
+        parser.error(f"unsupported --formats {','.join(unsupported)}; this Pillow build supports: "
+                     f"{','.join(available_formats())} (AVIF needs Pillow 11.3+ or pillow-avif-plugin)")
+    if unsupported:
+        args.formats = tuple(f for f in args.formats if f not in unsupported)
+        print(f"Warning: this Pillow build can't encode {','.join(unsupported)} (needs Pillow 11.3+ or "
+              f"pillow-avif-plugin); writing {','.join(args.formats) or 'no'} ladder variants only", file=sys.stderr)
+    if not args.widths or not args.formats:
+        parser.error("--widths and --formats must not be empty")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate DALL-E 3 photos for inventory items")
+    parser.add_argument("--dry-run", action="store_true", help="Print prompts without calling API")
+    parser.add_argument("--sample", type=int, default=0, help="Generate N items stratified by room × category × subcategory")
+    parser.add_argument("--seed", type=int, help="Random seed for --sample, for a reproducible selection")
+    parser.add_argument("--allocation", choices=("equal", "proportional"), default="equal",
+                        help="--sample quotas: equal per group, or proportional to group size (default: equal)")
+    parser.add_argument("--stale", action="store_true", help="Regenerate items whose current prompt differs from the one recorded")
+    parser.add_argument("--duplicates", action="store_true", help="Regenerate items flagged as near-duplicates of another photo (bypasses the prompt cache)")
+    parser.add_argument("--radius", type=int, default=DUPLICATE_RADIUS,
+                        help=f"Max differing phash bits (of 64) for a near-duplicate (default: {DUPLICATE_RADIUS})")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the API, even for prompts already in the manifest")
+    parser.add_argument("--include-generated", action="store_true", help="Don't skip items already in the manifest (e.g. QA --dry-run samples)")
+    parser.add_argument("--room", help="Filter by room (e.g., kitchen)")
+    parser.add_argument("--category", help="Filter by category (e.g., clothing)")
+    parser.add_argument("--subcategory", help="Filter by subcategory (e.g., cookware)")
+    parser.add_argument("--usage", help="Filter by usage frequency (e.g., daily)")
+    parser.add_argument("--ids", help="Comma-separated item IDs (e.g., obj-001,obj-005)")
+    parser.add_argument("--priority", default="balanced",
+                        help=f"Order work by a policy ({', '.join(POLICIES)}) or weights like usage=3,missing=5 "
+                             f"(default: %(default)s)")
+    parser.add_argument("--budget", help="Stop after this much work: '$N' of API calls, or N images (highest priority first)")
+    parser.add_argument("--concurrency", type=int, default=1, help="Number of images to generate in parallel (default: 1)")
+    parser.add_argument("--rpm", type=float, default=40, help="Max API requests per minute across all workers (default: 40)")
+    parser.add_argument("--encode-workers", type=int, default=os.cpu_count() or 1, help="Processes for resizing/encoding (default: CPU count)")
+    parser.add_argument("--max-attempts", type=int, default=6, help="Give up on an item after this many rate-limited attempts (default: 6)")
+    parser.add_argument("--profile", action="store_true", help="Time every pipeline stage per item; print p50/p95/p99 and write a JSON report")
+    parser.add_argument("--profile-out", help=f"Path for the --profile JSON report (default: {PROFILE_DIR.relative_to(SCRIPT_DIR)}/<command>-<time>.json)")
+    parser.add_argument("--cprofile", metavar="PATH", help="Also dump merged cProfile stats (main, fetch threads and encode workers) to PATH; implies --profile")
+    parser.add_argument("--out", metavar="DIR", help="Write images, manifest, originals, caches and profiles under DIR instead of shared/images")
+    parser.add_argument("--backend", choices=BACKENDS, default="openai", help="Image backend (default: %(default)s; mock needs --out)")
+    mock = parser.add_argument_group("mock backend")
+    mock.add_argument("--mock-latency", default="lognormal:0.5,0.4",
+                      help="Per-call latency in seconds: none, fixed:S, uniform:LOW,HIGH or lognormal:MEDIAN,SIGMA (default: %(default)s)")
+    mock.add_argument("--mock-429", type=float, default=0.0, help="Fraction of calls answered with 429 (default: 0)")
+    mock.add_argument("--mock-5xx", type=float, default=0.0, help="Fraction of calls answered with 500 (default: 0)")
+    mock.add_argument("--mock-retry-after", type=float, help="Retry-After seconds sent with injected 429s (default: none)")
+    mock.add_argument("--mock-seed", type=int, default=0, help="Seed for images, latencies and injected errors (default: 0)")
+    add_ladder_args(parser)
+
+    commands = parser.add_subparsers(dest="command")
+    reprocess_parser = commands.add_parser("reprocess", help="Rebuild derivatives from stored originals (no API calls)")
+    reprocess_parser.add_argument("--ids", help="Only these comma-separated item IDs")
+    reprocess_parser.add_argument("--force", action="store_true", help="Rebuild even if outputs are up to date")
+    reprocess_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Encoding processes (default: CPU count)")
+    add_ladder_args(reprocess_parser)
+    commands.add_parser("report", help="Compare ladder sizes with the legacy two-variant layout")
+    commands.add_parser("compact", help="Fold the manifest journal into manifest.json")
+    bundle_parser = commands.add_parser("bundle", help="Pack thumbnails into binary pages with an offset index")
+    bundle_parser.add_argument("--page-size", type=int, default=PAGE_SIZE, help=f"Thumbnails per page (default: {PAGE_SIZE})")
+    bundle_parser.add_argument("--force", action="store_true", help="Rewrite every page, even unchanged ones")
+    dupes_parser = commands.add_parser("dupes", help="Perceptual-hash every image and flag near-duplicates for regeneration")
+    dupes_parser.add_argument("--radius", type=int, default=DUPLICATE_RADIUS,
+                              help=f"Max differing phash bits (of 64) for a near-duplicate (default: {DUPLICATE_RADIUS})")
+    dupes_parser.add_argument("--rehash", action="store_true", help="Recompute hashes that are already in the manifest")
+    dupes_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Hashing processes (default: CPU count)")
+    verify_parser = commands.add_parser("verify", help="Check every image against the manifest; flag broken items for regeneration")
+    verify_parser.add_argument("--repair", action="store_true", help="Rebuild broken items that have a stored original (no API calls)")
+    verify_parser.add_argument("--clean", action="store_true", help="Delete image files that no manifest entry accounts for")
+    verify_parser.add_argument("--workers", type=int, default=2 * (os.cpu_count() or 1),
+                               help="Threads hashing/decoding files (default: 2x CPU count)")
+    add_ladder_args(verify_parser)
+
+    args = parser.parse_args()
+
+    if args.backend == "mock":
+        # Synthetic images must never overwrite the real ones in shared/images
+        if not args.out:
+            parser.error("--backend mock needs --out DIR")
+        try:
+            parse_latency(args.mock_latency)
+        except ValueError as e:
+            parser.error(str(e))
+        if not 0 <= args.mock_429 + args.mock_5xx <= 1:
+            parser.error("--mock-429 and --mock-5xx must be fractions summing to at most 1")
+    if args.out:
+        set_output_dir(args.out)
+
+    if args.command == "report":
+        print_size_report(load_manifest())
+        return
+
+    if args.command == "compact":
+        manifest = load_manifest()
+        save_manifest(manifest)
+        print(f"Compacted {manifest['count']} items into {MANIFEST_FILE}")
+        return
+
+    if args.command == "dupes":
+        manifest = load_manifest()
+        flagged = scan_duplicates(manifest, args)
+        save_manifest(manifest)
+        print(f"\nFlagged: {flagged} near-duplicates (regenerate with: python3 generate-photos.py --duplicates)")
+        return
+
+    if args.command == "bundle":
+        if args.page_size < 1:
+            parser.error("--page-size must be at least 1")
+        rebuild_bundle(load_items(quiet=True), args.page_size, args.force)
+        return
+
+    # Dry runs and verify without --repair encode nothing
+    parse_ladder_args(parser, args, probe=not args.dry_run and (args.command != "verify" or args.repair))
+
+    if args.command == "verify":
+        manifest = load_manifest()
+        broken, changed = verify(manifest, args)
+        fixed = 0
+        try:
+            fixed = repair(manifest, broken, args) if args.repair and broken else 0
+        finally:
+            # An intact tree leaves manifest.json (and its "generated" stamp) untouched
+            if changed or fixed:
+                save_manifest(manifest)
+        remaining = len(broken) - fixed
+        print(f"\n=== Done ===")
+        print(f"Broken: {len(broken)} | Repaired: {fixed} | Still broken: {remaining}")
+        if fixed:
+            write_ladder_module(LADDER_MODULE, manifest, args.formats)
+            rebuild_bundle(load_items(quiet=True))
+        if remaining:
+            hint = "" if args.repair else " (or --repair those with a stored original)"
+            print(f"Regenerate them with: python3 generate-photos.py{hint}")
+        return
+
+    if args.command == "reprocess":
+        print("=== Dailydays Photo Reprocess ===\n")
+        manifest = load_manifest()
+        profile = start_profile(args)
+        try:
+            success, failed = reprocess(manifest, args, profile)
+        finally:
+            try:
+                with profile.time_run("manifest_save") if profile else nullcontext():
+                    save_manifest(manifest)
+            finally:
+                finish_profile(profile, args, "reprocess")
+        listed = write_ladder_module(LADDER_MODULE, manifest, args.formats)
+        print(f"\n=== Done ===")
+        print(f"Rebuilt: {success} | Failed: {failed}")
+        print(f"Ladder index: {listed} items in {LADDER_MODULE}")
+        if success > 0:
+            rebuild_bundle(load_items(quiet=True))
+        return
+
+    try:
+        parse_policy(args.priority)
+    except ValueError as e:
+        parser.error(f"--priority: {e}")
+    if args.budget:
+        try:
+            parse_budget(args.budget)
+        except ValueError:
+            parser.error("--budget must be '$N' (dollars) or a whole number of images")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.rpm <= 0:
+        parser.error("--rpm must be positive")
+    if args.encode_workers < 1:
+        parser.error("--encode-workers must be at least 1")
+    if args.max_attempts < 1:
+        parser.error("--max-attempts must be at least 1")
+
+    print("=== Dailydays Photo Generator ===\n")
+
+    items = load_items()
+    manifest = load_manifest()
+
+    IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+
+    to_generate = filter_items(items, args, manifest)
+
+    if not to_generate:
+        print("No items to generate. All done!")
+        return
+
+    # A flagged photo's own prompt is in the cache; reusing it would bring back the same image
+    jobs, unchanged = plan_jobs(to_generate, manifest, use_cache=not (args.no_cache or args.duplicates),
+                                regenerate=bool(args.ids or args.include_generated))
+    if unchanged:
+        print(f"Unchanged: {len(unchanged)} items already match their prompt (--no-cache to regenerate)")
+    if not jobs:
+        print("No items to generate. All done!")
+        return
+
+    jobs, deferred, scores = prioritize(jobs, manifest, args)
+    if scores:
+        top = [item for job in jobs[:5] for item in job["items"][:1]]
+        print(f"Priority: {args.priority} | First: " +
+              ", ".join(f"{item['id']} {item['name']} ({scores[item['id']]:.2f})" for item in top))
+    if deferred:
+        print(f"Budget {args.budget}: deferring {sum(len(job['items']) for job in deferred)} lower-priority images "
+              f"to a later run")
+    if not jobs:
+        print("Budget allows no images. Nothing to do.")
+        return
+    api_calls = sum(1 for job in jobs if job["source"] is None)
+    from_cache = sum(len(job["items"]) for job in jobs if job["source"] is not None)
+    images = sum(len(job["items"]) for job in jobs)
+
+    print(f"\nWill generate {images} images: {api_calls} API calls, {from_cache} from cache, "
+          f"{images - api_calls - from_cache} deduplicated.")
+
+    if args.dry_run:
+        for job in jobs:
+            for item in job["items"]:
+                print_dry_run(item, job["prompt"], scores.get(item["id"]))
+        print(f"\n=== Done ===")
+        print(f"Generated: {images} | Failed: 0")
+        return
+
+    if args.backend == "openai":
+        api_key = os.environ.get("OPENAI_API_KEY")
+        if not api_key:
+            print("\nError: OPENAI_API_KEY environment variable is required.")
+            print("Set it with: export OPENAI_API_KEY=sk-...")
+            sys.exit(1)
+        estimated_cost = api_calls * COST_PER_IMAGE
+        print(f"Estimated cost: ~${estimated_cost:.2f}")
+    else:
+        print(f"Mock backend: latency {args.mock_latency} | 429s: {args.mock_429:g} | 5xx: {args.mock_5xx:g} | "
+              f"seed {args.mock_seed}")
+    print(f"Concurrency: {args.concurrency} | Encoders: {args.encode_workers} | Rate limit: {args.rpm:g} requests/min")
+    if args.backend == "openai":
+        print("Starting in 3 seconds... (Ctrl+C to cancel)\n")
+        time.sleep(3)
+
+    backend = make_backend(args)
+    backoff = Backoff(max_attempts=args.max_attempts)
+    profile = start_profile(args)
+    try:
+        success, failed = run_generation(jobs, manifest, args, backend, backoff, profile)
+    finally:
+        # Also on Ctrl+C, once the calls already in flight return (queued ones are cancelled);
+        # after a hard crash the journal is replayed on the next start.
+        try:
+            with profile.time_run("manifest_save") if profile else nullcontext():
+                save_manifest(manifest)
+        finally:
+            # Merges the cProfile stats and removes their temp dir; a partial profile is still reported
+            finish_profile(profile, args, "generate")
+
+    print(f"\n=== Done ===")
+    print(f"Generated: {success} | Failed: {failed}")
+    print(backoff.summary())
+    if args.backend == "mock":
+        print(backend.summary())
+    lookalikes = sum(1 for job in jobs for item in job["items"]
+                     if manifest["items"].get(item["id"], {}).get("nearDuplicateOf"))
+    if lookalikes:
+        print(f"Near-duplicates: {lookalikes} new photos look like existing ones (regenerate with --duplicates)")
+
+    if success > 0:
+        write_ladder_module(LADDER_MODULE, manifest, args.formats)
+        rebuild_bundle(items)
+        print(f"Images saved to: {IMAGES_DIR}")
+        print(f"Manifest updated: {MANIFEST_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,338 @@
+"""
+imaging.py — Decode, resize and encode generated photos.
+
+These functions run inside a ProcessPoolExecutor so CPU-bound resampling
+overlaps with the network-bound API calls. Everything here must stay
+top-level and picklable: arguments and return values cross a process
+boundary.
+
+The 1024px originals returned by the API are kept in a content-addressed
+store (originals/<aa>/<sha256>.png) so derivatives can be rebuilt offline
+whenever DERIVATIVES or the ladder changes. The fetch threads stream each
+base64 payload straight into that store, and the encode workers decode
+from the stored file, so no image crosses the process boundary.
+
+Besides the legacy pair ({id}.webp, {id}-thumb.webp) every item gets a
+responsive ladder, {id}-{width}w.{ext}, for each width and format the run
+was configured with. shared/js/images.js turns that into srcset/<picture>.
+"""
+
+import binascii
+import functools
+import hashlib
+import json
+import os
+import threading
+from io import BytesIO
+from pathlib import Path
+
+from integrity import content_hash
+from phash import phash
+from profiling import NULL_TIMER, StageTimer
+
+# Legacy pair: (filename suffix, edge length in px, WebP quality)
+DERIVATIVES = (
+    ("", 512, 85),
+    ("-thumb", 128, 80),
+)
+
+# Responsive ladder defaults; overridable with --widths / --formats
+LADDER_WIDTHS = (64, 128, 256, 512, 1024)
+LADDER_FORMATS = ("avif", "webp")
+
+# format name → (PIL format, quality)
+FORMATS = {
+    "avif": ("AVIF", 50),
+    "webp": ("WEBP", 80),
+}
+
+# Legacy-layout choice for a given pixel width, used by the size report
+LEGACY_THUMB_MAX = 128
+
+
+@functools.cache
+def pil():
+    """Import Pillow on first use, so runs that never touch pixels (--dry-run, report) start without it."""
+    from PIL import Image, features
+    try:
+        import pillow_avif  # noqa: F401 — registers AVIF on Pillow < 11.3
+    except ImportError:
+        pass
+    return Image, features
+
+
+def available_formats():
+    """Ladder formats this Pillow build can encode."""
+    _, features = pil()
+    return [name for name in FORMATS if features.check(name)]
+
+
+def ladder_path(images_dir, item_id, width, fmt):
+    return Path(images_dir) / f"{item_id}-{width}w.{fmt}"
+
+
+# ─── Originals Store ───
+
+def original_path(originals_dir, digest):
+    return Path(originals_dir) / digest[:2] / f"{digest}.png"
+
+
+# base64 characters decoded per step; a multiple of 4 so every chunk is whole groups
+B64_CHUNK = 1 << 20
+
+
+def store_original(b64_payload, originals_dir, timer=NULL_TIMER):
+    """Decode a base64 PNG from the API into the content-addressed store. Returns the sha256 hex digest.
+
+    The payload is decoded a chunk at a time into a temp file while being
+    hashed, so the decoded PNG never exists in memory as a whole: beyond the
+    payload string only one chunk (≤768KB) is held. The API sends the
+    payload without line breaks, which keeps chunk boundaries on groups.
+    """
+    originals_dir = Path(originals_dir)
+    originals_dir.mkdir(parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    # Fetch threads store concurrently, so the temp name is per thread
+    tmp = originals_dir / f".{os.getpid()}-{threading.get_ident()}.tmp"
+    try:
+        with tmp.open("wb") as f:
+            for start in range(0, len(b64_payload), B64_CHUNK):
+                with timer("b64decode"):
+                    chunk = binascii.a2b_base64(b64_payload[start:start + B64_CHUNK])
+                with timer("store_original"):
+                    digest.update(chunk)
+                    f.write(chunk)
+                size += len(chunk)
+        with timer("store_original"):
+            path = original_path(originals_dir, digest.hexdigest())
+            if path.exists():
+                tmp.unlink()
+            else:
+                path.parent.mkdir(exist_ok=True)
+                os.replace(tmp, path)
+                timer.wrote(size)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return digest.hexdigest()
+
+
+def legacy_source(images_dir, item_id):
+    """The 512px legacy WebP, used as the ladder source for items generated before originals were kept."""
+    return Path(images_dir) / f"{item_id}.webp"
+
+
+def file_digest(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def encode_key(digest, widths=LADDER_WIDTHS, formats=LADDER_FORMATS):
+    """Hash of the source image plus the encode parameters; changes when either does."""
+    params = json.dumps([digest, DERIVATIVES, list(widths), [[f, FORMATS[f]] for f in formats]])
+    return hashlib.sha256(params.encode()).hexdigest()[:16]
+
+
+# ─── Derivatives ───
+#
+# Each function takes `profile`; when set, the result carries a "profile"
+# entry (StageTimer.export()) that the caller strips before the result
+# reaches the manifest.
+
+def _save(img, path, pil_format, quality, timer):
+    """Encode in memory, then write, so encoding and disk time are measured apart. Returns the encoded data."""
+    with timer("encode"):
+        buffer = BytesIO()
+        img.save(buffer, pil_format, quality=quality)
+        data = buffer.getbuffer()
+    with timer("write"):
+        Path(path).write_bytes(data)
+    timer.wrote(len(data))
+    return data
+
+
+def _resize(img, edge, timer):
+    with timer("resize"):
+        return img.resize((edge, edge), pil()[0].LANCZOS)
+
+
+def _write_legacy(item_id, img, images_dir, timer=NULL_TIMER):
+    images_dir = Path(images_dir)
+    written = []
+    for suffix, edge, quality in DERIVATIVES:
+        path = images_dir / f"{item_id}{suffix}.webp"
+        written.append(_save(_resize(img, edge, timer), path, "WEBP", quality, timer))
+    full, thumb = written
+    return {"fullSize": len(full), "thumbSize": len(thumb),
+            "fullHash": content_hash(full), "thumbHash": content_hash(thumb)}
+
+
+def _write_ladder(item_id, img, images_dir, widths, formats, timer=NULL_TIMER):
+    """Write every width ≤ the source's own width in every format. Returns {fmt: {width: bytes}}."""
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGB")
+    variants = {fmt: {} for fmt in formats}
+    for width in sorted(widths):
+        if width > img.width:
+            continue
+        resized = img if width == img.width else _resize(img, width, timer)
+        for fmt in formats:
+            pil_format, quality = FORMATS[fmt]
+            path = ladder_path(images_dir, item_id, width, fmt)
+            variants[fmt][str(width)] = len(_save(resized, path, pil_format, quality, timer))
+    return variants
+
+
+def rebuild_derivatives(item_id, digest, images_dir, originals_dir,
+                        widths=LADDER_WIDTHS, formats=LADDER_FORMATS, profile=False):
+    """Encode an item's derivatives from its stored original. No network access.
+
+    Used both for freshly fetched images and to rebuild offline. With a
+    stored original (`digest`) everything is built from it. Without one,
+    the ladder is built from the legacy 512px WebP, which is left as is.
+    """
+    Image, _ = pil()
+    timer = StageTimer(enabled=profile)
+    if digest:
+        with Image.open(original_path(originals_dir, digest)) as img:
+            with timer("png_decode"):
+                img.load()
+            with timer("phash"):
+                fingerprint = phash(img)
+            result = _write_legacy(item_id, img, images_dir, timer)
+            result["variants"] = _write_ladder(item_id, img, images_dir, widths, formats, timer)
+        result["encodeKey"] = encode_key(digest, widths, formats)
+        result["phash"] = fingerprint
+    else:
+        source = legacy_source(images_dir, item_id)
+        with Image.open(source) as img:
+            with timer("png_decode"):
+                img.load()
+            with timer("phash"):
+                fingerprint = phash(img)
+            variants = _write_ladder(item_id, img, images_dir, widths, formats, timer)
+        result = {"variants": variants, "encodeKey": encode_key(file_digest(source), widths, formats),
+                  "phash": fingerprint}
+    if profile:
+        result["profile"] = timer.export()
+    return result
+
+
+def copy_derivatives(src_id, dst_id, images_dir, entry, profile=False):
+    """Reuse another item's already-encoded files for `dst_id` (identical prompt, no original kept).
+
+    Returns the manifest fields copied from the source `entry`.
+    """
+    import shutil
+    images_dir = Path(images_dir)
+    timer = StageTimer(enabled=profile)
+    pairs = [(images_dir / f"{src_id}{suffix}.webp", images_dir / f"{dst_id}{suffix}.webp")
+             for suffix, _, _ in DERIVATIVES]
+    pairs += [(ladder_path(images_dir, src_id, int(width), fmt), ladder_path(images_dir, dst_id, int(width), fmt))
+              for fmt, sizes in (entry.get("variants") or {}).items() for width in sizes]
+    with timer("copy"):
+        for src, dst in pairs:
+            shutil.copyfile(src, dst)
+            timer.wrote(dst.stat().st_size)
+    fields = ("fullSize", "thumbSize", "fullHash", "thumbHash", "variants", "encodeKey", "phash")
+    result = {field: entry[field] for field in fields if field in entry}
+    if profile:
+        result["profile"] = timer.export()
+    return result
+
+
+def is_up_to_date(item_id, entry, images_dir, widths=LADDER_WIDTHS, formats=LADDER_FORMATS):
+    """True if the entry's derivatives exist and were built from its source with the current parameters."""
+    digest = entry.get("original")
+    if not digest:
+        source = legacy_source(images_dir, item_id)
+        if not source.exists():
+            return False
+        digest = file_digest(source)
+    if entry.get("encodeKey") != encode_key(digest, widths, formats):
+        return False
+
+    images_dir = Path(images_dir)
+    legacy = [images_dir / f"{item_id}{suffix}.webp" for suffix, _, _ in DERIVATIVES]
+    ladder = [ladder_path(images_dir, item_id, int(width), fmt)
+              for fmt, sizes in entry.get("variants", {}).items() for width in sizes]
+    return all(path.exists() for path in legacy + ladder)
+
+
+# ─── Responsive Index & Report ───
+
+def ladder_index(manifest, formats):
+    """Map item id → widths available in every one of `formats`, for shared/images/ladder.js."""
+    index = {}
+    for item_id, entry in sorted(manifest["items"].items()):
+        variants = entry.get("variants") or {}
+        if not all(variants.get(fmt) for fmt in formats):
+            continue
+        common = set.intersection(*(set(variants[fmt]) for fmt in formats))
+        if common:
+            index[item_id] = sorted(int(w) for w in common)
+    return index
+
+
+def image_version(entry):
+    """Short hash over an entry's encoded files; changes whenever any of them is rewritten. None if unhashed."""
+    if not entry.get("fullHash"):
+        return None
+    fields = [entry.get(key) for key in ("fullHash", "thumbHash", "encodeKey", "variants")]
+    return content_hash(json.dumps(fields, sort_keys=True).encode())[:10]
+
+
+def write_ladder_module(path, manifest, formats):
+    """Write the ES module images.js imports to know which ladder files exist and their versions."""
+    index = ladder_index(manifest, formats)
+    versions = {item_id: image_version(entry) for item_id, entry in sorted(manifest["items"].items())}
+    lines = [
+        "// ladder.js — Generated by scripts/generate-photos.py; do not edit.",
+        "// Responsive variants on disk: {id}-{width}w.{format} for every listed width.",
+        "// IMAGE_VERSIONS go on every image URL as ?v=, so the server can let browsers cache them",
+        "// for long: files are rewritten in place when an item is regenerated.",
+        "",
+        f"export const LADDER_FORMATS = {json.dumps(list(formats))};",
+        "",
+        "export const LADDER_WIDTHS = {",
+    ]
+    lines += [f'  "{item_id}": {json.dumps(widths)},' for item_id, widths in index.items()]
+    lines += ["};", "", "export const IMAGE_VERSIONS = {"]
+    lines += [f'  "{item_id}": "{version}",' for item_id, version in versions.items() if version]
+    lines += ["};", ""]
+    Path(path).write_text("\n".join(lines), encoding="utf-8")
+    return len(index)
+
+
+def pick_variant(sizes, pixels):
+    """Bytes the browser downloads for a `pixels`-wide slot: smallest width ≥ pixels, else the largest."""
+    widths = sorted(int(w) for w in sizes)
+    chosen = next((w for w in widths if w >= pixels), widths[-1])
+    return sizes[str(chosen)]
+
+
+def size_report(manifest, slots=(48, 128, 300, 512), densities=(1, 2)):
+    """Compare the ladder with the legacy two-variant layout, over items that have both.
+
+    Returns rows of (label, legacy bytes, ladder bytes). The first row is
+    total bytes on disk; the rest are bytes a browser downloads per item for
+    a display slot of N CSS px at each device pixel ratio.
+    """
+    entries = [e for e in manifest["items"].values()
+               if e.get("variants") and e.get("fullSize") and e.get("thumbSize")]
+    rows = []
+
+    legacy_disk = sum(e["fullSize"] + e["thumbSize"] for e in entries)
+    ladder_disk = sum(sum(sizes.values()) for e in entries for sizes in e["variants"].values())
+    rows.append(("on disk (ladder only)", legacy_disk, ladder_disk))
+
+    for slot in slots:
+        for dpr in densities:
+            pixels = slot * dpr
+            legacy = sum(e["thumbSize"] if pixels <= LEGACY_THUMB_MAX else e["fullSize"] for e in entries)
+            # Browser takes the first <source> it supports; report the best format present.
+            ladder = sum(min(pick_variant(sizes, pixels) for sizes in e["variants"].values() if sizes)
+                         for e in entries)
+            rows.append((f"{slot}px slot @{dpr}x", legacy, ladder))
+
+    return len(entries), rows
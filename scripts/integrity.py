@@ -0,0 +1,141 @@
+"""
+integrity.py — Check that the images on disk are the ones the manifest recorded.
+
+For every manifest entry, the legacy pair ({id}.webp, {id}-thumb.webp)
+must exist, match the fullSize/thumbSize and fullHash/thumbHash recorded
+when it was written, and fully decode. Ladder files must exist at their
+recorded sizes. Files named like an item's image that no entry accounts
+for are orphans.
+
+Hashing and decoding are cached per file by (mtime, size) in
+scripts/.cache/verify-cache.json, so a repeat scan only reads files that
+changed since the last one.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+# {id}.webp, {id}-thumb.webp, {id}-{width}w.{ext}, for item ids as catalog.expand_items assigns them
+IMAGE_NAME = re.compile(r"^(?P<id>obj-\d+)(?:-thumb|-\d+w)?\.(?:webp|avif)$")
+
+
+def content_hash(data):
+    """Short content hash stored as fullHash/thumbHash."""
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def check_file(path):
+    """Read, hash and fully decode one file. Returns its cache record, or None if it is missing."""
+    from PIL import Image
+    try:
+        stat = os.stat(path)
+        data = Path(path).read_bytes()
+    except FileNotFoundError:
+        return None
+    record = {"mtime": stat.st_mtime_ns, "size": len(data), "hash": content_hash(data), "error": None}
+    try:
+        with Image.open(path) as img:
+            img.load()
+    except Exception as e:
+        record["error"] = f"does not decode ({e})"
+    return record
+
+
+class VerifyCache:
+    """check_file results keyed by path, valid while the file's mtime and size are unchanged."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        try:
+            self.records = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.records = {}
+        self.hits = 0
+
+    def lookup(self, path):
+        record = self.records.get(str(path))
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None, True
+        if record and record["mtime"] == stat.st_mtime_ns and record["size"] == stat.st_size:
+            return record, True
+        return None, False
+
+    def save(self, seen):
+        """Keep only the files seen in this scan, so deleted ones drop out."""
+        records = {path: record for path, record in self.records.items() if path in seen}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(records, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def scan_files(paths, cache, workers):
+    """check_file every path, from the cache where it is current. Returns {path str: record or None}."""
+    from concurrent.futures import ThreadPoolExecutor
+    results = {}
+    todo = []
+    for path in paths:
+        record, known = cache.lookup(path)
+        if known:
+            cache.hits += record is not None
+            results[str(path)] = record
+        else:
+            todo.append(path)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for path, record in zip(todo, pool.map(check_file, todo)):
+            results[str(path)] = record
+            if record:
+                cache.records[str(path)] = record
+    return results
+
+
+def legacy_files(item_id, images_dir):
+    """(full path, thumb path) of an item's legacy pair."""
+    images_dir = Path(images_dir)
+    return images_dir / f"{item_id}.webp", images_dir / f"{item_id}-thumb.webp"
+
+
+def ladder_files(item_id, entry, images_dir):
+    """(path, recorded size) for each ladder variant of an entry."""
+    return [(Path(images_dir) / f"{item_id}-{width}w.{fmt}", size)
+            for fmt, sizes in (entry.get("variants") or {}).items() for width, size in sizes.items()]
+
+
+def entry_problems(item_id, entry, images_dir, records):
+    """Everything wrong with an entry's files, given scan_files records. Empty if it is intact."""
+    problems = []
+    for path, size_field, hash_field in zip(legacy_files(item_id, images_dir),
+                                            ("fullSize", "thumbSize"), ("fullHash", "thumbHash")):
+        record = records.get(str(path))
+        if record is None:
+            problems.append(f"{path.name} is missing")
+        elif entry.get(size_field) is not None and record["size"] != entry[size_field]:
+            problems.append(f"{path.name} is {record['size']} bytes, expected {entry[size_field]}")
+        elif entry.get(hash_field) and record["hash"] != entry[hash_field]:
+            problems.append(f"{path.name} content changed")
+        elif record["error"]:
+            problems.append(f"{path.name} {record['error']}")
+    for path, size in ladder_files(item_id, entry, images_dir):
+        try:
+            actual = path.stat().st_size
+        except FileNotFoundError:
+            problems.append(f"{path.name} is missing")
+            continue
+        if actual != size:
+            problems.append(f"{path.name} is {actual} bytes, expected {size}")
+    return problems
+
+
+def find_orphans(images_dir, manifest):
+    """Image files named after an item that no manifest entry accounts for."""
+    expected = set()
+    for item_id, entry in manifest["items"].items():
+        expected.update(path.name for path in legacy_files(item_id, images_dir))
+        expected.update(path.name for path, _ in ladder_files(item_id, entry, images_dir))
+    return sorted(path for path in Path(images_dir).iterdir()
+                  if IMAGE_NAME.match(path.name) and path.name not in expected)
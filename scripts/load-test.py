@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+load-test.py — Compare server.py backends on the gallery's thumbnail load.
+
+Starts each backend on a free port, fetches every shared/images/*-thumb.webp
+`--rounds` times from `--concurrency` client connections, and reports
+requests/second and latency percentiles. Clients reuse a connection while
+the server keeps it open (HTTP/1.1) and reconnect when it closes it
+(HTTP/1.0, as the threaded server speaks), which is the difference being
+measured. Each backend gets one unmeasured warm-up pass first, so ETags are
+already hashed. With --pipeline, each request's latency runs from the send
+of its whole batch.
+
+Usage:
+  python3 load-test.py                          # threaded vs async, 32 connections
+  python3 load-test.py --concurrency 128 --rounds 5
+  python3 load-test.py --pipeline 8             # pipeline up to 8 GETs per keep-alive connection
+  python3 load-test.py --cache-mb 64            # both backends with the hot-file cache
+"""
+
+import argparse
+import asyncio
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).parent
+ROOT_DIR = SCRIPT_DIR.parent
+IMAGES_DIR = ROOT_DIR / "shared" / "images"
+
+BACKENDS = {
+    "threaded": [],
+    "async": ["--async"],
+}
+
+
+# ─── Server Process ───
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(backend, port, cache_mb):
+    cmd = [sys.executable, str(ROOT_DIR / "server.py"), str(port), *BACKENDS[backend]]
+    if cache_mb:
+        cmd += ["--cache-mb", str(cache_mb)]
+    proc = subprocess.Popen(cmd, cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return proc
+        except OSError:
+            time.sleep(0.05)
+    proc.kill()
+    raise RuntimeError(f"{backend} server did not start on port {port}")
+
+
+# ─── Client ───
+
+async def read_response(reader):
+    """Read one response. Returns (status, body length, whether the server keeps the connection)."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError("Connection closed before response")
+    version, status = status_line.split()[:2]
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip().lower()
+
+    connection = headers.get("connection", "")
+    persistent = connection == "keep-alive" if version == b"HTTP/1.0" else connection != "close"
+    if "content-length" in headers:
+        body = await reader.readexactly(int(headers["content-length"]))
+    else:
+        body = await reader.read()
+        persistent = False
+    return int(status), len(body), persistent
+
+
+class Stats:
+    def __init__(self):
+        self.latencies = []
+        self.errors = 0
+        self.connections = 0
+        self.bytes = 0
+
+
+async def client(port, urls, pipeline, stats):
+    """Fetch URLs from the shared iterator until it's exhausted."""
+    reader = writer = None
+    persistent = False
+    while True:
+        batch = [url for _, url in zip(range(pipeline if persistent else 1), urls)]
+        if not batch:
+            break
+        start = time.perf_counter()
+        try:
+            if writer is None:
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                stats.connections += 1
+            writer.write(b"".join(f"GET {url} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode() for url in batch))
+            for _ in batch:
+                status, size, persistent = await read_response(reader)
+                stats.latencies.append(time.perf_counter() - start)
+                stats.bytes += size
+                if status != 200:
+                    stats.errors += 1
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            stats.errors += len(batch)
+            persistent = False
+        if not persistent and writer is not None:
+            writer.close()
+            reader = writer = None
+    if writer is not None:
+        writer.close()
+
+
+async def run_load(port, paths, rounds, concurrency, pipeline):
+    urls = iter([path for _ in range(rounds) for path in paths])
+    stats = Stats()
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, urls, pipeline, stats) for _ in range(concurrency)))
+    return stats, time.perf_counter() - start
+
+
+def percentile(sorted_values, p):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p))]
+
+
+# ─── Main ───
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test server.py backends on thumbnail requests")
+    parser.add_argument("--backends", default="threaded,async", help="Comma-separated (default: threaded,async)")
+    parser.add_argument("--concurrency", type=int, default=32, help="Client connections (default: 32)")
+    parser.add_argument("--rounds", type=int, default=3, help="Passes over every thumbnail (default: 3)")
+    parser.add_argument("--pipeline", type=int, default=1, help="GETs in flight per keep-alive connection (default: 1)")
+    parser.add_argument("--cache-mb", type=float, default=0, help="Run servers with --cache-mb (default: off)")
+    args = parser.parse_args()
+
+    paths = sorted(f"/shared/images/{p.name}" for p in IMAGES_DIR.glob("*-thumb.webp"))
+    if not paths:
+        print(f"No thumbnails in {IMAGES_DIR}")
+        sys.exit(1)
+    backends = [b.strip() for b in args.backends.split(",")]
+    for backend in backends:
+        if backend not in BACKENDS:
+            parser.error(f"Unknown backend: {backend} (choose from {', '.join(BACKENDS)})")
+
+    print(f"{len(paths)} thumbnails × {args.rounds} rounds, {args.concurrency} connections, pipeline {args.pipeline}\n")
+    print(f"  {'backend':<10}{'requests':>9}{'errors':>8}{'conns':>7}{'req/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'MB/s':>8}")
+    for backend in backends:
+        port = free_port()
+        proc = start_server(backend, port, args.cache_mb)
+        try:
+            asyncio.run(run_load(port, paths, 1, args.concurrency, 1))
+            stats, elapsed = asyncio.run(run_load(port, paths, args.rounds, args.concurrency, args.pipeline))
+        finally:
+            proc.terminate()
+            proc.wait()
+
+        latencies = sorted(stats.latencies)
+        if not latencies:
+            print(f"  {backend:<10}  no successful requests")
+            continue
+        print(f"  {backend:<10}{len(latencies):>9}{stats.errors:>8}{stats.connections:>7}"
+              f"{len(latencies) / elapsed:>9.0f}"
+              f"{statistics.median(latencies) * 1000:>9.2f}"
+              f"{percentile(latencies, 0.99) * 1000:>9.2f}"
+              f"{stats.bytes / elapsed / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+phash.py — Perceptual hashes for spotting near-duplicate photos.
+
+phash shrinks an image to 32×32 grey pixels, takes its 2-D DCT and keeps
+the 8×8 lowest frequencies, one bit each: above or below their median.
+The 64 bits describe the coarse structure of the photo, so they survive
+resizing and re-encoding but change with the composition. Over the
+current catalog, a thumbnail hashes within 4 bits of its full image, while
+the closest two different photos are 14 bits apart. (A 64-bit dHash was
+tried first; it put unrelated photos with similar light/dark layouts 4
+bits apart.)
+
+Hashes are stored in the manifest ("phash", 16 hex digits). BKTree indexes
+them by Hamming distance, so a radius query only descends into subtrees
+that can hold a match. DuplicateIndex wraps one for manifest entries and
+ignores items that share an image on purpose (same prompt, or copied from
+another item by the prompt cache).
+"""
+
+import math
+from pathlib import Path
+
+SAMPLE_SIZE = 32
+HASH_SIZE = 8
+# Differing bits (of 64) at or below which two photos count as near-duplicates
+DUPLICATE_RADIUS = 10
+
+# DCT-II basis, only the HASH_SIZE lowest frequencies: _COS[u][x]
+_COS = [[math.cos(math.pi * (2 * x + 1) * u / (2 * SAMPLE_SIZE)) for x in range(SAMPLE_SIZE)]
+        for u in range(HASH_SIZE)]
+
+
+def phash(img):
+    """DCT perceptual hash of a PIL image as a hex string."""
+    from PIL import Image
+    pixels = img.convert("L").resize((SAMPLE_SIZE, SAMPLE_SIZE), Image.LANCZOS).tobytes()
+    rows = [pixels[y * SAMPLE_SIZE:(y + 1) * SAMPLE_SIZE] for y in range(SAMPLE_SIZE)]
+    # Separable 2-D DCT: low frequencies of each row, then down each column of those
+    row_freqs = [[sum(c * p for c, p in zip(basis, row)) for basis in _COS] for row in rows]
+    coeffs = [sum(c * row_freqs[y][u] for y, c in enumerate(basis)) for basis in _COS for u in range(HASH_SIZE)]
+    # The DC term (overall brightness) would skew the median
+    median = sorted(coeffs[1:])[len(coeffs) // 2 - 1]
+    bits = 0
+    for c in coeffs:
+        bits = bits << 1 | (c > median)
+    return f"{bits:0{HASH_SIZE * HASH_SIZE // 4}x}"
+
+
+def hamming(a, b):
+    return (a ^ b).bit_count()
+
+
+def item_phash(item_id, original, images_dir):
+    """Hash an item from its stored original (a path) if it has one, else its legacy 512px WebP."""
+    from PIL import Image
+    source = Path(original) if original else Path(images_dir) / f"{item_id}.webp"
+    with Image.open(source) as img:
+        return phash(img)
+
+
+class BKTree:
+    """Burkhard-Keller tree over integer hashes under Hamming distance."""
+
+    def __init__(self):
+        self.root = None  # [hash, keys, {distance: child node}]
+        self.size = 0
+
+    def add(self, value, key):
+        self.size += 1
+        if self.root is None:
+            self.root = [value, [key], {}]
+            return
+        node = self.root
+        while True:
+            distance = hamming(value, node[0])
+            if distance == 0:
+                node[1].append(key)
+                return
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [value, [key], {}]
+                return
+            node = child
+
+    def query(self, value, radius):
+        """Every (distance, key) within `radius` of `value`, nearest first."""
+        found = []
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            distance = hamming(value, node[0])
+            if distance <= radius:
+                found.extend((distance, key) for key in node[1])
+            # Triangle inequality: matches can only sit under edges within `radius` of `distance`
+            for edge, child in node[2].items():
+                if distance - radius <= edge <= distance + radius:
+                    stack.append(child)
+        return sorted(found)
+
+
+class DuplicateIndex:
+    """Near-duplicate lookups over manifest entries that carry a phash."""
+
+    def __init__(self, radius=DUPLICATE_RADIUS):
+        self.radius = radius
+        self.tree = BKTree()
+        self.entries = {}
+
+    def add(self, item_id, entry):
+        if entry.get("phash"):
+            self.tree.add(int(entry["phash"], 16), item_id)
+            self.entries[item_id] = entry
+
+    def _shares_image(self, item_id, entry, other_id):
+        other = self.entries[other_id]
+        return (other_id == item_id
+                or (entry.get("promptKey") and entry.get("promptKey") == other.get("promptKey"))
+                or entry.get("reusedFrom") == other_id or other.get("reusedFrom") == item_id)
+
+    def check(self, item_id, entry):
+        """The closest indexed item that looks like `entry` without sharing its image: (id, distance) or None."""
+        if not entry.get("phash"):
+            return None
+        for distance, other_id in self.tree.query(int(entry["phash"], 16), self.radius):
+            if not self._shares_image(item_id, entry, other_id):
+                return other_id, distance
+        return None
+
+
+def find_near_duplicates(entries, radius=DUPLICATE_RADIUS):
+    """Flag each entry that looks like an earlier one. Returns {item id: (earlier id, distance)}.
+
+    Entries are visited in generation order, so the first of a look-alike
+    pair is kept and the later one is flagged for regeneration.
+    """
+    index = DuplicateIndex(radius)
+    flagged = {}
+    for item_id, entry in sorted(entries.items(), key=lambda kv: (kv[1].get("generated") or "", kv[0])):
+        hit = index.check(item_id, entry)
+        if hit:
+            flagged[item_id] = hit
+        index.add(item_id, entry)
+    return flagged
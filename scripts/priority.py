@@ -0,0 +1,107 @@
+"""
+priority.py — Order generation work so the most valuable photos come first.
+
+Each item gets a score in [0, 1]: a weighted mean of components that are
+each in [0, 1] themselves:
+
+  usage       usageFrequency, daily (1) … never (0)
+  recency     lastUsed, halving every RECENCY_HALF_LIFE days (never used: 0)
+  attachment  high (1) … none (0)
+  volume      volume_liters on a log scale, relative to the largest item
+  missing     no image yet, or its files failed verify
+  stale       the recorded prompt differs from the current one
+
+A policy is a named weight set from POLICIES or explicit weights such as
+"usage=3,missing=5". Work is submitted in score order, and both pools run
+it first-in first-out, so a run that is interrupted or cut off by --budget
+has covered the highest-scoring items.
+"""
+
+import math
+from datetime import date
+
+USAGE_SCORES = {"daily": 1.0, "weekly": 0.75, "monthly": 0.5, "rarely": 0.25, "never": 0.0}
+ATTACHMENT_SCORES = {"high": 1.0, "medium": 0.67, "low": 0.33, "none": 0.0}
+RECENCY_HALF_LIFE = 180
+
+COMPONENTS = ("usage", "recency", "attachment", "volume", "missing", "stale")
+POLICIES = {
+    # Photos people will see most, and gaps before refreshes
+    "balanced": {"usage": 3, "recency": 2, "attachment": 1, "volume": 1, "missing": 4, "stale": 2},
+    "usage": {"usage": 4, "recency": 3, "missing": 1},
+    "attachment": {"attachment": 4, "usage": 1, "missing": 1},
+    "missing": {"missing": 4, "stale": 2, "usage": 1},
+    # No reordering: catalog order, as before priorities existed
+    "catalog": {},
+}
+
+
+def parse_policy(spec):
+    """A policy name or "component=weight,..." → {component: weight}."""
+    if spec in POLICIES:
+        return POLICIES[spec]
+    weights = {}
+    for part in spec.split(","):
+        name, _, value = part.partition("=")
+        name = name.strip()
+        if name not in COMPONENTS:
+            raise ValueError(f"Unknown priority {name!r}: use one of {', '.join(POLICIES)} "
+                             f"or weights over {', '.join(COMPONENTS)}")
+        try:
+            weights[name] = float(value)
+        except ValueError:
+            raise ValueError(f"Bad weight for {name!r}: {value!r}")
+        if not math.isfinite(weights[name]) or weights[name] < 0:
+            raise ValueError(f"Weight for {name!r} must be a finite, non-negative number")
+    return weights
+
+
+def components(item, missing, stale, max_log_volume, today):
+    days = (today - date.fromisoformat(item["lastUsed"])).days if item["lastUsed"] else None
+    return {
+        "usage": USAGE_SCORES.get(item["usageFrequency"], 0.0),
+        "recency": 0.5 ** (max(days, 0) / RECENCY_HALF_LIFE) if days is not None else 0.0,
+        "attachment": ATTACHMENT_SCORES.get(item["attachment"], 0.0),
+        "volume": math.log1p(item["volume_liters"] or 0) / max_log_volume if max_log_volume else 0.0,
+        "missing": 1.0 if missing else 0.0,
+        "stale": 1.0 if stale else 0.0,
+    }
+
+
+def score_items(items, weights, status, today=None):
+    """Score each item under `weights`. `status(item)` → (missing, stale). Returns {item id: score}."""
+    total = sum(weights.values())
+    if not total:
+        return {item["id"]: 0.0 for item in items}
+    today = today or date.today()
+    max_log_volume = max((math.log1p(item["volume_liters"] or 0) for item in items), default=0)
+    scores = {}
+    for item in items:
+        parts = components(item, *status(item), max_log_volume, today)
+        scores[item["id"]] = sum(weight * parts[name] for name, weight in weights.items()) / total
+    return scores
+
+
+def order_jobs(jobs, scores):
+    """Sort jobs by their best item's score, highest first. Stable, so ties keep catalog order."""
+    return sorted(jobs, key=lambda job: -max(scores[item["id"]] for item in job["items"]))
+
+
+def apply_budget(jobs, max_calls=None, max_images=None):
+    """Keep jobs in order until the API-call or image budget runs out. Returns (kept, dropped).
+
+    Jobs reusing a cached result cost no API call, so under a call budget
+    they are kept even after it is spent.
+    """
+    kept, dropped = [], []
+    calls = images = 0
+    for job in jobs:
+        cost = 1 if job["source"] is None else 0
+        if (max_calls is not None and calls + cost > max_calls) or \
+                (max_images is not None and images + len(job["items"]) > max_images):
+            dropped.append(job)
+            continue
+        kept.append(job)
+        calls += cost
+        images += len(job["items"])
+    return kept, dropped
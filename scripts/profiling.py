@@ -0,0 +1,247 @@
+"""
+profiling.py — Per-stage timing for generate-photos.py --profile.
+
+Worker processes time their stages with a StageTimer and send the totals
+back with their result. The main process folds those, plus its own stages
+(API calls, journal writes, manifest save), into one RunProfile. The
+profile summarises each stage as p50/p95/p99 over items and writes a JSON
+report with every item's timings and a log-scale histogram per stage.
+
+With --cprofile, each worker call and each fetch-thread call also runs
+under its own cProfile (a profiler only sees the thread that enabled it).
+The per-call stats are merged with the main thread's into a single pstats
+file. cProfile and pstats are only imported then.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+# Display order; stages not listed here are appended in the order first seen
+STAGES = ("throttle", "api", "b64decode", "store_original", "png_decode", "phash", "resize", "encode", "write",
+          "copy", "journal", "manifest_save")
+
+
+class StageTimer:
+    """Accumulates seconds and bytes per stage for one item. Disabled timers cost a no-op context."""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.seconds = {}
+        self.bytes = 0
+
+    def __call__(self, stage):
+        return self._time(stage) if self.enabled else nullcontext()
+
+    @contextmanager
+    def _time(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[stage] = self.seconds.get(stage, 0.0) + time.perf_counter() - start
+
+    def wrote(self, n):
+        self.bytes += n
+
+    def export(self):
+        """Picklable summary to return from a worker process."""
+        return {"seconds": self.seconds, "bytes": self.bytes}
+
+
+NULL_TIMER = StageTimer(enabled=False)
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def histogram(values_ms):
+    """Counts per power-of-two millisecond bucket: {"<1": n, "1-2": n, "2-4": n, ...}."""
+    buckets = {}
+    for ms in values_ms:
+        if ms < 1:
+            label = "<1"
+        else:
+            low = 2 ** int(math.log2(ms))
+            label = f"{low}-{low * 2}"
+        buckets[label] = buckets.get(label, 0) + 1
+    return dict(sorted(buckets.items(), key=lambda kv: -1 if kv[0] == "<1" else int(kv[0].split("-")[0])))
+
+
+class RunProfile:
+    """Timings for a whole run. Thread-safe: fetch threads record into it directly."""
+
+    def __init__(self, cprofile_path=None):
+        self.items = {}        # item id → {stage: seconds}
+        self.run_stages = {}   # once-per-run stages (e.g. manifest_save) → seconds
+        self.bytes_written = 0
+        self.completed = 0
+        self.started = time.perf_counter()
+        self.finished = None
+        self.lock = threading.Lock()
+        self.cprofile_path = cprofile_path
+        self.cprofile = None
+        self.worker_stats_dir = None
+        if cprofile_path:
+            import cProfile
+            import tempfile
+            self.worker_stats_dir = tempfile.mkdtemp(prefix="photos-cprofile-")
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+
+    def record(self, item_id, stage, seconds):
+        with self.lock:
+            stages = self.items.setdefault(item_id, {})
+            stages[stage] = stages.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def time(self, item_id, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(item_id, stage, time.perf_counter() - start)
+
+    @contextmanager
+    def time_run(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self.lock:
+                self.run_stages[stage] = self.run_stages.get(stage, 0.0) + time.perf_counter() - start
+
+    def merge(self, item_id, exported):
+        """Fold a worker's StageTimer.export() into an item's timings."""
+        for stage, seconds in exported["seconds"].items():
+            self.record(item_id, stage, seconds)
+        with self.lock:
+            self.bytes_written += exported["bytes"]
+
+    def item_done(self):
+        with self.lock:
+            self.completed += 1
+
+    @contextmanager
+    def profile_thread(self):
+        """With --cprofile, run the block under its own cProfile and queue its stats for finish() to merge.
+
+        For fetch threads, which the main thread's profiler never sees.
+        On Python 3.12+ cProfile hooks every thread and a second profiler
+        can't start; the main one already covers the block then.
+        """
+        if not self.cprofile:
+            yield
+            return
+        import cProfile
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            yield
+            return
+        try:
+            yield
+        finally:
+            profiler.disable()
+            _dump_stats(profiler, self.worker_stats_dir)
+
+    def finish(self):
+        """Stop timing and, with --cprofile, merge every queued stats file into it. Call once, even on error."""
+        self.finished = time.perf_counter()
+        if self.cprofile:
+            import pstats
+            import shutil
+            self.cprofile.disable()
+            try:
+                stats = pstats.Stats(self.cprofile)
+                for path in Path(self.worker_stats_dir).glob("*.prof"):
+                    stats.add(str(path))
+                stats.dump_stats(self.cprofile_path)
+            finally:
+                shutil.rmtree(self.worker_stats_dir, ignore_errors=True)
+
+    # ─── Summary ───
+
+    def stage_names(self):
+        seen = {stage for stages in self.items.values() for stage in stages}
+        return [s for s in STAGES if s in seen] + sorted(seen - set(STAGES))
+
+    def stage_stats(self):
+        stats = {}
+        for stage in self.stage_names():
+            values = sorted(stages[stage] * 1000 for stages in self.items.values() if stage in stages)
+            stats[stage] = {
+                "count": len(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "p99": percentile(values, 99),
+                "max": values[-1],
+                "totalSeconds": sum(values) / 1000,
+                "histogramMs": histogram(values),
+            }
+        return stats
+
+    def elapsed(self):
+        return (self.finished or time.perf_counter()) - self.started
+
+    def throughput(self):
+        """Completed items per minute of wall time."""
+        elapsed = self.elapsed()
+        return self.completed / elapsed * 60 if elapsed else 0.0
+
+    def report(self, **meta):
+        return {
+            **meta,
+            "wallSeconds": round(self.elapsed(), 3),
+            "itemsCompleted": self.completed,
+            "itemsPerMinute": round(self.throughput(), 2),
+            "bytesWritten": self.bytes_written,
+            "stages": self.stage_stats(),
+            "runStages": self.run_stages,
+            "items": self.items,
+            "cprofile": str(self.cprofile_path) if self.cprofile_path else None,
+        }
+
+    def write_report(self, path, **meta):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(**meta), indent=2) + "\n", encoding="utf-8")
+
+    def print_summary(self):
+        print(f"\n=== Profile ===")
+        print(f"  {'stage':<16}{'items':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'total s':>10}")
+        for stage, s in self.stage_stats().items():
+            print(f"  {stage:<16}{s['count']:>7}{s['p50']:>10.1f}{s['p95']:>10.1f}{s['p99']:>10.1f}{s['totalSeconds']:>10.2f}")
+        for stage, seconds in self.run_stages.items():
+            print(f"  {stage:<16}{'(run)':>7}{'':>30}{seconds:>10.2f}")
+        print(f"  Throughput: {self.throughput():.1f} items/min over {self.elapsed():.1f}s | "
+              f"Written: {self.bytes_written / 1024 / 1024:.2f} MB")
+
+
+def _dump_stats(profiler, stats_dir):
+    import tempfile
+    fd, path = tempfile.mkstemp(suffix=".prof", dir=stats_dir)
+    os.close(fd)
+    profiler.dump_stats(path)
+
+
+def profiled_call(stats_dir, fn, *args, **kwargs):
+    """Run fn under cProfile in a worker process, dumping stats into `stats_dir` for RunProfile to merge."""
+    import cProfile
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        profiler.disable()
+        _dump_stats(profiler, stats_dir)
@@ -8,6 +8,11 @@ composition. This single concept does more than pages of technical specs.
 
 Keep prompts under 40 words. Every extra word is something DALL-E's
 rewriter can romanticize into cinematic language.
+
+build_prompt(item) builds one prompt; build_prompts(items) is the batch
+path for --dry-run and prompt tuning, memoized on the fields a prompt
+actually depends on. Both must produce byte-identical output — see
+bench-prompts.py --check and golden/prompts.json.
 """
 
 import re
@@ -126,16 +131,20 @@ SUBCATEGORY_LOCATIONS = {
 }
 
 
+_GROUP_COUNT = re.compile(r"\((\d+)\)")
+_GROUP_SUFFIX = re.compile(r"\s*\(\d+\)")
+
+
 def core_description(item):
     """Build a generic visual description — no brand names or model numbers."""
     det = item.get("detail") or {}
     name = item.get("name", "")
 
-    group_match = re.search(r"\((\d+)\)", name)
+    group_match = _GROUP_COUNT.search(name)
 
     if group_match:
         count = int(group_match.group(1))
-        base_name = re.sub(r"\s*\(\d+\)", "", name).lower()
+        base_name = _GROUP_SUFFIX.sub("", name).lower()
         if det.get("contents"):
             return f"{count} {base_name}: {det['contents'][:60]}"
         return f"{count} {base_name}"
@@ -181,3 +190,46 @@ def build_prompt(item):
     location = location_context(item)
 
     return f"Disposable camera photo. {core[0].upper()}{core[1:]}, {location}. Tilted slightly. No people visible."
+
+
+# ─── Batch API ───
+
+_PROMPT_CACHE = {}
+
+
+def _prompt_key(item):
+    """Everything build_prompt reads from an item, as a hashable tuple."""
+    det = item.get("detail") or {}
+    tags = item["tags"]
+    return (
+        item["id"],
+        item.get("name", ""),
+        det.get("color", ""),
+        det.get("material", ""),
+        det.get("contents"),
+        tags["room"],
+        tags.get("category", ""),
+        tags.get("subcategory", ""),
+    )
+
+
+def build_prompts(items):
+    """Build prompts for many items at once. Returns a list, in input order.
+
+    Results are memoized on _prompt_key, so re-running over an unchanged
+    catalog (dry runs, prompt-tuning loops) only rebuilds edited items.
+    Misses go through build_prompt itself, so output is byte-identical.
+    """
+    cache = _PROMPT_CACHE
+    prompts = []
+    for item in items:
+        key = _prompt_key(item)
+        prompt = cache.get(key)
+        if prompt is None:
+            prompt = cache[key] = build_prompt(item)
+        prompts.append(prompt)
+    return prompts
+
+
+def clear_prompt_cache():
+    _PROMPT_CACHE.clear()
@@ -0,0 +1,146 @@
+"""
+throttle.py — Rate limiting shared by every generation worker.
+
+A single TokenBucket is created per run and handed to all workers, so the
+requests-per-minute ceiling holds no matter how many threads are calling
+the API at once. Likewise a single Backoff carries the run's 429 state, so
+one throttled worker pauses them all.
+"""
+
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate_per_minute` tokens, bursting up to `capacity`."""
+
+    def __init__(self, rate_per_minute, capacity=1):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self, now):
+        elapsed = now - self.updated
+        self.updated = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+
+    def acquire(self):
+        """Block until a token is available, then take it. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill(time.monotonic())
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+# ─── Backoff ───
+
+def is_rate_limited(exc):
+    """True if an API exception is a 429 / rate-limit response.
+
+    An HTTP status decides on its own; the message is only read for
+    exceptions without one (e.g. errors re-raised by other layers).
+    """
+    status = getattr(exc, "status_code", None)
+    if status is not None:
+        return status == 429
+    text = str(exc).lower()
+    return "429" in text or "rate limit" in text or "rate_limit" in text
+
+
+def retry_after_seconds(exc):
+    """Read Retry-After (or retry-after-ms) from an API exception's response, if any."""
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    ms = headers.get("retry-after-ms")
+    if ms:
+        try:
+            return max(0.0, float(ms) / 1000)
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    from email.utils import parsedate_to_datetime
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class Backoff:
+    """Throttle state shared by every worker in a run.
+
+    A 429 seen by any worker pauses all of them until `resume_at`. The delay
+    comes from Retry-After when the server sends one, otherwise from
+    exponential backoff on the run-wide streak of consecutive 429s, with
+    jitter so workers don't all wake at the same instant. `paused` is the
+    run's wall time spent paused, counted once however many workers wait.
+    """
+
+    def __init__(self, max_attempts=6, base_delay=2.0, max_delay=120.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.resume_at = 0.0
+        self.streak = 0
+        self.retries = 0
+        self.paused = 0.0
+        self.failures = 0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """Block while the run is paused after a 429."""
+        while True:
+            with self.lock:
+                delay = self.resume_at - time.monotonic()
+                if delay <= 0:
+                    return
+            time.sleep(delay)
+
+    def throttled(self, retry_after=None):
+        """Record a 429 and push back the shared resume time. Returns the delay applied."""
+        with self.lock:
+            self.streak += 1
+            self.retries += 1
+            if retry_after is not None:
+                delay = min(self.max_delay, retry_after)
+            else:
+                ceiling = min(self.max_delay, self.base_delay * 2 ** (self.streak - 1))
+                delay = random.uniform(ceiling / 2, ceiling)
+            now = time.monotonic()
+            resume_at = max(self.resume_at, now + delay)
+            # Only the extension: a pause already running is counted once
+            self.paused += resume_at - max(self.resume_at, now)
+            self.resume_at = resume_at
+            return delay
+
+    def succeeded(self):
+        with self.lock:
+            self.streak = 0
+
+    def failed(self):
+        with self.lock:
+            self.failures += 1
+
+    def summary(self):
+        return f"Retries: {self.retries} | Paused: {self.paused:.1f}s | Permanent failures: {self.failures}"
@@ -1,14 +1,667 @@
 #!/usr/bin/env python3
 """Threaded HTTP server for local development.
-Run from repo root to serve all projects."""
+Run from repo root to serve all projects.
+
+Files are sent with strong content-hash ETags and Last-Modified, so
+reloads revalidate with 304s instead of re-streaming every image.
+Photos under shared/images/ requested with a content version (?v=, added
+by shared/js/images.js) get a long Cache-Control; everything else,
+including unversioned photos, which the generator rewrites in place, is
+revalidated on each load. File bodies go out via sendfile.
+
+With --cache-mb, small hot files (shared/js, CSS, thumbnails) are kept in
+memory as ready-to-send header + body buffers, evicted least-recently-used
+and invalidated when their mtime or size changes. Hit/miss statistics are
+served as JSON at /__cache_stats and printed on exit.
+
+Text assets with fresh .br / .gz siblings (written by
+scripts/compress-assets.py) are served precompressed to clients whose
+Accept-Encoding allows it, with Content-Encoding and Vary set — no
+per-request compression.
+
+--async swaps the thread-per-connection server for an asyncio backend
+with persistent HTTP/1.1 connections, pipelining and a connection limit;
+scripts/load-test.py compares the two.
+
+Usage:
+  python3 server.py [port]                 # caching server (default port 8766)
+  python3 server.py [port] --cache-mb 64   # ...plus in-memory hot-file cache
+  python3 server.py [port] --async         # asyncio keep-alive backend
+  python3 server.py [port] --simple        # plain SimpleHTTPRequestHandler
+"""
+import argparse
+import asyncio
+import datetime
+import email.utils
+import hashlib
+import html
+import http.client
+import io
+import json
+import os
+import signal
 import sys
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from http import HTTPStatus
 from http.server import HTTPServer, SimpleHTTPRequestHandler
 from socketserver import ThreadingMixIn
 
+IMAGE_PREFIX = "/shared/images/"
+IMAGE_EXTENSIONS = (".webp", ".avif", ".png", ".jpg", ".jpeg")
+IMAGE_MAX_AGE = 7 * 24 * 3600
+
+# Text assets that may have precompressed siblings; shared with scripts/compress-assets.py
+COMPRESSIBLE_EXTENSIONS = (".js", ".mjs", ".css", ".html", ".json", ".svg", ".txt")
+# (Content-Encoding, sibling suffix), most preferred first
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+# path → (mtime_ns, size, etag); recomputed only when the file changes
+_etags = {}
+
+
+def file_etag(path, fs):
+    """Strong ETag from the file's sha256, cached by mtime and size."""
+    cached = _etags.get(path)
+    if cached and cached[0] == fs.st_mtime_ns and cached[1] == fs.st_size:
+        return cached[2]
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    etag = f'"{digest.hexdigest()[:32]}"'
+    _etags[path] = (fs.st_mtime_ns, fs.st_size, etag)
+    return etag
+
+
+def accepted_encodings(header):
+    """Content codings an Accept-Encoding header allows (q > 0)."""
+    accepted = set()
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name and q > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+def cache_control(url_path, query=""):
+    if (url_path.startswith(IMAGE_PREFIX) and url_path.lower().endswith(IMAGE_EXTENSIONS)
+            and "v" in urllib.parse.parse_qs(query)):
+        return f"public, max-age={IMAGE_MAX_AGE}, immutable"
+    return "no-cache"
+
+
+def is_not_modified(headers, etag, fs):
+    """Evaluate If-None-Match (preferred) or If-Modified-Since."""
+    if "If-None-Match" in headers:
+        tags = [t.strip() for t in headers["If-None-Match"].split(",")]
+        return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+    if "If-Modified-Since" in headers:
+        try:
+            ims = email.utils.parsedate_to_datetime(headers["If-Modified-Since"])
+        except (TypeError, IndexError, OverflowError, ValueError):
+            return False
+        if ims.tzinfo is None:
+            ims = ims.replace(tzinfo=datetime.timezone.utc)
+        last_modified = datetime.datetime.fromtimestamp(fs.st_mtime, datetime.timezone.utc)
+        return last_modified.replace(microsecond=0) <= ims
+
+    return False
+
+
+def negotiate_encoding(path, accept_encoding):
+    """Pick a precompressed sibling (.br, then .gz) the client accepts.
+
+    Returns (encoding or None, path to serve). A sibling older than its
+    source is ignored, so a stale build never shadows an edited file.
+    """
+    if not path.endswith(COMPRESSIBLE_EXTENSIONS):
+        return None, path
+    accepted = accepted_encodings(accept_encoding)
+    if not accepted:
+        return None, path
+    try:
+        source_mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None, path
+    for encoding, suffix in PRECOMPRESSED:
+        if encoding not in accepted and "*" not in accepted:
+            continue
+        try:
+            sibling = os.stat(path + suffix)
+        except OSError:
+            continue
+        if sibling.st_mtime_ns >= source_mtime:
+            return encoding, path + suffix
+    return None, path
+
+
+def file_headers(path, fs, etag, encoding, content_type, cache_policy):
+    """Entity headers for a 200: `path` is the requested file, `fs` the stat of what is sent."""
+    headers = [
+        ("Content-type", content_type),
+        ("Content-Length", str(fs.st_size)),
+        ("Last-Modified", email.utils.formatdate(fs.st_mtime, usegmt=True)),
+        ("ETag", etag),
+        ("Cache-Control", cache_policy),
+    ]
+    if encoding:
+        headers.append(("Content-Encoding", encoding))
+    if path.endswith(COMPRESSIBLE_EXTENSIONS):
+        headers.append(("Vary", "Accept-Encoding"))
+    return headers
+
+
+class HotFileCache:
+    """LRU of formatted 200 responses for small files, within a byte budget.
+
+    Entries are validated against the file's stat on every lookup, so an
+    edited file is re-read on its next request. (Stat-based rather than
+    inotify: portable, and a stat is far cheaper than open + read.)
+    """
+
+    def __init__(self, budget_bytes, max_entry_bytes=1 << 20):
+        self.budget = budget_bytes
+        self.max_entry = min(max_entry_bytes, budget_bytes)
+        # (path, Cache-Control) → (mtime_ns, size, etag, headers bytes, body); the
+        # policy is part of the key because it is in the headers and varies by URL
+        self.entries = OrderedDict()
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.lock = threading.Lock()
+
+    def get(self, key, fs):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] != fs.st_mtime_ns or entry[1] != fs.st_size:
+                self._drop(key)
+                self.invalidations += 1
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, fs, etag, headers, body):
+        cost = len(headers) + len(body)
+        if cost > self.max_entry:
+            return
+        with self.lock:
+            if key in self.entries:
+                self._drop(key)
+            while self.entries and self.used + cost > self.budget:
+                self._drop(next(iter(self.entries)))
+                self.evictions += 1
+            self.entries[key] = (fs.st_mtime_ns, fs.st_size, etag, headers, body)
+            self.used += cost
+
+    def _drop(self, key):
+        _, _, _, headers, body = self.entries.pop(key)
+        self.used -= len(headers) + len(body)
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self.entries),
+                "usedBytes": self.used,
+                "budgetBytes": self.budget,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRate": round(self.hits / lookups, 3) if lookups else None,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
 class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
     daemon_threads = True
+    hot_cache = None
+
+
+class CachingRequestHandler(SimpleHTTPRequestHandler):
+    """SimpleHTTPRequestHandler plus ETag/304 validation, Cache-Control and sendfile."""
+
+    def cache_control(self):
+        parts = urllib.parse.urlsplit(self.path)
+        return cache_control(parts.path, parts.query)
+
+    def not_modified(self, etag, fs):
+        return is_not_modified(self.headers, etag, fs)
+
+    def negotiate_encoding(self, path):
+        return negotiate_encoding(path, self.headers.get("Accept-Encoding", ""))
+
+    def file_headers(self, path, fs, etag, encoding=None):
+        return file_headers(path, fs, etag, encoding, self.guess_type(path), self.cache_control())
+
+    def send_not_modified(self, path, etag, fs):
+        self.send_response(HTTPStatus.NOT_MODIFIED)
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", self.cache_control())
+        self.send_header("Last-Modified", self.date_time_string(fs.st_mtime))
+        if path.endswith(COMPRESSIBLE_EXTENSIONS):
+            self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+
+    def send_cached(self, headers, body):
+        """Write a preformatted response; only the status, Server and Date lines are built per request."""
+        self.log_request(HTTPStatus.OK, len(body))
+        status = (f"{self.protocol_version} 200 OK\r\n"
+                  f"Server: {self.version_string()}\r\n"
+                  f"Date: {self.date_time_string()}\r\n").encode("latin-1")
+        self.wfile.write(status + headers)
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def send_stats(self):
+        cache = self.server.hot_cache
+        body = json.dumps(cache.stats() if cache else None, indent=2).encode()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def send_head(self):
+        if urllib.parse.urlsplit(self.path).path == "/__cache_stats":
+            self.send_stats()
+            return None
+
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            index = os.path.join(path, "index.html")
+            if not self.path.split("?", 1)[0].endswith("/") or not os.path.isfile(index):
+                # Redirects and directory listings: stdlib behaviour
+                return super().send_head()
+            path = index
+
+        if path.endswith("/"):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        # body_path is the file actually sent: the source or its .br/.gz sibling
+        encoding, body_path = self.negotiate_encoding(path)
+
+        cache = self.server.hot_cache
+        if cache is not None:
+            try:
+                fs = os.stat(body_path)
+            except OSError:
+                self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+                return None
+            entry = cache.get((body_path, self.cache_control()), fs)
+            if entry is not None:
+                _, _, etag, headers, body = entry
+                if self.not_modified(etag, fs):
+                    self.send_not_modified(path, etag, fs)
+                else:
+                    self.send_cached(headers, body)
+                return None
+
+        try:
+            f = open(body_path, "rb")
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        try:
+            fs = os.fstat(f.fileno())
+            etag = file_etag(body_path, fs)
+
+            if self.not_modified(etag, fs):
+                self.send_not_modified(path, etag, fs)
+                f.close()
+                return None
+
+            header_list = self.file_headers(path, fs, etag, encoding)
+            if cache is not None and fs.st_size <= cache.max_entry:
+                body = f.read()
+                f.close()
+                headers = "".join(f"{k}: {v}\r\n" for k, v in header_list).encode("latin-1") + b"\r\n"
+                cache.put((body_path, self.cache_control()), fs, etag, headers, body)
+                self.send_cached(headers, body)
+                return None
+
+            self.send_response(HTTPStatus.OK)
+            for keyword, value in header_list:
+                self.send_header(keyword, value)
+            self.end_headers()
+            return f
+        except:
+            f.close()
+            raise
+
+    def copyfile(self, source, outputfile):
+        # socket.sendfile uses os.sendfile for real files and falls back to
+        # send() for in-memory bodies such as directory listings.
+        outputfile.flush()
+        self.connection.sendfile(source)
+
+
+# ─── asyncio backend ───
+
+MAX_REQUEST_LINE = 8192
+MAX_HEADERS = 100
+
+
+class BadRequest(Exception):
+    pass
+
+
+async def read_request(reader):
+    """Read one request head. Returns (method, target, version, headers), or None at EOF."""
+    line = await reader.readline()
+    while line in (b"\r\n", b"\n"):  # tolerate stray CRLFs between pipelined requests
+        line = await reader.readline()
+    if not line:
+        return None
+    if len(line) > MAX_REQUEST_LINE or not line.endswith(b"\n"):
+        raise BadRequest("Request line too long")
+    parts = line.decode("latin-1").split()
+    if len(parts) != 3 or not parts[2].startswith("HTTP/1."):
+        raise BadRequest(f"Bad request line {line!r}")
+
+    head = []
+    while True:
+        header = await reader.readline()
+        if header in (b"\r\n", b"\n", b""):
+            break
+        head.append(header)
+        if len(head) > MAX_HEADERS:
+            raise BadRequest("Too many headers")
+    headers = http.client.parse_headers(io.BytesIO(b"".join(head) + b"\r\n"))
+    return parts[0], parts[1], parts[2], headers
+
+
+class AsyncStaticServer:
+    """Static server on asyncio streams: the --async backend.
+
+    Speaks HTTP/1.1 with persistent connections; requests on a connection
+    are answered strictly in order, so pipelined GETs work. Responses use the
+    same ETag / 304, precompression and hot-file cache logic as
+    CachingRequestHandler. At most `max_connections` connections are served
+    at once; later ones stay accepted but unread until a slot frees, so a
+    burst queues instead of spawning unbounded work. Directory listings are
+    not generated (use the threaded server to browse).
+
+    On shutdown the listener closes, idle keep-alive connections are dropped
+    and requests already in progress get `grace` seconds to finish.
+    """
+
+    # Borrowed so both backends map URLs to files and types identically
+    translate_path = SimpleHTTPRequestHandler.translate_path
+    guess_type = SimpleHTTPRequestHandler.guess_type
+    extensions_map = SimpleHTTPRequestHandler.extensions_map
+
+    server_version = "AsyncStatic/1.0"
+
+    def __init__(self, port, directory=None, max_connections=256, idle_timeout=15.0, grace=5.0, hot_cache=None):
+        self.port = port
+        self.directory = os.fspath(directory or os.getcwd())
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.grace = grace
+        self.hot_cache = hot_cache
+        self.idle = set()     # connection tasks waiting for their next request
+        self.busy = set()     # connection tasks mid-request
+        self.closing = False
+        self.connections = 0
+        self.requests = 0
+        self.peak = 0
+
+    # ─── Connection Loop ───
+
+    async def handle(self, reader, writer):
+        task = asyncio.current_task()
+        async with self.slots:
+            self.connections += 1
+            self.peak = max(self.peak, len(self.idle) + len(self.busy) + 1)
+            peer = writer.get_extra_info("peername")
+            try:
+                while not self.closing:
+                    self.idle.add(task)
+                    try:
+                        request = await asyncio.wait_for(read_request(reader), self.idle_timeout)
+                    except BadRequest as e:
+                        await self.send_error(writer, HTTPStatus.BAD_REQUEST, str(e), "HTTP/1.1", False)
+                        break
+                    finally:
+                        self.idle.discard(task)
+                    if request is None:
+                        break
+                    self.busy.add(task)
+                    try:
+                        keep_alive = await self.respond(request, reader, writer, peer)
+                    finally:
+                        self.busy.discard(task)
+                    if not keep_alive:
+                        break
+            except (asyncio.TimeoutError, asyncio.CancelledError, ConnectionError, asyncio.IncompleteReadError):
+                pass
+            finally:
+                writer.close()
+                try:
+                    await writer.wait_closed()
+                except (ConnectionError, asyncio.CancelledError):
+                    pass
+
+    # ─── Responses ───
+
+    def log(self, peer, request_line, status, size):
+        host = peer[0] if peer else "-"
+        sys.stderr.write(f'{host} - - [{time.strftime("%d/%b/%Y %H:%M:%S")}] "{request_line}" {int(status)} {size}\n')
+
+    def status_head(self, version, status, keep_alive):
+        connection = "keep-alive" if keep_alive else "close"
+        return (f"{version} {int(status)} {status.phrase}\r\n"
+                f"Server: {self.server_version}\r\n"
+                f"Date: {email.utils.formatdate(usegmt=True)}\r\n"
+                f"Connection: {connection}\r\n").encode("latin-1")
+
+    async def send(self, writer, version, status, headers, keep_alive, body=b""):
+        lines = "".join(f"{k}: {v}\r\n" for k, v in headers).encode("latin-1")
+        writer.write(self.status_head(version, status, keep_alive) + lines + b"\r\n" + body)
+        await writer.drain()
+
+    async def send_error(self, writer, status, message, version, keep_alive, head_only=False):
+        body = f"<h1>{int(status)} {status.phrase}</h1><p>{html.escape(message)}</p>\n".encode()
+        headers = [("Content-type", "text/html; charset=utf-8"), ("Content-Length", str(len(body)))]
+        await self.send(writer, version, status, headers, keep_alive, b"" if head_only else body)
+
+    async def respond(self, request, reader, writer, peer):
+        """Answer one request. Returns whether the connection stays open."""
+        method, target, version, headers = request
+        self.requests += 1
+        connection = headers.get("Connection", "").lower()
+        if version == "HTTP/1.0":
+            keep_alive = connection == "keep-alive"
+        else:
+            keep_alive = connection != "close"
+        keep_alive = keep_alive and not self.closing
+
+        # Bodies are never used, but must be consumed to find the next request
+        length = headers.get("Content-Length")
+        if length:
+            try:
+                await reader.readexactly(int(length))
+            except ValueError:
+                await self.send_error(writer, HTTPStatus.BAD_REQUEST, "Bad Content-Length", version, False)
+                return False
+
+        request_line = f"{method} {target} {version}"
+        status, size = await self.serve(method, target, version, headers, writer, keep_alive)
+        self.log(peer, request_line, status, size)
+        return keep_alive
+
+    async def serve(self, method, target, version, headers, writer, keep_alive):
+        """Send the response for a GET/HEAD. Returns (status, body bytes) for the log."""
+        head_only = method == "HEAD"
+        if method not in ("GET", "HEAD"):
+            await self.send_error(writer, HTTPStatus.NOT_IMPLEMENTED, f"Unsupported method {method!r}", version, keep_alive)
+            return HTTPStatus.NOT_IMPLEMENTED, "-"
+
+        url_path = urllib.parse.urlsplit(target).path
+        if url_path == "/__cache_stats":
+            body = json.dumps(self.hot_cache.stats() if self.hot_cache else None, indent=2).encode()
+            headers_out = [("Content-type", "application/json"), ("Content-Length", str(len(body))), ("Cache-Control", "no-store")]
+            await self.send(writer, version, HTTPStatus.OK, headers_out, keep_alive, b"" if head_only else body)
+            return HTTPStatus.OK, len(body)
+
+        path = self.translate_path(target)
+        if os.path.isdir(path):
+            if not url_path.endswith("/"):
+                parts = urllib.parse.urlsplit(target)
+                location = urllib.parse.urlunsplit(parts._replace(path=parts.path + "/"))
+                await self.send(writer, version, HTTPStatus.MOVED_PERMANENTLY,
+                                [("Location", location), ("Content-Length", "0")], keep_alive)
+                return HTTPStatus.MOVED_PERMANENTLY, 0
+            path = os.path.join(path, "index.html")
+
+        encoding, body_path = negotiate_encoding(path, headers.get("Accept-Encoding", ""))
+        policy = cache_control(url_path, urllib.parse.urlsplit(target).query)
+
+        cache = self.hot_cache
+        entry = None
+        try:
+            fs = os.stat(body_path)
+            if cache is not None:
+                entry = cache.get((body_path, policy), fs)
+        except OSError:
+            fs = None
+        if fs is None or path.endswith("/") or not os.path.isfile(body_path):
+            await self.send_error(writer, HTTPStatus.NOT_FOUND, "File not found", version, keep_alive, head_only)
+            return HTTPStatus.NOT_FOUND, "-"
+
+        etag = entry[2] if entry else file_etag(body_path, fs)
+        if is_not_modified(headers, etag, fs):
+            headers_out = [("ETag", etag), ("Cache-Control", policy),
+                           ("Last-Modified", email.utils.formatdate(fs.st_mtime, usegmt=True))]
+            if path.endswith(COMPRESSIBLE_EXTENSIONS):
+                headers_out.append(("Vary", "Accept-Encoding"))
+            await self.send(writer, version, HTTPStatus.NOT_MODIFIED, headers_out, keep_alive)
+            return HTTPStatus.NOT_MODIFIED, "-"
+
+        if entry is not None:
+            # Hot-cache entries hold the preformatted entity headers + body
+            _, _, _, cached_headers, body = entry
+            writer.write(self.status_head(version, HTTPStatus.OK, keep_alive) + cached_headers)
+            if not head_only:
+                writer.write(body)
+            await writer.drain()
+            return HTTPStatus.OK, len(body)
+
+        header_list = file_headers(path, fs, etag, encoding, self.guess_type(path), policy)
+        if cache is not None and fs.st_size <= cache.max_entry:
+            with open(body_path, "rb") as f:
+                body = f.read()
+            cached_headers = "".join(f"{k}: {v}\r\n" for k, v in header_list).encode("latin-1") + b"\r\n"
+            cache.put((body_path, policy), fs, etag, cached_headers, body)
+            writer.write(self.status_head(version, HTTPStatus.OK, keep_alive) + cached_headers)
+            if not head_only:
+                writer.write(body)
+            await writer.drain()
+            return HTTPStatus.OK, len(body)
+
+        await self.send(writer, version, HTTPStatus.OK, header_list, keep_alive)
+        if not head_only:
+            with open(body_path, "rb") as f:
+                await asyncio.get_running_loop().sendfile(writer.transport, f)
+        return HTTPStatus.OK, fs.st_size
+
+    # ─── Lifecycle ───
+
+    async def serve_forever(self):
+        self.slots = asyncio.Semaphore(self.max_connections)
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except (NotImplementedError, RuntimeError):
+                pass  # e.g. Windows: fall back to KeyboardInterrupt
+
+        server = await asyncio.start_server(self.handle, port=self.port, backlog=self.max_connections)
+        print(f"Serving on http://localhost:{self.port} (asyncio, HTTP/1.1, max {self.max_connections} connections)")
+        try:
+            await stop.wait()
+        finally:
+            await self.shutdown(server)
+
+    async def shutdown(self, server):
+        self.closing = True
+        server.close()
+        for task in list(self.idle):
+            task.cancel()
+        pending = self.idle | self.busy
+        if pending:
+            print(f"\nShutting down: waiting up to {self.grace:g}s for {len(self.busy)} in-flight requests")
+            _, still_running = await asyncio.wait(pending, timeout=self.grace)
+            for task in still_running:
+                task.cancel()
+        await server.wait_closed()
+
+    def summary(self):
+        return f"Served {self.requests} requests over {self.connections} connections (peak {self.peak} concurrent)"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Static file server for local development")
+    parser.add_argument("port", nargs="?", type=int, default=8766)
+    backend = parser.add_mutually_exclusive_group()
+    backend.add_argument("--simple", action="store_true", help="Use the plain stdlib handler (no validators, no cache headers)")
+    backend.add_argument("--async", dest="use_async", action="store_true", help="Use the asyncio HTTP/1.1 keep-alive backend")
+    parser.add_argument("--cache-mb", type=float, default=0, help="Keep hot files in an in-memory LRU of this many MB (default: off)")
+    parser.add_argument("--max-connections", type=int, default=256, help="--async: connections served at once; more wait in the queue (default: 256)")
+    parser.add_argument("--grace", type=float, default=5.0, help="--async: seconds in-flight requests get to finish on shutdown (default: 5)")
+    args = parser.parse_args()
+
+    hot_cache = None
+    if args.cache_mb > 0 and not args.simple:
+        hot_cache = HotFileCache(int(args.cache_mb * 1024 * 1024))
+
+    if args.use_async:
+        server = AsyncStaticServer(args.port, max_connections=args.max_connections, grace=args.grace, hot_cache=hot_cache)
+        try:
+            asyncio.run(server.serve_forever())
+        except KeyboardInterrupt:
+            pass
+        finally:
+            print(f"\n{server.summary()}")
+            if hot_cache:
+                print(f"Hot-file cache: {json.dumps(hot_cache.stats())}")
+        return
+
+    handler = SimpleHTTPRequestHandler if args.simple else CachingRequestHandler
+    server = ThreadedHTTPServer(("", args.port), handler)
+    server.hot_cache = hot_cache
+    print(f"Serving on http://localhost:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if server.hot_cache:
+            print(f"\nHot-file cache: {json.dumps(server.hot_cache.stats())}")
+
 
-port = int(sys.argv[1]) if len(sys.argv) > 1 else 8766
-server = ThreadedHTTPServer(("", port), SimpleHTTPRequestHandler)
-print(f"Serving on http://localhost:{port}")
-server.serve_forever()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,482 @@
+// ladder.js — Generated by scripts/generate-photos.py; do not edit.
+// Responsive variants on disk: {id}-{width}w.{format} for every listed width.
+// IMAGE_VERSIONS go on every image URL as ?v=, so the server can let browsers cache them
+// for long: files are rewritten in place when an item is regenerated.
+
+export const LADDER_FORMATS = ["avif", "webp"];
+
+export const LADDER_WIDTHS = {
+};
+
+export const IMAGE_VERSIONS = {
+  "obj-001": "dea47d0c53",
+  "obj-002": "ee110a9a53",
+  "obj-003": "310d9b9682",
+  "obj-004": "bda59aae89",
+  "obj-005": "955a2394a8",
+  "obj-006": "327a6671d9",
+  "obj-007": "d1f977043b",
+  "obj-008": "d713e1d7e8",
+  "obj-009": "016578522b",
+  "obj-010": "6e6a635fe3",
+  "obj-011": "9af9aee689",
+  "obj-012": "c29c6d5b6f",
+  "obj-013": "b181791d90",
+  "obj-014": "ec59b2598c",
+  "obj-015": "893f3e23b9",
+  "obj-016": "bafc8919f8",
+  "obj-017": "ffc88d8283",
+  "obj-018": "4a5c2a3a77",
+  "obj-019": "841cf92611",
+  "obj-020": "e49efc2392",
+  "obj-021": "a10299c314",
+  "obj-022": "3b073e11a3",
+  "obj-023": "214eb7f0f1",
+  "obj-024": "d10e8a25a9",
+  "obj-025": "cdcd54ec7d",
+  "obj-026": "05a3501e87",
+  "obj-027": "c96c6e3b7b",
+  "obj-028": "f2b70dd9fe",
+  "obj-029": "8c07f78f9b",
+  "obj-030": "87f1ca7476",
+  "obj-031": "a6a0409e4f",
+  "obj-032": "dea7e8e4d1",
+  "obj-033": "3bd02cdbcb",
+  "obj-034": "3df5e585e0",
+  "obj-035": "2161e5a4fb",
+  "obj-036": "ac2a8f49f2",
+  "obj-037": "582f7fcaf4",
+  "obj-038": "8f05e3c106",
+  "obj-039": "0d621c8e51",
+  "obj-040": "782a6fcbb6",
+  "obj-041": "36b77ab5e8",
+  "obj-042": "c5f88c3317",
+  "obj-043": "07efcbe0d3",
+  "obj-044": "2155ab2a9e",
+  "obj-045": "f4983c52eb",
+  "obj-046": "cafc2b5bbf",
+  "obj-047": "bbd7a69dcd",
+  "obj-048": "b8b4116eff",
+  "obj-049": "a264e9b072",
+  "obj-050": "698b9e1810",
+  "obj-051": "bbc27f1087",
+  "obj-052": "1ea3052b3f",
+  "obj-053": "d14202d674",
+  "obj-054": "c76912f0c7",
+  "obj-055": "c02a973763",
+  "obj-056": "00fd17d491",
+  "obj-057": "cef7122417",
+  "obj-058": "cc238e004d",
+  "obj-059": "6efffcff8f",
+  "obj-060": "292dfd6dd3",
+  "obj-061": "44cc08e647",
+  "obj-062": "9976107780",
+  "obj-063": "3263dd30d5",
+  "obj-064": "961f52b8ec",
+  "obj-065": "8713791f3c",
+  "obj-066": "5d425f59d0",
+  "obj-067": "00da9aaf82",
+  "obj-068": "0a3ef89f6b",
+  "obj-069": "4defe04482",
+  "obj-070": "dde8cef737",
+  "obj-071": "3a0de131a9",
+  "obj-072": "c3dc9411d6",
+  "obj-073": "77a1e8d0e8",
+  "obj-074": "ac9f33047c",
+  "obj-075": "46a396646c",
+  "obj-076": "6c8e6329ce",
+  "obj-077": "4c871207cf",
+  "obj-078": "abb66036ba",
+  "obj-079": "b52f363dc0",
+  "obj-080": "d0b21fb205",
+  "obj-081": "cfdcab3f8f",
+  "obj-082": "23d7a72d16",
+  "obj-083": "f4b0c10b1f",
+  "obj-084": "55324af48c",
+  "obj-085": "df14b367dc",
+  "obj-086": "e075aafc7e",
+  "obj-087": "1e6db608f0",
+  "obj-088": "57bcf882d6",
+  "obj-089": "48cd2d03ac",
+  "obj-090": "4fa7ca9184",
+  "obj-091": "491e0eaba7",
+  "obj-092": "50cda77121",
+  "obj-093": "fe3afa4f21",
+  "obj-094": "1e884e2392",
+  "obj-095": "f2b0321d4a",
+  "obj-096": "266d958a7c",
+  "obj-097": "41096c9ced",
+  "obj-098": "001a8a101f",
+  "obj-099": "d861d5c73d",
+  "obj-100": "f59794b356",
+  "obj-101": "96b842c8b4",
+  "obj-102": "ebc5504810",
+  "obj-103": "2b4863e4e5",
+  "obj-104": "865e0999ad",
+  "obj-105": "41c2ac01ab",
+  "obj-106": "f612652a73",
+  "obj-107": "e7d8999a3a",
+  "obj-108": "ff583362d8",
+  "obj-109": "bc1d51080d",
+  "obj-110": "8269f4474b",
+  "obj-111": "ff6d060673",
+  "obj-112": "4cdebe0a83",
+  "obj-113": "001cb29473",
+  "obj-114": "6c9056efcd",
+  "obj-115": "74fdda5901",
+  "obj-116": "b21edb0c63",
+  "obj-117": "876bc1f21f",
+  "obj-118": "b631cd20de",
+  "obj-119": "890c33cc33",
+  "obj-120": "0c194fc224",
+  "obj-121": "eae33f296c",
+  "obj-122": "27e41cb3b0",
+  "obj-123": "5469c766a1",
+  "obj-124": "1472b2a728",
+  "obj-125": "be2757ac84",
+  "obj-126": "09e291a699",
+  "obj-127": "eeb86390e3",
+  "obj-128": "8e6f9ff7d1",
+  "obj-129": "88b972aaf8",
+  "obj-130": "65d2066b27",
+  "obj-131": "e615578e56",
+  "obj-132": "5af77eaf28",
+  "obj-133": "fa6c7a6270",
+  "obj-134": "9fd7e9e2c0",
+  "obj-135": "1c002f992b",
+  "obj-136": "3675988bf7",
+  "obj-137": "b3e97cead4",
+  "obj-138": "ab454e6557",
+  "obj-139": "05ecffc5c9",
+  "obj-140": "82e313a98a",
+  "obj-141": "647eeeca46",
+  "obj-142": "5263c21659",
+  "obj-143": "060b3de723",
+  "obj-144": "583fe91a67",
+  "obj-145": "662eaa5bf8",
+  "obj-146": "b7f5830066",
+  "obj-147": "aa8cf1fe42",
+  "obj-148": "7d4335fc5d",
+  "obj-149": "607f0e769c",
+  "obj-150": "c513d20305",
+  "obj-151": "2b55ccdc66",
+  "obj-152": "2047c74697",
+  "obj-153": "422ce9589b",
+  "obj-154": "a8f33b9edc",
+  "obj-155": "dd3b610473",
+  "obj-156": "eab3928781",
+  "obj-157": "44d40475e5",
+  "obj-158": "fccf101a5f",
+  "obj-159": "1a2901b456",
+  "obj-160": "73223e357d",
+  "obj-161": "06737dcace",
+  "obj-162": "bfc34f9852",
+  "obj-163": "19a8fa1f9a",
+  "obj-164": "6b2dde3459",
+  "obj-165": "ea2a46d0f0",
+  "obj-166": "dfbec12568",
+  "obj-167": "7887b5b055",
+  "obj-168": "2a3d35174a",
+  "obj-169": "c6fe96e510",
+  "obj-170": "01bd1f8432",
+  "obj-171": "f3fd20dc4d",
+  "obj-172": "317b7c000c",
+  "obj-173": "37dd868466",
+  "obj-174": "3f0fdec43a",
+  "obj-175": "a4947ef977",
+  "obj-176": "289654d914",
+  "obj-177": "d6fa828577",
+  "obj-178": "3ba298cd1f",
+  "obj-179": "ad8d7afc5a",
+  "obj-180": "e4377e315a",
+  "obj-181": "65c8ff1a5b",
+  "obj-182": "97cbb81517",
+  "obj-183": "83bd85d69d",
+  "obj-184": "f162a5e904",
+  "obj-185": "c8489cf220",
+  "obj-186": "b7ba218b62",
+  "obj-187": "1222c9162a",
+  "obj-188": "d21d2ff3f7",
+  "obj-189": "2e372b3fa5",
+  "obj-190": "c29922262d",
+  "obj-191": "17b0e0737b",
+  "obj-192": "6505fad171",
+  "obj-193": "26e04e2cd4",
+  "obj-194": "2c17dc4096",
+  "obj-195": "a12fff5c58",
+  "obj-196": "0093c2bb5d",
+  "obj-197": "15e85aa3ee",
+  "obj-198": "d3fa207b35",
+  "obj-199": "29c7f75c1b",
+  "obj-200": "60c71a41f4",
+  "obj-201": "964f110cf1",
+  "obj-202": "27a41ad66e",
+  "obj-203": "ee05eca654",
+  "obj-204": "c7e18f5bfa",
+  "obj-205": "684a53c679",
+  "obj-206": "5711289531",
+  "obj-207": "4ad5eaae18",
+  "obj-208": "6dcc8cca46",
+  "obj-209": "d9749c7fb6",
+  "obj-210": "e179e0d14e",
+  "obj-211": "6ee7bc3328",
+  "obj-212": "1a0224f4d6",
+  "obj-213": "f3acc3e1ae",
+  "obj-214": "ae41098087",
+  "obj-215": "9855903b5a",
+  "obj-216": "50709af8f3",
+  "obj-217": "214195f1a8",
+  "obj-218": "0ba62d2e77",
+  "obj-219": "fbbea81a79",
+  "obj-220": "6630d1ecfa",
+  "obj-221": "36e3c86cdf",
+  "obj-222": "6aa5852cfe",
+  "obj-223": "44a3b11087",
+  "obj-224": "db60b3e686",
+  "obj-225": "3e25d98d94",
+  "obj-226": "e7e91c5647",
+  "obj-227": "7dc0942eec",
+  "obj-228": "44297ce992",
+  "obj-229": "7a4d8b17e3",
+  "obj-230": "4199ebb003",
+  "obj-231": "d1de846bf4",
+  "obj-232": "33e475df6b",
+  "obj-233": "19eedb52e8",
+  "obj-234": "bf474665b9",
+  "obj-235": "1f431d5a5b",
+  "obj-236": "0ea4e18794",
+  "obj-237": "5258f04db1",
+  "obj-238": "3a6ad8f6d0",
+  "obj-239": "02dbb30475",
+  "obj-240": "0121b9f16d",
+  "obj-241": "d53f7e8e61",
+  "obj-242": "0b9a012ad4",
+  "obj-243": "45635dd5aa",
+  "obj-244": "ed67bebb06",
+  "obj-245": "d4095642bb",
+  "obj-246": "a66619f0e6",
+  "obj-247": "f7135a8770",
+  "obj-248": "346f46009c",
+  "obj-249": "a2f335e8d4",
+  "obj-250": "d6e3f698b6",
+  "obj-251": "e53e864af3",
+  "obj-252": "d09527086c",
+  "obj-253": "1f0c3f587c",
+  "obj-254": "c3e96ac8bf",
+  "obj-255": "29c3cf9840",
+  "obj-256": "9fb7b2e974",
+  "obj-257": "1ac33d744e",
+  "obj-258": "2178c9f9cb",
+  "obj-259": "701ac249de",
+  "obj-260": "8b4969d906",
+  "obj-261": "6034dc04e4",
+  "obj-262": "94e039f801",
+  "obj-263": "3168686f50",
+  "obj-264": "79fb2485be",
+  "obj-265": "c1c6d29a4a",
+  "obj-266": "6792583717",
+  "obj-267": "e813323ffe",
+  "obj-268": "d2fb8c52f1",
+  "obj-269": "2296b062f9",
+  "obj-270": "56aeb8d818",
+  "obj-271": "0b4c1a1cb8",
+  "obj-272": "7e2351275b",
+  "obj-273": "b45a61974e",
+  "obj-274": "d27ea08d56",
+  "obj-275": "66bd6740de",
+  "obj-276": "841f954a6a",
+  "obj-277": "82a0e6dd22",
+  "obj-278": "88f28aa863",
+  "obj-279": "086c986983",
+  "obj-280": "1b25afe3be",
+  "obj-281": "0b9a521ebe",
+  "obj-282": "33ed4797ae",
+  "obj-283": "0c39b79289",
+  "obj-284": "e336a03afb",
+  "obj-285": "fb4a93ff38",
+  "obj-286": "926e306f2e",
+  "obj-287": "aa27f67bc8",
+  "obj-288": "499875fe30",
+  "obj-289": "89454741a8",
+  "obj-290": "99003ef386",
+  "obj-291": "e3fbe6850f",
+  "obj-292": "0d07d0292d",
+  "obj-293": "8bb66cfdbf",
+  "obj-294": "756e525a65",
+  "obj-295": "3c4b729905",
+  "obj-296": "6bc303d00f",
+  "obj-297": "c80791c5c9",
+  "obj-298": "d3e2a8f33e",
+  "obj-299": "cc95e5ed4d",
+  "obj-300": "f5ae76da7b",
+  "obj-301": "4a0a963e30",
+  "obj-302": "a4412b4766",
+  "obj-303": "758931c9f6",
+  "obj-304": "46237e85a4",
+  "obj-305": "83eae56649",
+  "obj-306": "82ec9f2520",
+  "obj-307": "61682d9e07",
+  "obj-308": "c6b6ef8fba",
+  "obj-309": "cebf4fdadc",
+  "obj-310": "f8a2098b4f",
+  "obj-311": "9f1c7294b4",
+  "obj-312": "402f9cf4fe",
+  "obj-313": "e387d204c9",
+  "obj-314": "5ebebe46c4",
+  "obj-315": "53b13cc352",
+  "obj-316": "58010b8ca8",
+  "obj-317": "9ec4a4c1f2",
+  "obj-318": "298c8d7e97",
+  "obj-319": "717c1b8b55",
+  "obj-320": "bb2437bb13",
+  "obj-321": "a855361318",
+  "obj-322": "ec137248b5",
+  "obj-323": "e3ba3458c5",
+  "obj-324": "009708b043",
+  "obj-325": "6adaa7a935",
+  "obj-326": "832c34d4f6",
+  "obj-327": "411f08fe8d",
+  "obj-328": "fe587a1308",
+  "obj-329": "fe01ac2ac4",
+  "obj-330": "828ef05b6d",
+  "obj-331": "5b762f326b",
+  "obj-332": "029c94fb46",
+  "obj-333": "aa7eb8e6cc",
+  "obj-334": "be69c7f19c",
+  "obj-335": "9c300a6d4a",
+  "obj-336": "1e863327be",
+  "obj-337": "f988cf79e6",
+  "obj-338": "fa1b94b24b",
+  "obj-339": "5f4f2cad7d",
+  "obj-340": "476d4f22e4",
+  "obj-341": "424ff16f33",
+  "obj-342": "a468e1c064",
+  "obj-343": "d59e1324ff",
+  "obj-344": "ea5807c01c",
+  "obj-345": "a72af2a0a6",
+  "obj-346": "bd02f90973",
+  "obj-347": "28ee71332f",
+  "obj-348": "7498d011fd",
+  "obj-349": "9df91ae48e",
+  "obj-350": "874f34e224",
+  "obj-351": "e0f3863dd5",
+  "obj-352": "eaea2a1bfe",
+  "obj-353": "02aafda38c",
+  "obj-354": "798f925752",
+  "obj-355": "39469a0964",
+  "obj-356": "2e8b795b0d",
+  "obj-357": "89349c39ce",
+  "obj-358": "7da4d8ee06",
+  "obj-359": "f13dec437d",
+  "obj-360": "6d2af2eb17",
+  "obj-361": "187d4bb510",
+  "obj-362": "42264113d2",
+  "obj-363": "ed474659b5",
+  "obj-364": "e1cc0a81f1",
+  "obj-365": "654dce0d3b",
+  "obj-366": "4877bf0f33",
+  "obj-367": "6c0ecc961c",
+  "obj-368": "f9e25f3b6f",
+  "obj-369": "54b46d4250",
+  "obj-370": "85372929e8",
+  "obj-371": "da6dfc6a07",
+  "obj-372": "cbe68c22a9",
+  "obj-373": "829e8e3aac",
+  "obj-374": "8e6afb0b3d",
+  "obj-375": "8a98fbb7db",
+  "obj-376": "0d6579a570",
+  "obj-377": "659f2cc62b",
+  "obj-378": "5c146e9597",
+  "obj-379": "43237b7fe2",
+  "obj-380": "6374fd21d9",
+  "obj-381": "2ab7cd6fcc",
+  "obj-382": "3b10cd521b",
+  "obj-383": "0c4b94ce89",
+  "obj-384": "58abf60ab8",
+  "obj-385": "f6278907dc",
+  "obj-386": "659c60ca29",
+  "obj-387": "6082bba2c9",
+  "obj-388": "a7ba22b71c",
+  "obj-389": "58a3f61877",
+  "obj-390": "b387565fba",
+  "obj-391": "72243d2387",
+  "obj-392": "3aa4e49900",
+  "obj-393": "e1487ab93e",
+  "obj-394": "819e9588d3",
+  "obj-395": "ce5072e5f4",
+  "obj-396": "ccfc2fa1bf",
+  "obj-397": "3912085df8",
+  "obj-398": "ab5d2f062a",
+  "obj-399": "5b80d138ac",
+  "obj-400": "5aa96a7a70",
+  "obj-401": "e93d2cab43",
+  "obj-402": "c8842622f7",
+  "obj-403": "5d4600ef1d",
+  "obj-404": "3ecab76f42",
+  "obj-405": "9d7aec7e67",
+  "obj-406": "fe04afa437",
+  "obj-407": "4502836b0b",
+  "obj-408": "ad3b167459",
+  "obj-409": "e036eeffa4",
+  "obj-410": "b0c999cef6",
+  "obj-411": "a98abd980b",
+  "obj-412": "e0b55b4160",
+  "obj-413": "523eb51e09",
+  "obj-414": "9b79f86e6c",
+  "obj-415": "83cdd93a8d",
+  "obj-416": "d9a2e6ecd9",
+  "obj-417": "f335dea6c6",
+  "obj-418": "ba05bd37db",
+  "obj-419": "aedf77b337",
+  "obj-420": "7a03a39abf",
+  "obj-421": "8a3e301a89",
+  "obj-422": "ee28f5e2b6",
+  "obj-423": "00fb70e130",
+  "obj-424": "422a4c91f3",
+  "obj-425": "03026b3ee2",
+  "obj-426": "24d3605a30",
+  "obj-427": "f7a623b167",
+  "obj-428": "37b950fb23",
+  "obj-429": "2f28b8b94f",
+  "obj-430": "c121e9188c",
+  "obj-431": "035ea11e17",
+  "obj-432": "4d326c8266",
+  "obj-433": "9c37901e51",
+  "obj-434": "b122bded5c",
+  "obj-435": "72e1e4bf62",
+  "obj-436": "2a7c4552c0",
+  "obj-437": "d8ff014e08",
+  "obj-438": "c0c2cdd43c",
+  "obj-439": "4c5dbea521",
+  "obj-440": "f9d5889820",
+  "obj-441": "cb55d021e4",
+  "obj-442": "30dc4b2ac3",
+  "obj-443": "335b026253",
+  "obj-444": "980d313afd",
+  "obj-445": "d637cd039b",
+  "obj-446": "1da5a0fac0",
+  "obj-447": "4796076806",
+  "obj-448": "589b62727f",
+  "obj-449": "569f8f3333",
+  "obj-450": "9c165fbf10",
+  "obj-451": "e476d342e6",
+  "obj-452": "71ae2c68fe",
+  "obj-453": "c3929df19d",
+  "obj-454": "91db0f7eb3",
+  "obj-455": "60a4ebbf6f",
+  "obj-456": "8b3845ec98",
+  "obj-457": "943ad1b025",
+  "obj-458": "6e4593fcfc",
+  "obj-459": "c8a0496d49",
+  "obj-460": "197f32f5cc",
+  "obj-461": "eee4ae6eef",
+  "obj-462": "6d2d6bd006",
+  "obj-463": "af0ef84edd",
+  "obj-464": "03a612f534",
+  "obj-465": "c3094e8e11",
+  "obj-466": "d78c86fdf1",
+  "obj-467": "4adb8a435a",
+  "obj-468": "579f1005ac",
+  "obj-469": "e7e3350e33",
+  "obj-470": "cc5d267f24",
+};
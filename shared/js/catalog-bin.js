@@ -0,0 +1,94 @@
+// catalog-bin.js — Reader for the optional columnar catalog (shared/data/catalog.bin)
+// Written by scripts/build-catalog.py --binary; layout documented in scripts/catalog.py.
+// Rows are grouped by room with per-room offsets, so a view that shows one
+// room decodes only that room's rows. Decoded items match catalog.json.
+
+const MAGIC = 'CATB';
+const VERSION = 2;
+const STRING_FIELDS = [
+  'id', 'name', 'room', 'category', 'subcategory', 'size', 'dateObtained', 'lastUsed',
+  'usageFrequency', 'attachment', 'status', 'description', 'icon', 'detail',
+];
+
+/**
+ * Decode catalog.bin into item objects, in catalog order.
+ * @param {ArrayBuffer} buffer - Contents of catalog.bin
+ * @param {string[]|null} rooms - Only decode these rooms (all by default)
+ * @returns {object[]}
+ */
+export function decodeCatalog(buffer, rooms = null) {
+  const view = new DataView(buffer);
+  const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+  if (magic !== MAGIC || view.getUint16(4, true) !== VERSION) {
+    throw new Error('catalog.bin: unsupported format');
+  }
+  const roomCount = view.getUint16(6, true);
+  const rowCount = view.getUint32(8, true);
+  const stringCount = view.getUint32(12, true);
+
+  let at = 16;
+  const ranges = [];
+  for (let r = 0; r < roomCount; r++, at += 12) {
+    ranges.push([view.getUint32(at, true), view.getUint32(at + 4, true), view.getUint32(at + 8, true)]);
+  }
+  at += (8 - (at % 8)) % 8;
+
+  const volumeAt = at;
+  const positionAt = volumeAt + 8 * rowCount;
+  const columnAt = positionAt + 4 * rowCount;
+  const offsetsAt = columnAt + 4 * rowCount * STRING_FIELDS.length;
+  const blobAt = offsetsAt + 4 * (stringCount + 1);
+
+  const utf8 = new TextDecoder();
+  const strings = new Map([[0, null]]);
+  const string = (sid) => {
+    if (!strings.has(sid)) {
+      const start = view.getUint32(offsetsAt + 4 * sid, true);
+      const end = view.getUint32(offsetsAt + 4 * (sid + 1), true);
+      strings.set(sid, utf8.decode(new Uint8Array(buffer, blobAt + start, end - start)));
+    }
+    return strings.get(sid);
+  };
+
+  const wanted = rooms ? new Set(rooms) : null;
+  const rows = [];
+  for (const [nameId, first, count] of ranges) {
+    if (wanted && !wanted.has(string(nameId))) continue;
+    for (let row = first; row < first + count; row++) {
+      const f = {};
+      STRING_FIELDS.forEach((field, c) => {
+        f[field] = string(view.getUint32(columnAt + 4 * (c * rowCount + row), true));
+      });
+      const tags = { room: f.room, category: f.category };
+      if (f.subcategory !== null) tags.subcategory = f.subcategory;
+      rows.push([view.getUint32(positionAt + 4 * row, true), {
+        id: f.id,
+        name: f.name,
+        tags,
+        volume_liters: view.getFloat64(volumeAt + 8 * row, true),
+        size: f.size,
+        dateObtained: f.dateObtained,
+        lastUsed: f.lastUsed,
+        usageFrequency: f.usageFrequency,
+        attachment: f.attachment,
+        status: f.status,
+        description: f.description,
+        icon: f.icon,
+        detail: f.detail === null ? null : JSON.parse(f.detail),
+      }]);
+    }
+  }
+  rows.sort((a, b) => a[0] - b[0]);
+  return rows.map(([, item]) => item);
+}
+
+/**
+ * Fetch and decode catalog.bin.
+ * @param {string[]|null} rooms - Only decode these rooms (all by default)
+ * @returns {Promise<object[]>}
+ */
+export async function loadCatalogBin(rooms = null) {
+  const res = await fetch(new URL('../data/catalog.bin', import.meta.url));
+  if (!res.ok) throw new Error(`catalog.bin: HTTP ${res.status} (run scripts/build-catalog.py --binary)`);
+  return decodeCatalog(await res.arrayBuffer(), rooms);
+}
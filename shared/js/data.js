@@ -1,7 +1,7 @@
 // data.js — Sample household inventory (~500+ objects)
 // A realistic cluttered household with varied ages, usage, attachment, and sizes.
-
-import { deriveSize } from './store.js';
+// Items are authored in shared/data/items.js and expanded ahead of time by
+// scripts/build-catalog.py into shared/data/catalog.json, which is loaded here.
 
 export const TAG_DEFINITIONS = {
   room: [
@@ -19,548 +19,12 @@ export const TAG_DEFINITIONS = {
   size: ['XS', 'S', 'M', 'L', 'XL'],
 };
 
-// Raw data — compact format, expanded below
-const RAW = [
-  // ─── KITCHEN (~65 items) ───
-  { n: "Refrigerator", t: { room: "kitchen", category: "appliances", subcategory: "major" }, v: 500, d: "2018-03-10", l: "2026-02-09", u: "daily", a: "low", i: "🧊", desc: "Samsung French door, stainless", det: {"brand": "Samsung", "model": "RF28R7551SR", "color": "Stainless steel"}},
-  { n: "Stove/Oven", t: { room: "kitchen", category: "appliances", subcategory: "major" }, v: 400, d: "2018-03-10", l: "2026-02-09", u: "daily", a: "low", i: "🍳", desc: "Gas range, 5 burner", det: {"brand": "GE", "model": "JGBS66REKSS", "color": "Stainless steel"}},
-  { n: "Dishwasher", t: { room: "kitchen", category: "appliances", subcategory: "major" }, v: 200, d: "2018-03-10", l: "2026-02-09", u: "daily", a: "none", i: "🫧", desc: "Built-in Bosch", det: {"brand": "Bosch", "model": "SHPM88Z75N", "color": "Stainless steel"}},
-  { n: "Microwave", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 40, d: "2020-11-25", l: "2026-02-08", u: "daily", a: "none", i: "📡", desc: "Panasonic countertop", det: {"brand": "Panasonic", "model": "NN-SN966S", "color": "Stainless steel"}},
-  { n: "Stand Mixer", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 15, d: "2019-06-15", l: "2025-12-20", u: "weekly", a: "medium", i: "🍰", desc: "KitchenAid Artisan, red", det: {"brand": "KitchenAid", "model": "Artisan KSM150PS", "color": "Empire Red"}},
-  { n: "Coffee Maker", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 8, d: "2022-01-05", l: "2026-02-09", u: "daily", a: "medium", i: "☕", desc: "Breville Barista Express", det: {"brand": "Breville", "model": "Barista Express BES870XL", "color": "Brushed stainless"}},
-  { n: "Toaster", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 6, d: "2021-08-12", l: "2026-02-07", u: "weekly", a: "none", i: "🍞", desc: "4-slice, chrome", det: {"brand": "Cuisinart", "model": "CPT-180", "color": "Chrome"}},
-  { n: "Blender", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 7, d: "2020-05-20", l: "2025-11-15", u: "weekly", a: "low", i: "🥤", desc: "Vitamix", det: {"brand": "Vitamix", "model": "Explorian E310", "color": "Black"}},
-  { n: "Electric Kettle", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 3, d: "2023-02-14", l: "2026-02-09", u: "daily", a: "low", i: "🫖", desc: "Fellow Stagg", det: {"brand": "Fellow", "model": "Stagg EKG", "color": "Matte black"}},
-  { n: "Food Processor", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 12, d: "2019-12-25", l: "2024-06-10", u: "rarely", a: "low", i: "🔪", desc: "Cuisinart 14-cup", det: {"brand": "Cuisinart", "model": "DFP-14BCWN", "color": "White"}},
-  { n: "Slow Cooker", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 15, d: "2017-11-20", l: "2024-01-15", u: "rarely", a: "none", i: "🍲", desc: "Crock-Pot, 6 quart", det: {"brand": "Crock-Pot", "model": "SCV600-B", "color": "Black"}},
-  { n: "Rice Cooker", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 8, d: "2021-03-08", l: "2026-01-28", u: "weekly", a: "low", i: "🍚", desc: "Zojirushi 5-cup", det: {"brand": "Zojirushi", "model": "NS-ZCC10", "color": "Champagne gold"}},
-  { n: "Air Fryer", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 15, d: "2023-12-25", l: "2026-02-05", u: "weekly", a: "low", i: "🍟", desc: "Ninja, 5.5 quart", det: {"brand": "Ninja", "model": "AF161", "color": "Grey"}},
-  { n: "Instant Pot", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 14, d: "2020-06-15", l: "2025-03-10", u: "monthly", a: "low", i: "♨️", desc: "Duo 8 quart, barely used", det: {"brand": "Instant Pot", "model": "Duo 80 v2", "color": "Stainless/black"}},
-  { n: "Waffle Maker", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 5, d: "2018-12-25", l: "2023-04-02", u: "rarely", a: "none", i: "🧇", desc: "Belgian style, gift", det: {"brand": "Cuisinart", "model": "WAF-F20", "color": "Silver"}},
-  { n: "Bread Machine", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 20, d: "2020-04-15", l: "2021-06-30", u: "never", a: "none", i: "🍞", desc: "Pandemic purchase, used 3 times", det: {"brand": "Zojirushi", "model": "BB-PDC20", "color": "Black"}},
-  { n: "Juicer", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 10, d: "2019-01-02", l: "2020-03-15", u: "never", a: "none", i: "🧃", desc: "New Year's resolution purchase", det: {"brand": "Breville", "model": "Juice Fountain Plus JE98XL", "color": "Silver"}},
-  { n: "Cast Iron Skillet", t: { room: "kitchen", category: "kitchenware", subcategory: "cookware" }, v: 4, d: "2015-08-10", l: "2026-02-08", u: "daily", a: "high", i: "🍳", desc: "Lodge 12-inch, seasoned perfectly", det: {"brand": "Lodge", "material": "Cast iron", "color": "Black"}},
-  { n: "Dutch Oven", t: { room: "kitchen", category: "kitchenware", subcategory: "cookware" }, v: 10, d: "2016-12-25", l: "2026-01-20", u: "weekly", a: "high", i: "🫕", desc: "Le Creuset, flame orange", det: {"brand": "Le Creuset", "material": "Enameled cast iron", "color": "Flame orange"}},
-  { n: "Nonstick Pan Set", t: { room: "kitchen", category: "kitchenware", subcategory: "cookware" }, v: 12, d: "2022-07-04", l: "2026-02-09", u: "daily", a: "low", i: "🍳", desc: "T-fal 3-piece set", det: {"brand": "T-fal", "material": "Aluminum/nonstick", "color": "Black"}},
-  { n: "Stock Pot", t: { room: "kitchen", category: "kitchenware", subcategory: "cookware" }, v: 15, d: "2017-03-15", l: "2025-11-28", u: "monthly", a: "low", i: "🍲", desc: "12 quart, stainless", det: {"brand": "Cuisinart", "material": "Stainless steel", "color": "Silver"}},
-  { n: "Baking Sheets (4)", t: { room: "kitchen", category: "kitchenware", subcategory: "bakeware" }, v: 6, d: "2019-09-10", l: "2026-02-01", u: "weekly", a: "none", i: "🍪", desc: "Half-sheet pans, warped", det: {"brand": "Nordic Ware", "material": "Aluminum", "color": "Natural"}},
-  { n: "Mixing Bowls Set", t: { room: "kitchen", category: "kitchenware", subcategory: "prep" }, v: 8, d: "2018-06-20", l: "2026-02-05", u: "weekly", a: "low", i: "🥣", desc: "Stainless steel, nested, 5-piece", det: {"brand": "Cuisinart", "material": "Stainless steel", "color": "Silver"}},
-  { n: "Cutting Board Collection", t: { room: "kitchen", category: "kitchenware", subcategory: "prep" }, v: 5, d: "2017-01-15", l: "2026-02-09", u: "daily", a: "low", i: "🪵", desc: "3 wood, 2 plastic", det: {"material": "3 maple, 2 HDPE plastic", "brand": "John Boos / OXO"}},
-  { n: "Knife Block Set", t: { room: "kitchen", category: "kitchenware", subcategory: "utensils" }, v: 4, d: "2019-12-25", l: "2026-02-09", u: "daily", a: "medium", i: "🔪", desc: "Wusthof 8-piece", det: {"brand": "Wüsthof", "model": "Classic 8-piece", "material": "High-carbon stainless steel"}},
-  { n: "Utensil Crock", t: { room: "kitchen", category: "kitchenware", subcategory: "utensils" }, v: 3, d: "2018-04-10", l: "2026-02-09", u: "daily", a: "none", i: "🥄", desc: "Ceramic crock with 15+ utensils", det: {"material": "Ceramic", "color": "White", "contents": "Wooden spoons, silicone spatulas, ladle, whisk, tongs"}},
-  { n: "Colander", t: { room: "kitchen", category: "kitchenware", subcategory: "prep" }, v: 3, d: "2016-05-20", l: "2026-02-03", u: "weekly", a: "none", i: "🫗", desc: "Stainless steel", det: {"brand": "OXO", "material": "Stainless steel", "color": "Silver"}},
-  { n: "Measuring Cups & Spoons", t: { room: "kitchen", category: "kitchenware", subcategory: "prep" }, v: 1, d: "2018-06-20", l: "2026-02-05", u: "weekly", a: "none", i: "🥄", desc: "3 duplicate sets", det: {"brand": "OXO / KitchenAid / unknown", "material": "Stainless steel + plastic"}},
-  { n: "Tupperware Drawer", t: { room: "kitchen", category: "kitchenware", subcategory: "storage" }, v: 20, d: "2015-01-01", l: "2026-02-09", u: "daily", a: "none", i: "📦", desc: "Overflowing, many missing lids", det: {"brand": "Mixed — Rubbermaid, Pyrex, takeout containers", "material": "Plastic + glass"}},
-  { n: "Mugs (12)", t: { room: "kitchen", category: "kitchenware", subcategory: "drinkware" }, v: 6, d: "2014-01-01", l: "2026-02-09", u: "daily", a: "medium", i: "☕", desc: "Collection from travels and gifts", det: {"contents": "Portland souvenir, 'World's Best Dog Dad', IKEA white, handmade pottery (2), conference swag, chipped favorites"}},
-  { n: "Wine Glasses (8)", t: { room: "kitchen", category: "kitchenware", subcategory: "drinkware" }, v: 5, d: "2019-10-15", l: "2025-12-31", u: "monthly", a: "low", i: "🍷", desc: "Riedel stemless", det: {"brand": "Riedel", "material": "Crystal", "color": "Clear"}},
-  { n: "Plates Set", t: { room: "kitchen", category: "kitchenware", subcategory: "dinnerware" }, v: 10, d: "2018-03-10", l: "2026-02-09", u: "daily", a: "low", i: "🍽️", desc: "12 dinner, 12 salad plates", det: {"brand": "Crate & Barrel", "material": "Stoneware", "color": "White"}},
-  { n: "Bowls Set", t: { room: "kitchen", category: "kitchenware", subcategory: "dinnerware" }, v: 6, d: "2018-03-10", l: "2026-02-09", u: "daily", a: "low", i: "🥣", desc: "12 cereal bowls", det: {"brand": "Crate & Barrel", "material": "Stoneware", "color": "White"}},
-  { n: "Old Plates (mismatched)", t: { room: "kitchen", category: "kitchenware", subcategory: "dinnerware" }, v: 8, d: "2012-06-01", l: "2024-07-04", u: "rarely", a: "low", i: "🍽️", desc: "From college, chipped", det: {"brand": "Mixed — IKEA, Target, thrift store", "material": "Ceramic", "color": "Assorted"}},
-  { n: "Spice Rack", t: { room: "kitchen", category: "food", subcategory: "pantry" }, v: 3, d: "2020-01-10", l: "2026-02-09", u: "daily", a: "none", i: "🧂", desc: "30+ jars, some expired", det: {"contents": "Cumin, paprika, oregano, thyme, cinnamon, turmeric, chili powder, garlic powder, onion powder, bay leaves, expired saffron, and 18+ more"}},
-  { n: "Expired Canned Goods", t: { room: "kitchen", category: "food", subcategory: "pantry" }, v: 8, d: "2021-03-01", l: null, u: "never", a: "none", i: "🥫", desc: "Pandemic stockpile, 15+ cans expired", det: {"contents": "Chickpeas (4), diced tomatoes (3), black beans (3), coconut milk (2), corn (2), soup (3) — most expired 2023"}},
-  { n: "Reusable Bags (pile)", t: { room: "kitchen", category: "supplies", subcategory: "bags" }, v: 5, d: "2018-01-01", l: "2026-02-08", u: "weekly", a: "none", i: "🛍️", desc: "20+ bags stuffed in a drawer", det: {"brand": "Trader Joe's, Whole Foods, Baggu, conference totes", "material": "Cotton + nylon"}},
-  { n: "Takeout Menus", t: { room: "kitchen", category: "supplies", subcategory: "paper" }, v: 0.5, d: "2016-01-01", l: null, u: "never", a: "none", i: "📋", desc: "Stack of 30, all available online", det: {"contents": "Thai Palace, Jade Garden, Luigi's, Sushi Zen, and ~26 more"}},
-  { n: "Random Drawer Stuff", t: { room: "kitchen", category: "supplies", subcategory: "junk_drawer" }, v: 3, d: "2015-01-01", l: "2026-01-15", u: "monthly", a: "none", i: "🗃️", desc: "Batteries, tape, rubber bands, menus, pens", det: {"contents": "AA batteries (6), Scotch tape, rubber bands, twist ties, pens (9), Sharpie, scissors, superglue"}},
-  { n: "Paper Towels (bulk)", t: { room: "kitchen", category: "supplies", subcategory: "consumables" }, v: 30, d: "2025-12-01", l: "2026-02-09", u: "daily", a: "none", i: "🧻", desc: "Costco 12-pack", det: {"brand": "Bounty"}},
-  { n: "Plastic Wrap/Foil", t: { room: "kitchen", category: "supplies", subcategory: "consumables" }, v: 2, d: "2025-06-01", l: "2026-02-07", u: "weekly", a: "none", i: "🫙", desc: "3 boxes of various wraps", det: {"brand": "Reynolds Wrap, Glad, Bee's Wrap"}},
-  { n: "Kitchen Table", t: { room: "kitchen", category: "furniture", subcategory: "dining" }, v: 200, d: "2018-03-10", l: "2026-02-09", u: "daily", a: "medium", i: "🪑", desc: "Solid oak, 4-seater", det: {"brand": "Room & Board", "material": "Solid white oak", "color": "Natural"}},
-  { n: "Kitchen Chairs (4)", t: { room: "kitchen", category: "furniture", subcategory: "dining" }, v: 120, d: "2018-03-10", l: "2026-02-09", u: "daily", a: "low", i: "🪑", desc: "Matching oak chairs", det: {"brand": "Room & Board", "material": "White oak", "color": "Natural"}},
-  { n: "Cookbook Collection", t: { room: "kitchen", category: "books", subcategory: "cookbooks" }, v: 8, d: "2014-01-01", l: "2025-08-15", u: "monthly", a: "medium", i: "📚", desc: "15 cookbooks, most unused", det: {"titles": [{"title": "Salt Fat Acid Heat", "author": "Samin Nosrat"}, {"title": "The Food Lab", "author": "J. Kenji López-Alt"}, {"title": "Essentials of Classic Italian Cooking", "author": "Marcella Hazan"}, {"title": "Tartine Bread", "author": "Chad Robertson"}, {"title": "Joy of Cooking", "author": "Irma S. Rombauer"}]}},
-
-  // ─── LIVING ROOM (~50 items) ───
-  { n: "Sofa", t: { room: "living_room", category: "furniture", subcategory: "seating" }, v: 800, d: "2019-04-20", l: "2026-02-09", u: "daily", a: "medium", i: "🛋️", desc: "3-seat sectional, gray fabric", det: {"brand": "Article", "model": "Sven", "material": "Polyester fabric", "color": "Birch grey"}},
-  { n: "Armchair", t: { room: "living_room", category: "furniture", subcategory: "seating" }, v: 250, d: "2020-08-15", l: "2026-02-09", u: "daily", a: "medium", i: "💺", desc: "Mid-century modern, leather", det: {"brand": "West Elm", "material": "Top-grain leather", "color": "Saddle brown"}},
-  { n: "Coffee Table", t: { room: "living_room", category: "furniture", subcategory: "tables" }, v: 120, d: "2019-04-20", l: "2026-02-09", u: "daily", a: "low", i: "🪵", desc: "Walnut, rectangular", det: {"brand": "West Elm", "material": "Solid walnut", "color": "Natural walnut"}},
-  { n: "Side Table", t: { room: "living_room", category: "furniture", subcategory: "tables" }, v: 30, d: "2019-06-01", l: "2026-02-09", u: "daily", a: "none", i: "🪵", desc: "Small round, holds lamp", det: {"brand": "IKEA", "model": "Listerby", "material": "Oak veneer", "color": "Natural"}},
-  { n: "TV Stand", t: { room: "living_room", category: "furniture", subcategory: "media" }, v: 150, d: "2019-04-20", l: "2026-02-09", u: "daily", a: "none", i: "📺", desc: "IKEA media console", det: {"brand": "IKEA", "model": "Bestå", "material": "Particleboard", "color": "Black-brown"}},
-  { n: "Bookshelf", t: { room: "living_room", category: "furniture", subcategory: "storage" }, v: 200, d: "2018-08-01", l: "2026-02-09", u: "daily", a: "low", i: "📚", desc: "Tall Billy, overflowing", det: {"brand": "IKEA", "model": "Billy", "material": "Particleboard", "color": "White"}},
-  { n: "TV (55\")", t: { room: "living_room", category: "electronics", subcategory: "entertainment" }, v: 40, d: "2021-11-26", l: "2026-02-09", u: "daily", a: "low", i: "📺", desc: "LG OLED", det: {"brand":"LG","model":"OLED55C1PUB","color":"Black"} },
-  { n: "Old TV (42\")", t: { room: "storage", category: "electronics", subcategory: "entertainment" }, v: 35, d: "2016-03-15", l: "2021-11-26", u: "never", a: "none", i: "📺", desc: "Replaced, sitting in storage", det: {"brand":"Samsung","model":"UN42F5500","color":"Black"} },
-  { n: "Soundbar", t: { room: "living_room", category: "electronics", subcategory: "audio" }, v: 5, d: "2022-06-18", l: "2026-02-09", u: "daily", a: "low", i: "🔊", desc: "Sonos Beam", det: {"brand": "Sonos", "model": "Beam Gen 2", "color": "Black"}},
-  { n: "Bluetooth Speaker", t: { room: "living_room", category: "electronics", subcategory: "audio" }, v: 2, d: "2020-12-25", l: "2026-01-15", u: "weekly", a: "low", i: "🔈", desc: "JBL Flip, portable", det: {"brand": "JBL", "model": "Flip 5", "color": "Blue"}},
-  { n: "Old Bluetooth Speaker", t: { room: "storage", category: "electronics", subcategory: "audio" }, v: 2, d: "2017-06-01", l: "2020-12-25", u: "never", a: "none", i: "🔈", desc: "Battery barely holds charge", det: {"brand": "UE", "model": "Boom 2", "color": "Phantom Black"}},
-  { n: "Gaming Console", t: { room: "living_room", category: "electronics", subcategory: "gaming" }, v: 8, d: "2020-11-12", l: "2026-02-08", u: "weekly", a: "medium", i: "🎮", desc: "PlayStation 5", det: {"brand": "Sony", "model": "PlayStation 5 Disc Edition", "color": "White"}},
-  { n: "Old Gaming Console", t: { room: "storage", category: "electronics", subcategory: "gaming" }, v: 6, d: "2013-11-15", l: "2020-11-12", u: "never", a: "medium", i: "🎮", desc: "PS4, still works, nostalgia", det: {"brand": "Sony", "model": "PlayStation 4 Slim 1TB", "color": "Black"}},
-  { n: "Game Controllers (4)", t: { room: "living_room", category: "electronics", subcategory: "gaming" }, v: 2, d: "2020-11-12", l: "2026-02-08", u: "weekly", a: "low", i: "🎮", desc: "2 current, 2 from old console", det: {"brand": "Sony DualSense (2), DualShock 4 (2)", "color": "White (2), black (2)"}},
-  { n: "Video Games (physical)", t: { room: "living_room", category: "media", subcategory: "games" }, v: 4, d: "2015-01-01", l: "2024-06-01", u: "rarely", a: "medium", i: "💿", desc: "~20 disc games, mostly digital now", det: {"titles": ["The Last of Us Part II", "Red Dead Redemption 2", "God of War", "Horizon Zero Dawn", "Ghost of Tsushima", "Uncharted 4"]}},
-  { n: "DVD/Blu-ray Collection", t: { room: "living_room", category: "media", subcategory: "movies" }, v: 15, d: "2012-01-01", l: "2023-01-01", u: "never", a: "low", i: "💿", desc: "~60 discs, all available on streaming", det: {"titles": ["The Lord of the Rings trilogy", "Inception", "The Dark Knight", "Pulp Fiction", "Spirited Away", "The Grand Budapest Hotel"]}},
-  { n: "Vinyl Record Collection", t: { room: "living_room", category: "media", subcategory: "music" }, v: 25, d: "2016-01-01", l: "2026-01-20", u: "monthly", a: "high", i: "🎵", desc: "~50 records, curated", det: {"titles": ["Rumours — Fleetwood Mac", "Kind of Blue — Miles Davis", "OK Computer — Radiohead", "Abbey Road — The Beatles", "To Pimp a Butterfly — Kendrick Lamar", "Blue — Joni Mitchell"]}},
-  { n: "Record Player", t: { room: "living_room", category: "electronics", subcategory: "audio" }, v: 12, d: "2016-06-15", l: "2026-01-20", u: "monthly", a: "high", i: "🎶", desc: "Audio-Technica LP120", det: {"brand": "Audio-Technica", "model": "AT-LP120XUSB", "color": "Silver"}},
-  { n: "Throw Pillows (6)", t: { room: "living_room", category: "decor", subcategory: "textiles" }, v: 15, d: "2019-04-20", l: "2026-02-09", u: "daily", a: "low", i: "🛋️", desc: "Assorted, some flattened", det: {"brand": "West Elm (2), Target (2), handmade (2)", "material": "Linen + velvet", "color": "Cream, sage, terracotta"}},
-  { n: "Throw Blanket", t: { room: "living_room", category: "linens", subcategory: "blankets" }, v: 5, d: "2021-12-25", l: "2026-02-09", u: "daily", a: "medium", i: "🧶", desc: "Chunky knit, from mom", det: {"material": "Chunky knit wool blend", "color": "Cream"}},
-  { n: "Area Rug", t: { room: "living_room", category: "decor", subcategory: "rugs" }, v: 30, d: "2019-05-10", l: "2026-02-09", u: "daily", a: "low", i: "🪢", desc: "8x10 wool rug", det: {"brand": "Rugs USA", "material": "Hand-tufted wool", "color": "Ivory/navy geometric"}},
-  { n: "Floor Lamp", t: { room: "living_room", category: "decor", subcategory: "lighting" }, v: 10, d: "2019-06-01", l: "2026-02-09", u: "daily", a: "low", i: "💡", desc: "Arc lamp, brass", det: {"brand": "West Elm", "model": "Overarching Metal Shade", "material": "Brass", "color": "Antique brass"}},
-  { n: "Table Lamp", t: { room: "living_room", category: "decor", subcategory: "lighting" }, v: 3, d: "2020-03-15", l: "2026-02-09", u: "daily", a: "none", i: "💡", desc: "Ceramic base", det: {"brand": "Target", "material": "Ceramic base, linen shade", "color": "White/cream"}},
-  { n: "Candles (collection)", t: { room: "living_room", category: "decor", subcategory: "accessories" }, v: 3, d: "2022-01-01", l: "2026-02-01", u: "weekly", a: "low", i: "🕯️", desc: "8 candles, various states of use", det: {"brand": "Diptyque (1), Yankee Candle (3), Target (2), homemade (2)", "contents": "Baies, vanilla, cedar, lavender, pine"}},
-  { n: "Wall Art (3 pieces)", t: { room: "living_room", category: "decor", subcategory: "wall_art" }, v: 5, d: "2019-06-01", l: "2026-02-09", u: "daily", a: "medium", i: "🖼️", desc: "Framed prints", det: {"contents": "Abstract watercolor print, vintage botanical poster, photo print of Joshua Tree"}},
-  { n: "Photo Frames (5)", t: { room: "living_room", category: "decor", subcategory: "accessories" }, v: 2, d: "2017-01-01", l: "2026-02-09", u: "daily", a: "high", i: "📸", desc: "Family photos", det: {"brand": "CB2, IKEA, Target", "material": "Wood + metal", "contents": "Wedding, family vacation, dog, siblings, graduation"}},
-  { n: "Plants (3)", t: { room: "living_room", category: "decor", subcategory: "plants" }, v: 15, d: "2022-04-01", l: "2026-02-09", u: "weekly", a: "medium", i: "🪴", desc: "Monstera, pothos, snake plant", det: {"contents": "Monstera deliciosa, golden pothos, snake plant (Sansevieria)"}},
-  { n: "Magazine Stack", t: { room: "living_room", category: "media", subcategory: "print" }, v: 4, d: "2020-01-01", l: null, u: "never", a: "none", i: "📰", desc: "2 years of unread New Yorkers", det: {"brand": "The New Yorker", "contents": "~104 issues, Jan 2020 – Dec 2021"}},
-  { n: "Board Games", t: { room: "living_room", category: "toys", subcategory: "games" }, v: 20, d: "2018-01-01", l: "2025-12-25", u: "monthly", a: "medium", i: "🎲", desc: "8 games, played maybe twice a year", det: {"titles": ["Catan", "Ticket to Ride", "Codenames", "Pandemic", "Wingspan", "Azul", "Exploding Kittens", "Scrabble"]}},
-  { n: "Puzzle (unopened)", t: { room: "living_room", category: "toys", subcategory: "puzzles" }, v: 3, d: "2024-12-25", l: null, u: "never", a: "low", i: "🧩", desc: "Gift, 1000 pieces", det: {"brand": "Ravensburger", "contents": "1000-piece, National Geographic ocean reef"}},
-  { n: "Remote Controls (5)", t: { room: "living_room", category: "electronics", subcategory: "accessories" }, v: 0.5, d: "2016-01-01", l: "2026-02-09", u: "daily", a: "none", i: "📱", desc: "TV, soundbar, old devices, unknown", det: {"contents": "LG TV, Sonos, Apple TV, PS5, 1 unknown"}},
-  { n: "Charging Cables (tangled)", t: { room: "living_room", category: "electronics", subcategory: "cables" }, v: 1, d: "2018-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🔌", desc: "10+ cables, half unknown purpose", det: {"contents": "USB-C (4), Lightning (3), Micro-USB (2), USB-A-to-C (1)"}},
-
-  // ─── BEDROOM (~35 items) ───
-  { n: "Bed Frame (Queen)", t: { room: "bedroom", category: "furniture", subcategory: "bed" }, v: 400, d: "2019-07-01", l: "2026-02-09", u: "daily", a: "low", i: "🛏️", desc: "Platform bed, wood", det: {"brand": "Thuma", "model": "The Bed", "material": "Solid walnut", "color": "Natural walnut"}},
-  { n: "Mattress (Queen)", t: { room: "bedroom", category: "furniture", subcategory: "bed" }, v: 300, d: "2019-07-01", l: "2026-02-09", u: "daily", a: "low", i: "🛏️", desc: "Memory foam, needs replacing", det: {"brand": "Casper", "model": "Original Mattress", "material": "Memory foam + spring"}},
-  { n: "Nightstands (2)", t: { room: "bedroom", category: "furniture", subcategory: "tables" }, v: 60, d: "2019-07-01", l: "2026-02-09", u: "daily", a: "none", i: "🪵", desc: "Matching pair", det: {"brand": "Thuma", "material": "Solid walnut", "color": "Natural walnut"}},
-  { n: "Dresser", t: { room: "bedroom", category: "furniture", subcategory: "storage" }, v: 200, d: "2017-09-01", l: "2026-02-09", u: "daily", a: "low", i: "🗄️", desc: "6-drawer, overstuffed", det: {"brand": "IKEA", "model": "Hemnes 6-drawer", "material": "Pine", "color": "White stain"}},
-  { n: "Bedside Lamp (2)", t: { room: "bedroom", category: "decor", subcategory: "lighting" }, v: 3, d: "2019-07-15", l: "2026-02-09", u: "daily", a: "none", i: "💡", desc: "Matching pair", det: {"brand": "CB2", "material": "Ceramic + linen shade", "color": "Warm grey"}},
-  { n: "Alarm Clock", t: { room: "bedroom", category: "electronics", subcategory: "clocks" }, v: 0.5, d: "2016-04-01", l: "2026-02-09", u: "daily", a: "none", i: "⏰", desc: "Digital, use phone instead", det: {"brand": "Casio", "model": "TQ-140", "color": "Black"}},
-  { n: "Sheets (4 sets)", t: { room: "bedroom", category: "linens", subcategory: "bedding" }, v: 10, d: "2018-01-01", l: "2026-02-06", u: "weekly", a: "low", i: "🛏️", desc: "2 good, 1 pilled, 1 wrong size", det: {"brand": "Brooklinen (2), Target (1), unknown (1)", "material": "Percale (2), sateen (1), microfiber (1)", "color": "White, grey, navy, floral"}},
-  { n: "Comforter", t: { room: "bedroom", category: "linens", subcategory: "bedding" }, v: 15, d: "2020-10-15", l: "2026-02-09", u: "daily", a: "low", i: "🛏️", desc: "Down alternative, white", det: {"brand": "Buffy", "material": "Eucalyptus fiber, down alternative", "color": "White"}},
-  { n: "Extra Blankets (3)", t: { room: "bedroom", category: "linens", subcategory: "bedding" }, v: 12, d: "2015-01-01", l: "2025-12-15", u: "rarely", a: "low", i: "🧶", desc: "Winter extras, stuffed in closet", det: {"brand": "Pendleton (1), L.L. Bean (1), IKEA (1)", "material": "Wool (2), fleece (1)", "color": "Plaid, green, grey"}},
-  { n: "Pillows (6)", t: { room: "bedroom", category: "linens", subcategory: "bedding" }, v: 18, d: "2019-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🛏️", desc: "2 good, 4 flat and old", det: {"brand": "Coop (2), Casper (2), flat unknown (2)", "material": "Memory foam (4), polyester (2)"}},
-  { n: "Jewelry Box", t: { room: "bedroom", category: "decor", subcategory: "accessories" }, v: 1, d: "2014-06-15", l: "2026-02-08", u: "daily", a: "high", i: "💍", desc: "Inherited, wooden", det: {"material": "Walnut with velvet lining", "contents": "Rings (4), necklaces (6), bracelets (3), earrings (8 pairs), grandma's brooch"}},
-  { n: "Perfume/Cologne Collection", t: { room: "bedroom", category: "toiletries", subcategory: "fragrance" }, v: 2, d: "2018-01-01", l: "2026-02-09", u: "daily", a: "medium", i: "✨", desc: "6 bottles, 2 nearly empty", det: {"brand": "Le Labo Santal 33, Byredo Gypsy Water, Tom Ford Oud Wood, Aesop, Acqua di Gio, Chloe"}},
-  { n: "Framed Photo (bedside)", t: { room: "bedroom", category: "decor", subcategory: "accessories" }, v: 0.3, d: "2020-02-14", l: "2026-02-09", u: "daily", a: "high", i: "📸", desc: "Partner photo", det: {"contents": "5×7 photo from Amalfi Coast trip, silver frame"}},
-  { n: "Book on Nightstand", t: { room: "bedroom", category: "books", subcategory: "current" }, v: 0.5, d: "2025-11-01", l: "2026-02-03", u: "weekly", a: "low", i: "📖", desc: "Half-read novel", det: {"titles": [{"title": "Tomorrow, and Tomorrow, and Tomorrow", "author": "Gabrielle Zevin"}]}},
-  { n: "Under-bed Storage Bins (3)", t: { room: "bedroom", category: "supplies", subcategory: "storage" }, v: 90, d: "2019-08-01", l: "2024-01-15", u: "rarely", a: "none", i: "📦", desc: "Old clothes, unknown contents", det: {"brand": "Sterilite", "material": "Plastic", "contents": "Old clothes (1), winter accessories (1), mystery box (1)"}},
-
-  // ─── CLOSET / CLOTHING (~80 items) ───
-  { n: "Winter Jackets (3)", t: { room: "closet", category: "clothing", subcategory: "outerwear" }, v: 30, d: "2016-01-01", l: "2026-01-15", u: "monthly", a: "medium", i: "🧥", desc: "Parka, puffer, rain jacket", det: {"brand": "North Face (parka), Patagonia (puffer), Columbia (rain)", "color": "Black, navy, olive"}},
-  { n: "Light Jackets (4)", t: { room: "closet", category: "clothing", subcategory: "outerwear" }, v: 16, d: "2017-01-01", l: "2026-02-05", u: "weekly", a: "low", i: "🧥", desc: "Denim, bomber, fleece, windbreaker", det: {"brand": "Levi's (denim), Alpha Industries (bomber), Patagonia (fleece), Nike (windbreaker)", "color": "Blue, black, grey, black"}},
-  { n: "Blazer (never worn)", t: { room: "closet", category: "clothing", subcategory: "outerwear" }, v: 3, d: "2019-03-01", l: null, u: "never", a: "none", i: "🧥", desc: "Bought for interview, tags still on", det: {"brand": "J.Crew", "material": "Wool blend", "color": "Charcoal grey"}},
-  { n: "T-shirts (25)", t: { room: "closet", category: "clothing", subcategory: "tops" }, v: 12, d: "2014-01-01", l: "2026-02-09", u: "daily", a: "low", i: "👕", desc: "10 worn regularly, 15 rarely/never", det: {"brand": "Uniqlo (5), H&M (4), Target (3), band merch (8), promo (5)", "color": "Black (8), white (5), grey (4), assorted (8)"}},
-  { n: "Button-down Shirts (8)", t: { room: "closet", category: "clothing", subcategory: "tops" }, v: 8, d: "2016-01-01", l: "2025-12-20", u: "monthly", a: "low", i: "👔", desc: "Some too tight, kept 'just in case'", det: {"brand": "J.Crew (3), Charles Tyrwhitt (2), Uniqlo (2), Brooks Brothers (1)", "color": "White (3), blue (3), striped (2)"}},
-  { n: "Sweaters (6)", t: { room: "closet", category: "clothing", subcategory: "tops" }, v: 10, d: "2017-01-01", l: "2026-01-25", u: "weekly", a: "medium", i: "🧶", desc: "3 favorites, 3 never worn", det: {"brand": "J.Crew (2), Everlane (1), hand-knit (1), H&M (2)", "material": "Merino wool (3), cotton (2), acrylic (1)", "color": "Navy (2), cream (2), burgundy, green"}},
-  { n: "Hoodies (5)", t: { room: "closet", category: "clothing", subcategory: "tops" }, v: 10, d: "2016-01-01", l: "2026-02-09", u: "weekly", a: "medium", i: "🧥", desc: "2 daily wear, 3 sentimental college ones", det: {"brand": "Nike (1), Champion (1), college bookstore (2), brewery (1)", "color": "Grey (2), navy, maroon, black"}},
-  { n: "Tank Tops (6)", t: { room: "closet", category: "clothing", subcategory: "tops" }, v: 2, d: "2018-01-01", l: "2025-08-15", u: "rarely", a: "none", i: "👕", desc: "Summer only", det: {"brand": "Hanes (3), H&M (2), Uniqlo (1)", "color": "White (3), black (2), grey (1)"}},
-  { n: "Jeans (6)", t: { room: "closet", category: "clothing", subcategory: "bottoms" }, v: 8, d: "2017-01-01", l: "2026-02-09", u: "daily", a: "low", i: "👖", desc: "2 fit well, 2 too tight, 2 worn out", det: {"brand": "Levi's 501 (2), Levi's 511 (2), Gap (1), APC (1)", "color": "Indigo (3), black (1), light wash (2)"}},
-  { n: "Dress Pants (3)", t: { room: "closet", category: "clothing", subcategory: "bottoms" }, v: 4, d: "2018-06-01", l: "2025-05-15", u: "rarely", a: "none", i: "👖", desc: "Work from home, rarely needed", det: {"brand": "J.Crew (2), Banana Republic (1)", "material": "Wool blend", "color": "Navy, charcoal, khaki"}},
-  { n: "Shorts (5)", t: { room: "closet", category: "clothing", subcategory: "bottoms" }, v: 3, d: "2019-01-01", l: "2025-09-01", u: "rarely", a: "none", i: "🩳", desc: "Summer only", det: {"brand": "Patagonia Baggies (2), J.Crew (2), Nike (1)", "color": "Navy (2), khaki, olive, black"}},
-  { n: "Sweatpants (4)", t: { room: "closet", category: "clothing", subcategory: "bottoms" }, v: 5, d: "2020-03-15", l: "2026-02-09", u: "daily", a: "low", i: "👖", desc: "WFH staples", det: {"brand": "Nike (2), Champion (1), Outdoor Voices (1)", "color": "Grey (2), black, navy"}},
-  { n: "Underwear Drawer", t: { room: "closet", category: "clothing", subcategory: "underwear" }, v: 3, d: "2018-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🧦", desc: "30+ pairs, some with holes", det: {"brand": "Calvin Klein (10), Uniqlo (8), unknown (12+)", "material": "Cotton + modal"}},
-  { n: "Sock Drawer", t: { room: "closet", category: "clothing", subcategory: "underwear" }, v: 3, d: "2018-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🧦", desc: "25+ pairs, many orphaned", det: {"brand": "Bombas (6), Darn Tough (4), random (15+)", "material": "Merino wool, cotton, synthetic"}},
-  { n: "Running Shoes", t: { room: "closet", category: "clothing", subcategory: "shoes" }, v: 4, d: "2024-03-01", l: "2026-02-07", u: "weekly", a: "low", i: "👟", desc: "Nike, current pair", det: {"brand": "Nike", "model": "Pegasus 40", "color": "Black/white"}},
-  { n: "Old Running Shoes", t: { room: "closet", category: "clothing", subcategory: "shoes" }, v: 4, d: "2022-01-15", l: "2024-03-01", u: "never", a: "none", i: "👟", desc: "Worn out, kept as 'yard shoes'", det: {"brand": "Nike", "model": "Pegasus 38", "color": "Grey/volt"}},
-  { n: "Dress Shoes", t: { room: "closet", category: "clothing", subcategory: "shoes" }, v: 4, d: "2018-10-01", l: "2025-06-15", u: "rarely", a: "low", i: "👞", desc: "Oxford, black leather", det: {"brand": "Allen Edmonds", "model": "Park Avenue", "material": "Leather", "color": "Black"}},
-  { n: "Boots", t: { room: "closet", category: "clothing", subcategory: "shoes" }, v: 6, d: "2019-11-01", l: "2026-01-20", u: "monthly", a: "medium", i: "🥾", desc: "Waterproof hiking boots", det: {"brand": "Merrell", "model": "Moab 3 Mid Waterproof", "color": "Earth/espresso"}},
-  { n: "Sandals (2 pair)", t: { room: "closet", category: "clothing", subcategory: "shoes" }, v: 3, d: "2020-06-01", l: "2025-08-30", u: "rarely", a: "none", i: "🩴", desc: "Flip-flops and Birkenstocks", det: {"brand": "Birkenstock Arizona (1), Havaianas (1)", "color": "Taupe, black"}},
-  { n: "Sneakers (casual)", t: { room: "closet", category: "clothing", subcategory: "shoes" }, v: 4, d: "2023-09-01", l: "2026-02-09", u: "daily", a: "low", i: "👟", desc: "White leather, daily wear", det: {"brand": "Common Projects", "model": "Achilles Low", "material": "Leather", "color": "White"}},
-  { n: "Worn-out Sneakers", t: { room: "closet", category: "clothing", subcategory: "shoes" }, v: 4, d: "2020-04-01", l: "2023-09-01", u: "never", a: "none", i: "👟", desc: "Should have been tossed", det: {"brand": "Adidas", "model": "Stan Smith", "color": "White/green, yellowed"}},
-  { n: "Scarves (4)", t: { room: "closet", category: "clothing", subcategory: "accessories" }, v: 2, d: "2016-01-01", l: "2026-01-10", u: "monthly", a: "medium", i: "🧣", desc: "2 winter, 1 gift from grandma, 1 never worn", det: {"brand": "Acne Studios (1), hand-knit (1), Uniqlo (2)", "material": "Wool (3), cashmere (1)", "color": "Burgundy, cream, grey, navy"}},
-  { n: "Hats (5)", t: { room: "closet", category: "clothing", subcategory: "accessories" }, v: 3, d: "2017-01-01", l: "2025-08-15", u: "rarely", a: "low", i: "🧢", desc: "Baseball caps, beanie, sun hat", det: {"brand": "New Era (1), Patagonia (1), local shop (2), hand-knit (1)", "contents": "Yankees cap, trucker hat, beanie, straw sun hat, embroidered beanie"}},
-  { n: "Belt Collection", t: { room: "closet", category: "clothing", subcategory: "accessories" }, v: 1, d: "2015-01-01", l: "2025-12-20", u: "monthly", a: "none", i: "👔", desc: "4 belts, wear 1", det: {"brand": "Allen Edmonds (1), J.Crew (1), Gap (1), braided (1)", "material": "Leather (3), woven (1)", "color": "Black, brown, tan, multi"}},
-  { n: "Ties (6)", t: { room: "closet", category: "clothing", subcategory: "accessories" }, v: 0.5, d: "2014-01-01", l: "2023-06-15", u: "never", a: "low", i: "👔", desc: "From office days, haven't worn in years", det: {"brand": "Brooks Brothers (3), Paul Smith (1), thrift (2)", "material": "Silk (4), knit (2)", "color": "Navy, burgundy, grey, striped"}},
-  { n: "Gloves & Mittens", t: { room: "closet", category: "clothing", subcategory: "accessories" }, v: 1, d: "2018-12-01", l: "2026-01-15", u: "monthly", a: "none", i: "🧤", desc: "3 pairs, 1 missing a glove", det: {"brand": "North Face (1), unknown (2)", "material": "Fleece, wool, leather", "color": "Black (2), brown"}},
-  { n: "Gym Bag", t: { room: "closet", category: "clothing", subcategory: "bags" }, v: 10, d: "2021-06-01", l: "2026-02-06", u: "weekly", a: "low", i: "🎒", desc: "Duffel bag", det: {"brand": "Adidas", "material": "Polyester", "color": "Black"}},
-  { n: "Backpack (daily)", t: { room: "closet", category: "clothing", subcategory: "bags" }, v: 15, d: "2022-08-01", l: "2026-02-09", u: "daily", a: "medium", i: "🎒", desc: "Aer City Pack", det: {"brand": "Aer", "model": "City Pack Pro", "material": "Cordura nylon", "color": "Black"}},
-  { n: "Old Backpack", t: { room: "storage", category: "clothing", subcategory: "bags" }, v: 15, d: "2016-05-01", l: "2022-08-01", u: "never", a: "low", i: "🎒", desc: "College backpack, zipper broken", det: {"brand": "JanSport", "model": "Right Pack", "material": "Canvas", "color": "Navy"}},
-  { n: "Suitcase (large)", t: { room: "closet", category: "clothing", subcategory: "bags" }, v: 80, d: "2018-06-01", l: "2025-07-15", u: "rarely", a: "low", i: "🧳", desc: "28-inch roller", det: {"brand": "Samsonite", "model": "Freeform 28\"", "material": "Polycarbonate", "color": "Black"}},
-  { n: "Carry-on Suitcase", t: { room: "closet", category: "clothing", subcategory: "bags" }, v: 40, d: "2020-02-01", l: "2025-10-20", u: "rarely", a: "low", i: "🧳", desc: "Away, hardshell", det: {"brand": "Away", "model": "The Carry-On", "material": "Polycarbonate", "color": "Navy"}},
-  { n: "Formal Outfit", t: { room: "closet", category: "clothing", subcategory: "formal" }, v: 5, d: "2019-05-01", l: "2024-09-15", u: "rarely", a: "medium", i: "👔", desc: "Suit, worn to 2 weddings", det: {"brand": "J.Crew Ludlow (suit), Charles Tyrwhitt (shirt)", "color": "Navy suit, white shirt"}},
-  { n: "Costume Box", t: { room: "closet", category: "clothing", subcategory: "costumes" }, v: 25, d: "2016-10-01", l: "2025-10-31", u: "rarely", a: "medium", i: "🎭", desc: "Halloween costumes, 5+ years worth", det: {"contents": "Inflatable dinosaur, vampire cape, 80s neon set, Hawaiian shirt + lei, pirate hat"}},
-  { n: "Old Concert T-shirts", t: { room: "closet", category: "clothing", subcategory: "tops" }, v: 5, d: "2012-01-01", l: "2024-06-01", u: "rarely", a: "high", i: "👕", desc: "10 shirts, memories from shows", det: {"contents": "Radiohead (2003), Arctic Monkeys (2014), Tame Impala (2016), Bon Iver (2012), LCD Soundsystem (2017), and 5 more"}},
-  { n: "College Sweatshirt", t: { room: "closet", category: "clothing", subcategory: "tops" }, v: 2, d: "2013-09-01", l: "2025-12-01", u: "monthly", a: "high", i: "🎓", desc: "Worn thin but can't let go", det: {"brand": "Champion", "color": "Maroon", "material": "Cotton/polyester"}},
-  { n: "Pajamas (3 sets)", t: { room: "closet", category: "clothing", subcategory: "sleepwear" }, v: 4, d: "2020-12-25", l: "2026-02-09", u: "daily", a: "low", i: "😴", desc: "1 worn nightly, 2 spare", det: {"brand": "L.L. Bean (1), Target (2)", "material": "Flannel (1), cotton (2)", "color": "Plaid, grey, navy"}},
-  { n: "Bathrobe", t: { room: "closet", category: "clothing", subcategory: "sleepwear" }, v: 3, d: "2021-12-25", l: "2026-02-09", u: "daily", a: "medium", i: "🛁", desc: "Plush, gift from partner", det: {"brand": "Parachute", "material": "Turkish cotton", "color": "White"}},
-  { n: "Athletic Wear", t: { room: "closet", category: "clothing", subcategory: "activewear" }, v: 6, d: "2022-01-01", l: "2026-02-07", u: "weekly", a: "low", i: "🏃", desc: "Leggings, shorts, tanks — 8 pieces", det: {"brand": "Nike (3), Lululemon (3), Under Armour (2)", "contents": "Leggings (2), shorts (3), tanks (3)"}},
-
-  // ─── BATHROOM (~40 items) ───
-  { n: "Towels (8)", t: { room: "bathroom", category: "linens", subcategory: "bath" }, v: 15, d: "2019-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🛁", desc: "4 good, 4 threadbare", det: {"brand": "Brooklinen (4), Target (4)", "material": "Turkish cotton", "color": "White (4), grey (2), blue (2)"}},
-  { n: "Hand Towels (6)", t: { room: "bathroom", category: "linens", subcategory: "bath" }, v: 3, d: "2019-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🛁", desc: "Assorted colors, mismatched", det: {"brand": "Mixed", "material": "Cotton", "color": "White, grey, blue — mismatched"}},
-  { n: "Bath Mat", t: { room: "bathroom", category: "linens", subcategory: "bath" }, v: 2, d: "2021-03-01", l: "2026-02-09", u: "daily", a: "none", i: "🛁", desc: "Memory foam", det: {"brand": "Gorilla Grip", "material": "Memory foam", "color": "Grey"}},
-  { n: "Shower Curtain", t: { room: "bathroom", category: "decor", subcategory: "bath" }, v: 1, d: "2022-05-01", l: "2026-02-09", u: "daily", a: "none", i: "🚿", desc: "Fabric, needs replacing", det: {"brand": "West Elm", "material": "Cotton canvas", "color": "White"}},
-  { n: "Medicine Cabinet Contents", t: { room: "bathroom", category: "toiletries", subcategory: "medicine" }, v: 3, d: "2018-01-01", l: "2026-02-09", u: "daily", a: "none", i: "💊", desc: "Advil, bandaids, 5 expired meds", det: {"contents": "Advil, Tylenol, bandaids, Neosporin, expired cough syrup, expired Benadryl, allergy meds, Tums"}},
-  { n: "Skincare Products (12)", t: { room: "bathroom", category: "toiletries", subcategory: "skincare" }, v: 4, d: "2022-01-01", l: "2026-02-09", u: "daily", a: "low", i: "✨", desc: "Moisturizer, serums, half-used samples", det: {"brand": "CeraVe (3), The Ordinary (4), samples (5)", "contents": "Cleanser, moisturizer, niacinamide, retinol, HA, vitamin C, SPF"}},
-  { n: "Shampoo/Conditioner (6 bottles)", t: { room: "bathroom", category: "toiletries", subcategory: "hair" }, v: 4, d: "2024-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🧴", desc: "3 current, 3 mostly-empty", det: {"brand": "Olaplex (2), Moroccan Oil (1), Pantene (1), hotel (2)"}},
-  { n: "Hair Dryer", t: { room: "bathroom", category: "appliances", subcategory: "personal_care" }, v: 3, d: "2020-06-01", l: "2026-02-08", u: "weekly", a: "none", i: "💨", desc: "Dyson knockoff", det: {"brand": "T3", "model": "Featherweight 3i", "color": "White"}},
-  { n: "Old Hair Dryer", t: { room: "bathroom", category: "appliances", subcategory: "personal_care" }, v: 3, d: "2016-03-01", l: "2020-06-01", u: "never", a: "none", i: "💨", desc: "Still in cabinet, replaced", det: {"brand": "Conair", "model": "InfinitiPRO", "color": "Pink"}},
-  { n: "Electric Toothbrush", t: { room: "bathroom", category: "appliances", subcategory: "personal_care" }, v: 0.5, d: "2023-01-15", l: "2026-02-09", u: "daily", a: "none", i: "🪥", desc: "Oral-B, extra heads in drawer", det: {"brand": "Oral-B", "model": "iO Series 9", "color": "Black onyx"}},
-  { n: "Toothbrush Heads (old)", t: { room: "bathroom", category: "toiletries", subcategory: "dental" }, v: 0.3, d: "2023-01-15", l: null, u: "never", a: "none", i: "🪥", desc: "5 worn-out heads, should be tossed", det: {"brand": "Oral-B", "contents": "5 worn-out heads, wrong model"}},
-  { n: "Makeup Bag", t: { room: "bathroom", category: "toiletries", subcategory: "cosmetics" }, v: 2, d: "2019-01-01", l: "2026-02-09", u: "daily", a: "low", i: "💄", desc: "Daily essentials", det: {"contents": "Foundation (NARS), concealer (Maybelline), mascara (Benefit), lipstick (MAC), blush (Glossier)"}},
-  { n: "Old Makeup (drawer)", t: { room: "bathroom", category: "toiletries", subcategory: "cosmetics" }, v: 3, d: "2017-01-01", l: "2022-01-01", u: "never", a: "none", i: "💄", desc: "Expired, wrong colors, samples", det: {"contents": "Expired foundation (3), wrong-shade concealer (2), dried mascara (4), sample palettes (6)"}},
-  { n: "Nail Polish Collection", t: { room: "bathroom", category: "toiletries", subcategory: "cosmetics" }, v: 1, d: "2018-01-01", l: "2025-06-01", u: "rarely", a: "low", i: "💅", desc: "15 bottles, most dried out", det: {"brand": "OPI (5), Essie (4), Sally Hansen (3), unknown (3)", "color": "Reds, nudes, 1 glitter, 1 neon"}},
-  { n: "First Aid Kit", t: { room: "bathroom", category: "toiletries", subcategory: "medicine" }, v: 2, d: "2020-04-01", l: "2025-08-10", u: "rarely", a: "none", i: "🏥", desc: "Half-stocked", det: {"brand": "Johnson & Johnson", "contents": "Band-aids, gauze, antiseptic, tweezers, scissors — missing tape"}},
-  { n: "Sunscreen (3 bottles)", t: { room: "bathroom", category: "toiletries", subcategory: "skincare" }, v: 1, d: "2024-05-01", l: "2025-09-15", u: "rarely", a: "none", i: "☀️", desc: "1 current, 2 from last summer", det: {"brand": "Supergoop (1), Neutrogena (1), Hawaiian Tropic (1)"}},
-  { n: "Travel Toiletry Bag", t: { room: "bathroom", category: "toiletries", subcategory: "travel" }, v: 2, d: "2019-06-01", l: "2025-10-20", u: "rarely", a: "none", i: "🧳", desc: "Mini bottles, half empty", det: {"brand": "Away", "contents": "Mini shampoo, toothpaste, deodorant, contact solution"}},
-  { n: "Hotel Toiletries", t: { room: "bathroom", category: "toiletries", subcategory: "samples" }, v: 1, d: "2019-01-01", l: null, u: "never", a: "none", i: "🏨", desc: "20+ mini bottles from trips", det: {"contents": "20+ mini bottles from Marriott, Hilton, Airbnb"}},
-  { n: "Cotton Balls & Q-tips", t: { room: "bathroom", category: "toiletries", subcategory: "consumables" }, v: 0.5, d: "2025-06-01", l: "2026-02-09", u: "daily", a: "none", i: "🤍", desc: "Basics", det: {"brand": "Q-tips, Swisspers"}},
-  { n: "Scale", t: { room: "bathroom", category: "electronics", subcategory: "health" }, v: 3, d: "2021-01-02", l: "2026-02-01", u: "weekly", a: "none", i: "⚖️", desc: "Digital, New Year's purchase", det: {"brand": "Withings", "model": "Body+", "color": "White"}},
-  { n: "Cleaning Supplies (bathroom)", t: { room: "bathroom", category: "supplies", subcategory: "cleaning" }, v: 5, d: "2025-01-01", l: "2026-02-02", u: "weekly", a: "none", i: "🧹", desc: "Spray, scrub brush, toilet cleaner", det: {"brand": "Method, Scrubbing Bubbles, Clorox"}},
-
-  // ─── OFFICE (~35 items) ───
-  { n: "Desk", t: { room: "office", category: "furniture", subcategory: "desk" }, v: 200, d: "2020-03-20", l: "2026-02-09", u: "daily", a: "low", i: "🪵", desc: "Standing desk, motorized", det: {"brand": "Uplift", "model": "V2 Standing Desk", "material": "Bamboo top", "color": "Natural"}},
-  { n: "Office Chair", t: { room: "office", category: "furniture", subcategory: "seating" }, v: 150, d: "2020-04-01", l: "2026-02-09", u: "daily", a: "low", i: "🪑", desc: "Herman Miller Aeron, WFH splurge", det: {"brand": "Herman Miller", "model": "Aeron Size B", "material": "Mesh", "color": "Graphite"}},
-  { n: "Monitor (27\")", t: { room: "office", category: "electronics", subcategory: "computer" }, v: 15, d: "2021-06-01", l: "2026-02-09", u: "daily", a: "low", i: "🖥️", desc: "4K display", det: {"brand":"Dell","model":"UltraSharp U2723QE","color":"Black/silver"} },
-  { n: "Laptop", t: { room: "office", category: "electronics", subcategory: "computer" }, v: 2, d: "2023-10-01", l: "2026-02-09", u: "daily", a: "medium", i: "💻", desc: "MacBook Pro 14\"", det: {"brand": "Apple", "model": "MacBook Pro 14\" M3 Pro", "color": "Space black"}},
-  { n: "Old Laptop", t: { room: "storage", category: "electronics", subcategory: "computer" }, v: 2.5, d: "2019-08-01", l: "2023-10-01", u: "never", a: "low", i: "💻", desc: "Still has files on it, won't boot reliably", det: {"brand": "Apple", "model": "MacBook Pro 13\" (2019)", "color": "Space grey"}},
-  { n: "Keyboard", t: { room: "office", category: "electronics", subcategory: "peripherals" }, v: 1, d: "2021-06-01", l: "2026-02-09", u: "daily", a: "low", i: "⌨️", desc: "Mechanical, Cherry MX", det: {"brand": "Keychron", "model": "Q1 Pro", "material": "Aluminum", "color": "Space grey"}},
-  { n: "Mouse", t: { room: "office", category: "electronics", subcategory: "peripherals" }, v: 0.2, d: "2022-03-01", l: "2026-02-09", u: "daily", a: "none", i: "🖱️", desc: "Logitech MX Master", det: {"brand": "Logitech", "model": "MX Master 3S", "color": "Graphite"}},
-  { n: "Webcam", t: { room: "office", category: "electronics", subcategory: "peripherals" }, v: 0.3, d: "2020-04-15", l: "2026-02-09", u: "daily", a: "none", i: "📷", desc: "Logitech C920", det: {"brand": "Logitech", "model": "C920 HD Pro", "color": "Black"}},
-  { n: "Headphones", t: { room: "office", category: "electronics", subcategory: "audio" }, v: 0.5, d: "2022-12-25", l: "2026-02-09", u: "daily", a: "medium", i: "🎧", desc: "Sony WH-1000XM5", det: {"brand": "Sony", "model": "WH-1000XM5", "color": "Black"}},
-  { n: "Old Headphones", t: { room: "storage", category: "electronics", subcategory: "audio" }, v: 0.5, d: "2018-06-01", l: "2022-12-25", u: "never", a: "low", i: "🎧", desc: "Band cracked, still works", det: {"brand": "Sony", "model": "WH-1000XM2", "color": "Black"}},
-  { n: "USB Hub", t: { room: "office", category: "electronics", subcategory: "peripherals" }, v: 0.3, d: "2021-06-01", l: "2026-02-09", u: "daily", a: "none", i: "🔌", desc: "CalDigit dock", det: {"brand": "CalDigit", "model": "TS4 Thunderbolt Station", "color": "Space grey"}},
-  { n: "Desk Lamp", t: { room: "office", category: "decor", subcategory: "lighting" }, v: 2, d: "2020-05-01", l: "2026-02-09", u: "daily", a: "none", i: "💡", desc: "LED, adjustable", det: {"brand": "BenQ", "model": "ScreenBar Halo", "color": "Black"}},
-  { n: "Desk Organizer", t: { room: "office", category: "supplies", subcategory: "desk" }, v: 2, d: "2020-04-01", l: "2026-02-09", u: "daily", a: "none", i: "🗃️", desc: "Pen cup, tray, clips", det: {"brand": "Grovemade", "material": "Walnut", "contents": "Pen cup, desk tray, brass clips"}},
-  { n: "Printer", t: { room: "office", category: "electronics", subcategory: "computer" }, v: 20, d: "2019-01-15", l: "2025-04-15", u: "rarely", a: "none", i: "🖨️", desc: "Inkjet, ink always dry", det: {"brand": "HP", "model": "ENVY 6055e", "color": "White"}},
-  { n: "Paper Reams (3)", t: { room: "office", category: "supplies", subcategory: "paper" }, v: 6, d: "2021-01-01", l: "2025-04-15", u: "rarely", a: "none", i: "📄", desc: "Bought in bulk, barely print", det: {"brand": "HP Premium"}},
-  { n: "Notebooks (stack)", t: { room: "office", category: "supplies", subcategory: "paper" }, v: 3, d: "2018-01-01", l: "2026-01-15", u: "monthly", a: "low", i: "📓", desc: "8 notebooks, most half-used", det: {"brand": "Moleskine (2), Field Notes (3), random (3)"}},
-  { n: "Pens & Pencils (drawer)", t: { room: "office", category: "supplies", subcategory: "desk" }, v: 0.5, d: "2016-01-01", l: "2026-02-09", u: "daily", a: "none", i: "✏️", desc: "30+ pens, half don't work", det: {"brand": "Pilot G-2 (5), Muji (3), promo (20+), Pentel (2)"}},
-  { n: "Filing Cabinet", t: { room: "office", category: "furniture", subcategory: "storage" }, v: 80, d: "2017-09-01", l: "2025-01-15", u: "rarely", a: "none", i: "🗄️", desc: "2-drawer, papers from 2017", det: {"brand": "HON", "material": "Steel", "color": "Putty grey"}},
-  { n: "Old Tax Documents", t: { room: "office", category: "supplies", subcategory: "paper" }, v: 5, d: "2015-01-01", l: null, u: "never", a: "none", i: "📋", desc: "7+ years, can shred most", det: {"contents": "W-2s, 1099s, receipts 2015–2019"}},
-  { n: "Cables & Adapters Bin", t: { room: "office", category: "electronics", subcategory: "cables" }, v: 5, d: "2015-01-01", l: "2026-01-20", u: "monthly", a: "none", i: "🔌", desc: "USB-A, mini-USB, HDMI, mystery cables", det: {"contents": "USB-A (6), Mini-USB (3), HDMI (2), ethernet (1), 30-pin (1), FireWire (1), mystery (4)"}},
-  { n: "Old Phone Chargers (5)", t: { room: "office", category: "electronics", subcategory: "cables" }, v: 0.5, d: "2016-01-01", l: null, u: "never", a: "none", i: "🔌", desc: "Micro-USB, Lightning, 30-pin", det: {"contents": "Micro-USB (2), Lightning (2), 30-pin (1)"}},
-  { n: "External Hard Drive", t: { room: "office", category: "electronics", subcategory: "storage" }, v: 0.3, d: "2018-09-01", l: "2024-06-01", u: "rarely", a: "low", i: "💾", desc: "2TB, old backups", det: {"brand": "Western Digital", "model": "My Passport 2TB", "color": "Black"}},
-  { n: "Desk Plant", t: { room: "office", category: "decor", subcategory: "plants" }, v: 2, d: "2023-03-01", l: "2026-02-09", u: "weekly", a: "low", i: "🪴", desc: "Small succulent", det: {"contents": "Haworthia succulent in terracotta pot"}},
-  { n: "Whiteboard", t: { room: "office", category: "supplies", subcategory: "desk" }, v: 5, d: "2020-05-01", l: "2025-08-01", u: "rarely", a: "none", i: "📝", desc: "Small, markers dried out", det: {"brand": "Quartet", "material": "Melamine", "color": "White"}},
-
-  // ─── BOOKS (~40 items) ───
-  { n: "Fiction Novels (shelf 1)", t: { room: "living_room", category: "books", subcategory: "fiction" }, v: 15, d: "2012-01-01", l: "2025-12-01", u: "monthly", a: "medium", i: "📖", desc: "~30 novels, favorites and unread", det: {"titles": [{"title": "Beloved", "author": "Toni Morrison"}, {"title": "A Gentleman in Moscow", "author": "Amor Towles"}, {"title": "The Goldfinch", "author": "Donna Tartt"}, {"title": "Circe", "author": "Madeline Miller"}, {"title": "Norwegian Wood", "author": "Haruki Murakami"}, {"title": "The Secret History", "author": "Donna Tartt"}]}},
-  { n: "Fiction Novels (shelf 2)", t: { room: "living_room", category: "books", subcategory: "fiction" }, v: 15, d: "2015-01-01", l: "2025-06-01", u: "rarely", a: "low", i: "📖", desc: "~30 more, read once", det: {"titles": [{"title": "Where the Crawdads Sing", "author": "Delia Owens"}, {"title": "Project Hail Mary", "author": "Andy Weir"}, {"title": "The Remains of the Day", "author": "Kazuo Ishiguro"}, {"title": "Pachinko", "author": "Min Jin Lee"}, {"title": "Klara and the Sun", "author": "Kazuo Ishiguro"}]}},
-  { n: "Nonfiction Books", t: { room: "living_room", category: "books", subcategory: "nonfiction" }, v: 10, d: "2016-01-01", l: "2025-09-15", u: "rarely", a: "low", i: "📚", desc: "~20 books, self-help and science", det: {"titles": [{"title": "Sapiens", "author": "Yuval Noah Harari"}, {"title": "Thinking, Fast and Slow", "author": "Daniel Kahneman"}, {"title": "The Body Keeps the Score", "author": "Bessel van der Kolk"}, {"title": "Braiding Sweetgrass", "author": "Robin Wall Kimmerer"}, {"title": "Educated", "author": "Tara Westover"}]}},
-  { n: "Programming Books", t: { room: "office", category: "books", subcategory: "technical" }, v: 8, d: "2017-01-01", l: "2024-03-01", u: "rarely", a: "low", i: "💻", desc: "12 books, most outdated", det: {"titles": [{"title": "Eloquent JavaScript", "author": "Marijn Haverbeke"}, {"title": "Clean Code", "author": "Robert C. Martin"}, {"title": "Design Patterns", "author": "Gang of Four"}, {"title": "You Don't Know JS", "author": "Kyle Simpson"}, {"title": "The Pragmatic Programmer", "author": "Hunt & Thomas"}]}},
-  { n: "Art/Design Books", t: { room: "living_room", category: "books", subcategory: "art" }, v: 12, d: "2018-01-01", l: "2025-11-01", u: "monthly", a: "high", i: "🎨", desc: "Coffee table books, beautiful", det: {"titles": [{"title": "Interaction of Color", "author": "Josef Albers"}, {"title": "Ways of Seeing", "author": "John Berger"}, {"title": "The Art of Looking Sideways", "author": "Alan Fletcher"}, {"title": "Dieter Rams: As Little Design as Possible", "author": "Sophie Lovell"}]}},
-  { n: "Travel Guidebooks", t: { room: "living_room", category: "books", subcategory: "travel" }, v: 5, d: "2016-01-01", l: "2022-06-01", u: "never", a: "low", i: "🗺️", desc: "8 guides, all outdated info", det: {"titles": [{"title": "Lonely Planet Japan (2018)", "author": "Lonely Planet"}, {"title": "Rick Steves Italy (2019)", "author": "Rick Steves"}, {"title": "Fodor's Paris (2017)", "author": "Fodor's"}, {"title": "Moon Iceland (2018)", "author": "Moon Travel"}]}},
-  { n: "Textbooks (college)", t: { room: "storage", category: "books", subcategory: "academic" }, v: 15, d: "2013-01-01", l: null, u: "never", a: "none", i: "📕", desc: "10 textbooks, completely outdated", det: {"titles": [{"title": "Introduction to Algorithms", "author": "Cormen et al."}, {"title": "Campbell Biology", "author": "Lisa Urry et al."}, {"title": "Calculus: Early Transcendentals", "author": "James Stewart"}, {"title": "Microeconomics", "author": "Paul Krugman"}]}},
-  { n: "Children's Books (childhood)", t: { room: "storage", category: "books", subcategory: "childhood" }, v: 8, d: "1998-01-01", l: null, u: "never", a: "high", i: "📚", desc: "Favorites from childhood, can't part with", det: {"titles": [{"title": "Where the Wild Things Are", "author": "Maurice Sendak"}, {"title": "Matilda", "author": "Roald Dahl"}, {"title": "Harry Potter and the Sorcerer's Stone", "author": "J.K. Rowling"}, {"title": "The Giving Tree", "author": "Shel Silverstein"}, {"title": "Charlotte's Web", "author": "E.B. White"}]}},
-
-  // ─── GARAGE / TOOLS (~25 items) ───
-  { n: "Tool Box", t: { room: "garage", category: "tools", subcategory: "hand_tools" }, v: 15, d: "2017-06-01", l: "2025-11-15", u: "monthly", a: "low", i: "🧰", desc: "Hammers, screwdrivers, wrenches, pliers", det: {"brand": "Craftsman", "contents": "Claw hammer, Phillips screwdrivers (3), flathead (2), wrench, pliers, hex keys"}},
-  { n: "Power Drill", t: { room: "garage", category: "tools", subcategory: "power_tools" }, v: 5, d: "2019-03-15", l: "2025-10-01", u: "monthly", a: "low", i: "🔧", desc: "DeWalt cordless", det: {"brand": "DeWalt", "model": "DCD771C2 20V", "color": "Yellow/black"}},
-  { n: "Ladder (6ft)", t: { room: "garage", category: "tools", subcategory: "equipment" }, v: 50, d: "2020-05-01", l: "2025-09-15", u: "rarely", a: "none", i: "🪜", desc: "Aluminum step ladder", det: {"brand": "Werner", "model": "366", "material": "Aluminum"}},
-  { n: "Garden Hose", t: { room: "garage", category: "tools", subcategory: "garden" }, v: 15, d: "2019-04-01", l: "2025-10-01", u: "rarely", a: "none", i: "🌱", desc: "50ft, kinked", det: {"brand": "Flexzilla", "material": "Polymer", "color": "Green"}},
-  { n: "Lawn Mower", t: { room: "garage", category: "tools", subcategory: "garden" }, v: 100, d: "2019-05-01", l: "2025-10-15", u: "rarely", a: "none", i: "🌿", desc: "Electric push mower", det: {"brand": "Ego", "model": "LM2102SP", "color": "Green/black"}},
-  { n: "Paint Cans (old)", t: { room: "garage", category: "supplies", subcategory: "paint" }, v: 20, d: "2019-08-01", l: "2022-03-01", u: "never", a: "none", i: "🎨", desc: "8 cans, most dried up, from move-in", det: {"brand": "Benjamin Moore (5), Behr (3)", "contents": "Eggshell white, Simply White, Hale Navy, Kendall Charcoal, Revere Pewter, custom"}},
-  { n: "Extension Cords (4)", t: { room: "garage", category: "tools", subcategory: "electrical" }, v: 3, d: "2018-01-01", l: "2025-12-20", u: "monthly", a: "none", i: "🔌", desc: "Various lengths, tangled", det: {"contents": "Orange 50ft outdoor, white 6ft indoor (2), power strip with surge"}},
-  { n: "Bicycle", t: { room: "garage", category: "sports", subcategory: "cycling" }, v: 120, d: "2018-06-15", l: "2025-04-20", u: "rarely", a: "medium", i: "🚲", desc: "Road bike, flat tires", det: {"brand": "Cannondale", "model": "CAAD13", "color": "Acid green"}},
-  { n: "Bike Pump", t: { room: "garage", category: "sports", subcategory: "cycling" }, v: 2, d: "2018-06-15", l: "2025-04-20", u: "rarely", a: "none", i: "🚲", desc: "Floor pump", det: {"brand": "Topeak", "model": "JoeBlow Sport III"}},
-  { n: "Moving Boxes (flattened)", t: { room: "garage", category: "supplies", subcategory: "packing" }, v: 40, d: "2018-03-10", l: null, u: "never", a: "none", i: "📦", desc: "15+ boxes from move-in, 'for next move'", det: {"contents": "15+ Home Depot medium/large boxes, labeled: Kitchen, Books, Misc, Fragile"}},
-  { n: "Camping Gear", t: { room: "garage", category: "sports", subcategory: "camping" }, v: 60, d: "2017-07-01", l: "2024-08-15", u: "rarely", a: "medium", i: "⛺", desc: "Tent, sleeping bags, stove, lantern", det: {"brand": "REI Co-op (tent), Kelty (sleeping bags), MSR (stove), Black Diamond (lantern)", "contents": "4-person tent, 2 sleeping bags, camp stove, lantern, tarp"}},
-  { n: "Old Car Parts", t: { room: "garage", category: "tools", subcategory: "automotive" }, v: 15, d: "2020-01-01", l: null, u: "never", a: "none", i: "🔧", desc: "From car I sold 2 years ago", det: {"contents": "Brake pads, air filter, wiper blades — for 2014 Honda Civic (sold 2022)"}},
-  { n: "Cooler", t: { room: "garage", category: "sports", subcategory: "outdoor" }, v: 40, d: "2019-05-20", l: "2025-07-04", u: "rarely", a: "low", i: "🧊", desc: "Large Igloo, used 2x/year", det: {"brand": "Igloo", "model": "MaxCold 70 qt", "color": "Blue/white"}},
-  { n: "Folding Chairs (4)", t: { room: "garage", category: "furniture", subcategory: "outdoor" }, v: 40, d: "2019-07-04", l: "2025-07-04", u: "rarely", a: "none", i: "🪑", desc: "For BBQs and events", det: {"brand": "Coleman", "material": "Steel/polyester", "color": "Blue"}},
-
-  // ─── SPORTS / HOBBY (~20 items) ───
-  { n: "Yoga Mat", t: { room: "closet", category: "sports", subcategory: "fitness" }, v: 5, d: "2020-04-01", l: "2026-01-28", u: "weekly", a: "low", i: "🧘", desc: "Lululemon, used at home", det: {"brand": "Lululemon", "model": "The Reversible Mat 5mm", "color": "Dark olive"}},
-  { n: "Dumbbells (set)", t: { room: "closet", category: "sports", subcategory: "fitness" }, v: 10, d: "2020-04-15", l: "2026-02-07", u: "weekly", a: "low", i: "🏋️", desc: "10, 15, 20 lb pairs", det: {"brand": "Bowflex", "model": "SelectTech 552", "contents": "Adjustable 5–52.5 lbs"}},
-  { n: "Resistance Bands", t: { room: "closet", category: "sports", subcategory: "fitness" }, v: 1, d: "2021-01-02", l: "2025-03-15", u: "rarely", a: "none", i: "💪", desc: "5-pack, 2 snapped", det: {"brand": "Fit Simplify", "contents": "5-pack loop bands — 2 snapped"}},
-  { n: "Tennis Racket", t: { room: "garage", category: "sports", subcategory: "racquet" }, v: 5, d: "2018-05-01", l: "2024-06-15", u: "rarely", a: "low", i: "🎾", desc: "Played twice last year", det: {"brand": "Wilson", "model": "Clash 100", "color": "Black/grey"}},
-  { n: "Basketball", t: { room: "garage", category: "sports", subcategory: "ball" }, v: 5, d: "2017-03-01", l: "2024-08-01", u: "rarely", a: "low", i: "🏀", desc: "Slightly deflated", det: {"brand": "Spalding", "model": "NBA Official replica", "color": "Orange"}},
-  { n: "Soccer Ball", t: { room: "garage", category: "sports", subcategory: "ball" }, v: 5, d: "2019-06-01", l: "2023-09-15", u: "rarely", a: "none", i: "⚽", desc: "From work league that ended", det: {"brand": "Adidas", "model": "Tiro Club", "color": "White/black"}},
-  { n: "Hiking Poles", t: { room: "garage", category: "sports", subcategory: "hiking" }, v: 3, d: "2019-08-01", l: "2024-10-15", u: "rarely", a: "low", i: "🥾", desc: "Collapsible, used maybe 5 times", det: {"brand": "Black Diamond", "model": "Trail Back", "material": "Aluminum", "color": "Blue"}},
-  { n: "Ski Gear", t: { room: "storage", category: "sports", subcategory: "winter" }, v: 80, d: "2018-12-01", l: "2025-02-15", u: "rarely", a: "medium", i: "⛷️", desc: "Skis, boots, poles, goggles", det: {"brand": "Rossignol (skis), Salomon (boots), Smith (goggles)", "contents": "Experience 76, Quest Pro boots (sz 10), I/O Mag goggles"}},
-  { n: "Guitar", t: { room: "living_room", category: "sports", subcategory: "music" }, v: 30, d: "2015-09-01", l: "2025-01-10", u: "monthly", a: "high", i: "🎸", desc: "Acoustic, learned 4 chords", det: {"brand": "Taylor", "model": "GS Mini Mahogany", "material": "Mahogany top, sapele back", "color": "Natural"}},
-  { n: "Guitar Case", t: { room: "living_room", category: "sports", subcategory: "music" }, v: 35, d: "2015-09-01", l: "2025-01-10", u: "monthly", a: "low", i: "🎸", desc: "Hard case, mostly collects dust", det: {"brand": "Taylor", "model": "GS Mini Hardshell", "material": "ABS plastic", "color": "Black"}},
-  { n: "Sketch Pad & Art Supplies", t: { room: "office", category: "sports", subcategory: "art" }, v: 3, d: "2020-06-01", l: "2025-03-01", u: "rarely", a: "medium", i: "🎨", desc: "Pencils, markers, half-used pad", det: {"brand": "Strathmore (pad), Prismacolor (pencils), Copic (markers)"}},
-
-  // ─── SEASONAL (~20 items) ───
-  { n: "Christmas Decorations", t: { room: "storage", category: "seasonal", subcategory: "christmas" }, v: 60, d: "2016-12-01", l: "2025-12-01", u: "rarely", a: "medium", i: "🎄", desc: "Tree ornaments, lights, wreath, 3 bins", det: {"contents": "Glass ornaments (40+), LED lights (3 strands), wreath, stockings (4), tree skirt, star topper"}},
-  { n: "Christmas Tree (artificial)", t: { room: "storage", category: "seasonal", subcategory: "christmas" }, v: 80, d: "2019-12-01", l: "2025-12-01", u: "rarely", a: "low", i: "🎄", desc: "7ft, pre-lit", det: {"brand": "National Tree Co.", "model": "Dunhill Fir 7ft", "color": "Green, pre-lit 650 LEDs"}},
-  { n: "Halloween Decorations", t: { room: "storage", category: "seasonal", subcategory: "halloween" }, v: 25, d: "2018-10-01", l: "2025-10-01", u: "rarely", a: "low", i: "🎃", desc: "Pumpkins, fake spiders, lights", det: {"contents": "Foam pumpkins (3), cobwebs, plastic spiders, skeleton wreath, orange lights, fog machine"}},
-  { n: "String Lights", t: { room: "storage", category: "seasonal", subcategory: "lighting" }, v: 5, d: "2019-12-01", l: "2025-12-01", u: "rarely", a: "low", i: "💡", desc: "3 strands, 1 doesn't work", det: {"brand": "Twinkle Star", "contents": "3 strands — warm white, multicolor, fairy (1 dead)"}},
-  { n: "Easter Basket", t: { room: "storage", category: "seasonal", subcategory: "easter" }, v: 3, d: "2020-04-01", l: "2025-04-20", u: "rarely", a: "low", i: "🐣", desc: "Reusable, with fake grass", det: {"brand": "Pottery Barn", "material": "Wicker", "color": "Natural with green liner"}},
-  { n: "Summer Inflatable Pool", t: { room: "garage", category: "seasonal", subcategory: "summer" }, v: 15, d: "2021-06-15", l: "2025-07-15", u: "rarely", a: "none", i: "🏖️", desc: "Used once, slow leak", det: {"brand": "Intex", "model": "Easy Set 10ft", "color": "Blue"}},
-  { n: "Space Heater", t: { room: "storage", category: "seasonal", subcategory: "climate" }, v: 12, d: "2019-11-01", l: "2026-01-15", u: "monthly", a: "none", i: "🔥", desc: "Portable ceramic", det: {"brand": "Lasko", "model": "Ceramic Tower 751320", "color": "Black"}},
-  { n: "Fan (box)", t: { room: "storage", category: "seasonal", subcategory: "climate" }, v: 15, d: "2020-07-01", l: "2025-08-30", u: "rarely", a: "none", i: "🌀", desc: "Box fan for summer", det: {"brand": "Lasko", "model": "20\" Box Fan", "color": "White"}},
-  { n: "Wrapping Paper & Gift Bags", t: { room: "storage", category: "seasonal", subcategory: "gifting" }, v: 10, d: "2018-12-01", l: "2025-12-24", u: "rarely", a: "none", i: "🎁", desc: "Crumpled rolls, used bags", det: {"contents": "3 rolls (Christmas, birthday, generic), 8 gift bags, tissue paper, bows"}},
-
-  // ─── GIFTS / SENTIMENTAL (~30 items) ───
-  { n: "Wedding Gift (vase)", t: { room: "living_room", category: "gifts", subcategory: "wedding" }, v: 3, d: "2022-06-15", l: null, u: "never", a: "medium", i: "🏺", desc: "Beautiful but doesn't match decor", det: {"brand": "Simon Pearce", "material": "Hand-blown glass", "color": "Clear"}},
-  { n: "Grandma's Quilt", t: { room: "bedroom", category: "gifts", subcategory: "family" }, v: 5, d: "2010-01-01", l: "2025-12-25", u: "rarely", a: "high", i: "🧶", desc: "Handmade, irreplaceable", det: {"material": "Cotton patchwork, hand-quilted", "color": "Blue, yellow, white floral"}},
-  { n: "Childhood Stuffed Animal", t: { room: "storage", category: "gifts", subcategory: "childhood" }, v: 3, d: "1995-01-01", l: null, u: "never", a: "high", i: "🧸", desc: "Teddy bear from age 5", det: {"brand": "Gund", "contents": "Classic teddy bear named 'Mr. Buttons'"}},
-  { n: "Souvenir Collection", t: { room: "living_room", category: "gifts", subcategory: "travel" }, v: 4, d: "2014-01-01", l: "2026-02-09", u: "daily", a: "high", i: "🌍", desc: "Fridge magnets, mini Eiffel Tower, etc.", det: {"contents": "Eiffel Tower miniature, NYC taxi magnet, Japanese maneki-neko, Turkish evil eye, Mexican skull"}},
-  { n: "Gift Cards (unused)", t: { room: "office", category: "gifts", subcategory: "cards" }, v: 0.1, d: "2022-12-25", l: null, u: "never", a: "none", i: "💳", desc: "5 gift cards, unknown balances", det: {"contents": "Amazon ($25?), Starbucks ($10?), REI ($50?), Target ($15?), Best Buy ($20?)"}},
-  { n: "Birthday Cards (saved)", t: { room: "storage", category: "gifts", subcategory: "cards" }, v: 1, d: "2010-01-01", l: null, u: "never", a: "medium", i: "💌", desc: "30+ cards from over the years", det: {"contents": "30+ cards spanning age 5 to present"}},
-  { n: "Trophy (high school)", t: { room: "storage", category: "gifts", subcategory: "awards" }, v: 2, d: "2008-05-01", l: null, u: "never", a: "medium", i: "🏆", desc: "Track & field, state finals", det: {"material": "Gold-tone plastic, marble base", "contents": "Track & Field, 800m, State Finals 3rd Place"}},
-  { n: "Diploma & Certificates", t: { room: "office", category: "gifts", subcategory: "awards" }, v: 1, d: "2013-05-15", l: null, u: "never", a: "medium", i: "📜", desc: "Framed degree, CPR cert, etc.", det: {"contents": "B.S. Computer Science, CPR cert (expired), Dean's List"}},
-  { n: "Photo Albums (physical)", t: { room: "storage", category: "gifts", subcategory: "memories" }, v: 8, d: "2000-01-01", l: "2025-12-25", u: "rarely", a: "high", i: "📸", desc: "4 albums from childhood through college", det: {"contents": "Childhood, high school, college, post-grad travels — 4 albums"}},
-  { n: "Yearbooks", t: { room: "storage", category: "gifts", subcategory: "memories" }, v: 5, d: "2009-01-01", l: "2024-11-28", u: "rarely", a: "medium", i: "📚", desc: "4 yearbooks, high school + college", det: {"contents": "4 yearbooks — Roosevelt High School + college"}},
-  { n: "Love Letters", t: { room: "storage", category: "gifts", subcategory: "memories" }, v: 0.5, d: "2015-01-01", l: "2024-02-14", u: "rarely", a: "high", i: "💌", desc: "Handwritten, from early relationship", det: {"contents": "12 handwritten letters, first 2 years of relationship"}},
-  { n: "Baby Blanket", t: { room: "storage", category: "gifts", subcategory: "childhood" }, v: 2, d: "1993-01-01", l: null, u: "never", a: "high", i: "🍼", desc: "Hospital blanket, can't let go", det: {"material": "Cotton flannel", "color": "White with blue stripes, hospital logo"}},
-  { n: "Retirement Watch (dad's)", t: { room: "bedroom", category: "gifts", subcategory: "family" }, v: 0.2, d: "2020-06-15", l: null, u: "never", a: "high", i: "⌚", desc: "Dad's watch, too sentimental to wear", det: {"brand": "Seiko", "model": "Presage", "material": "Stainless steel", "color": "Silver/blue dial"}},
-  { n: "Regifting Pile", t: { room: "storage", category: "gifts", subcategory: "unwanted" }, v: 8, d: "2020-01-01", l: null, u: "never", a: "none", i: "🎁", desc: "Candles, mugs, random gifts waiting to be regifted", det: {"contents": "Yankee Candle (3), 'Best Boss' mug, cocktail shaker, bath bomb set, candle holder"}},
-  { n: "Friendship Bracelets", t: { room: "storage", category: "gifts", subcategory: "memories" }, v: 0.1, d: "2005-01-01", l: null, u: "never", a: "high", i: "📿", desc: "From summer camp, faded", det: {"material": "Embroidery thread", "contents": "5 faded bracelets from Camp Timber Lake, 2005–2008"}},
-
-  // ─── DINING ROOM (~10 items) ───
-  { n: "Dining Table", t: { room: "dining_room", category: "furniture", subcategory: "dining" }, v: 300, d: "2019-04-20", l: "2026-02-09", u: "daily", a: "low", i: "🪵", desc: "Seats 6, expandable", det: {"brand": "Room & Board", "model": "Parsons", "material": "Walnut", "color": "Natural"}},
-  { n: "Dining Chairs (6)", t: { room: "dining_room", category: "furniture", subcategory: "dining" }, v: 180, d: "2019-04-20", l: "2026-02-09", u: "daily", a: "low", i: "🪑", desc: "Upholstered, one wobbly leg", det: {"brand": "Room & Board", "material": "Upholstered walnut", "color": "Grey fabric"}},
-  { n: "China Cabinet", t: { room: "dining_room", category: "furniture", subcategory: "storage" }, v: 250, d: "2015-01-01", l: "2026-02-09", u: "daily", a: "medium", i: "🏺", desc: "Inherited, glass front", det: {"material": "Mahogany, glass front", "color": "Dark cherry"}},
-  { n: "Fine China Set", t: { room: "dining_room", category: "kitchenware", subcategory: "formal" }, v: 15, d: "2015-01-01", l: "2025-11-28", u: "rarely", a: "high", i: "🍽️", desc: "Service for 8, used 2x/year", det: {"brand": "Noritake", "model": "Crestwood Platinum", "color": "White with platinum trim"}},
-  { n: "Table Linens", t: { room: "dining_room", category: "linens", subcategory: "table" }, v: 3, d: "2019-11-01", l: "2025-12-25", u: "rarely", a: "low", i: "🪡", desc: "Tablecloths, napkins, runner", det: {"brand": "Crate & Barrel", "material": "Linen", "contents": "Tablecloth, 8 napkins, runner"}},
-  { n: "Centerpiece/Decor", t: { room: "dining_room", category: "decor", subcategory: "table" }, v: 2, d: "2020-09-01", l: "2026-02-09", u: "daily", a: "low", i: "🏺", desc: "Bowl with fake fruit", det: {"contents": "Wooden bowl with faux lemons and limes"}},
-  { n: "Serving Platters (4)", t: { room: "dining_room", category: "kitchenware", subcategory: "serving" }, v: 8, d: "2018-11-01", l: "2025-11-28", u: "rarely", a: "low", i: "🍽️", desc: "Used for Thanksgiving", det: {"brand": "Mixed — Noritake (2), Crate & Barrel (2)", "material": "Porcelain + stoneware"}},
-  { n: "Candelabra", t: { room: "dining_room", category: "decor", subcategory: "lighting" }, v: 2, d: "2019-12-25", l: "2025-12-25", u: "rarely", a: "medium", i: "🕯️", desc: "Brass, wedding gift", det: {"material": "Brass", "color": "Antique brass"}},
-
-  // ─── LAUNDRY (~10 items) ───
-  { n: "Washing Machine", t: { room: "laundry", category: "appliances", subcategory: "major" }, v: 300, d: "2018-03-10", l: "2026-02-08", u: "weekly", a: "none", i: "🫧", desc: "Front-load, LG", det: {"brand": "LG", "model": "WM4000HWA", "color": "White"}},
-  { n: "Dryer", t: { room: "laundry", category: "appliances", subcategory: "major" }, v: 300, d: "2018-03-10", l: "2026-02-08", u: "weekly", a: "none", i: "🌀", desc: "Gas dryer", det: {"brand": "LG", "model": "DLGX4001W", "color": "White"}},
-  { n: "Iron", t: { room: "laundry", category: "appliances", subcategory: "personal_care" }, v: 3, d: "2017-09-01", l: "2024-06-01", u: "rarely", a: "none", i: "♨️", desc: "Rarely iron anything anymore", det: {"brand": "Rowenta", "model": "DW5080", "color": "Blue/white"}},
-  { n: "Ironing Board", t: { room: "laundry", category: "furniture", subcategory: "utility" }, v: 20, d: "2017-09-01", l: "2024-06-01", u: "rarely", a: "none", i: "♨️", desc: "Folding, behind door", det: {"brand": "Brabantia", "material": "Steel", "color": "Metallic grey"}},
-  { n: "Laundry Baskets (3)", t: { room: "laundry", category: "supplies", subcategory: "laundry" }, v: 30, d: "2019-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🧺", desc: "Darks, lights, delicates", det: {"brand": "Sterilite (2), mesh (1)", "material": "Plastic + mesh", "color": "White (2), black"}},
-  { n: "Detergent & Supplies", t: { room: "laundry", category: "supplies", subcategory: "laundry" }, v: 8, d: "2025-11-01", l: "2026-02-08", u: "weekly", a: "none", i: "🧴", desc: "Detergent, dryer sheets, stain remover", det: {"brand": "Tide, Bounce, OxiClean", "contents": "64 oz Tide, 240-ct Bounce, OxiClean spray"}},
-  { n: "Drying Rack", t: { room: "laundry", category: "tools", subcategory: "laundry" }, v: 10, d: "2020-02-01", l: "2026-02-06", u: "weekly", a: "none", i: "👕", desc: "Collapsible wooden", det: {"brand": "Household Essentials", "material": "Beechwood", "color": "Natural"}},
-  { n: "Hangers (30+)", t: { room: "laundry", category: "supplies", subcategory: "laundry" }, v: 5, d: "2016-01-01", l: "2026-02-09", u: "daily", a: "none", i: "👔", desc: "Mix of wire, plastic, velvet", det: {"contents": "Wire (12), plastic tubular (10), velvet slim (8), wood suit (3)"}},
-
-  // ─── ENTRYWAY (~10 items) ───
-  { n: "Shoe Rack", t: { room: "entryway", category: "furniture", subcategory: "storage" }, v: 30, d: "2019-04-01", l: "2026-02-09", u: "daily", a: "none", i: "👟", desc: "3-tier, overflowing", det: {"brand": "IKEA", "model": "Tjusig", "material": "Solid pine", "color": "Black"}},
-  { n: "Coat Hooks", t: { room: "entryway", category: "furniture", subcategory: "storage" }, v: 2, d: "2018-04-01", l: "2026-02-09", u: "daily", a: "none", i: "🧥", desc: "Wall-mounted, 5 hooks, all full", det: {"brand": "Schoolhouse", "material": "Brass", "color": "Antique brass"}},
-  { n: "Umbrella Stand", t: { room: "entryway", category: "decor", subcategory: "storage" }, v: 5, d: "2019-06-01", l: "2026-01-20", u: "monthly", a: "none", i: "☂️", desc: "Contains 4 umbrellas, 1 broken", det: {"brand": "Yamazaki", "material": "Steel", "color": "White"}},
-  { n: "Keys & Mail Tray", t: { room: "entryway", category: "supplies", subcategory: "organization" }, v: 1, d: "2019-04-01", l: "2026-02-09", u: "daily", a: "none", i: "🔑", desc: "Small ceramic dish, always overflowing", det: {"material": "Ceramic", "color": "Speckled cream"}},
-  { n: "Junk Mail Pile", t: { room: "entryway", category: "supplies", subcategory: "paper" }, v: 2, d: "2025-01-01", l: null, u: "never", a: "none", i: "📬", desc: "3 months of unopened catalogs", det: {"contents": "Restoration Hardware catalog, Pottery Barn, credit card offers, local coupons"}},
-  { n: "Welcome Mat", t: { room: "entryway", category: "decor", subcategory: "rugs" }, v: 2, d: "2020-10-01", l: "2026-02-09", u: "daily", a: "none", i: "🚪", desc: "Worn down", det: {"brand": "West Elm", "material": "Coir", "color": "Natural"}},
-  { n: "Mirror (entryway)", t: { room: "entryway", category: "decor", subcategory: "wall_art" }, v: 5, d: "2019-06-01", l: "2026-02-09", u: "daily", a: "low", i: "🪞", desc: "Full-length, wall-mounted", det: {"brand": "CB2", "material": "Metal frame", "color": "Brass"}},
-  { n: "Dog Leash & Supplies", t: { room: "entryway", category: "supplies", subcategory: "pets" }, v: 3, d: "2021-03-01", l: "2026-02-09", u: "daily", a: "medium", i: "🐕", desc: "Leash, poop bags, treats, old collar", det: {"brand": "Ruffwear (leash), Earth Rated (bags)", "contents": "Leash (red), poop bags, treat pouch, old collar"}},
-
-  // ─── STORAGE / MISC (~25 items) ───
-  { n: "Vacuum Cleaner", t: { room: "storage", category: "appliances", subcategory: "cleaning" }, v: 20, d: "2021-09-01", l: "2026-02-05", u: "weekly", a: "none", i: "🧹", desc: "Dyson V15", det: {"brand": "Dyson", "model": "V15 Detect", "color": "Yellow/nickel"}},
-  { n: "Old Vacuum", t: { room: "storage", category: "appliances", subcategory: "cleaning" }, v: 25, d: "2016-05-01", l: "2021-09-01", u: "never", a: "none", i: "🧹", desc: "Heavy upright, replaced", det: {"brand": "Shark", "model": "Navigator Lift-Away", "color": "Purple"}},
-  { n: "Mop & Bucket", t: { room: "storage", category: "tools", subcategory: "cleaning" }, v: 10, d: "2019-01-01", l: "2026-01-25", u: "monthly", a: "none", i: "🧹", desc: "Spin mop", det: {"brand": "O-Cedar", "model": "EasyWring Spin Mop", "color": "Red/grey"}},
-  { n: "Broom & Dustpan", t: { room: "storage", category: "tools", subcategory: "cleaning" }, v: 5, d: "2018-04-01", l: "2026-02-05", u: "weekly", a: "none", i: "🧹", desc: "Angled broom", det: {"brand": "TreeLen", "material": "Steel/rubber", "color": "Black"}},
-  { n: "Cleaning Products (bin)", t: { room: "storage", category: "supplies", subcategory: "cleaning" }, v: 10, d: "2024-01-01", l: "2026-02-05", u: "weekly", a: "none", i: "🧴", desc: "10+ bottles, sprays, sponges", det: {"brand": "Mrs. Meyer's, Method, Windex, Lysol, Clorox", "contents": "Sprays, wipes, sponges, toilet cleaner"}},
-  { n: "Light Bulbs (misc)", t: { room: "storage", category: "supplies", subcategory: "electrical" }, v: 2, d: "2020-01-01", l: "2025-11-01", u: "rarely", a: "none", i: "💡", desc: "Various wattages, some wrong type", det: {"brand": "Philips, GE", "contents": "LED A19 (4), LED BR30 (2), candelabra (3), CFL (2)"}},
-  { n: "Batteries (drawer)", t: { room: "storage", category: "supplies", subcategory: "electrical" }, v: 1, d: "2022-01-01", l: "2025-12-25", u: "monthly", a: "none", i: "🔋", desc: "AA, AAA, some dead mixed with fresh", det: {"brand": "Duracell, Amazon Basics", "contents": "AA (12), AAA (8), 9V (2), CR2032 (3) — some dead"}},
-  { n: "Sewing Kit", t: { room: "storage", category: "tools", subcategory: "craft" }, v: 1, d: "2017-01-01", l: "2025-03-10", u: "rarely", a: "none", i: "🧵", desc: "Basic repair kit", det: {"brand": "Singer", "contents": "Needles, thread (8 colors), scissors, pins, seam ripper"}},
-  { n: "Tool Misc (duct tape, WD-40)", t: { room: "storage", category: "supplies", subcategory: "repair" }, v: 2, d: "2019-01-01", l: "2025-08-01", u: "rarely", a: "none", i: "🔧", desc: "Fix-it essentials", det: {"brand": "Gorilla Tape, WD-40, 3M", "contents": "Duct tape, WD-40, electrical tape, zip ties"}},
-  { n: "Old Phone (2 devices)", t: { room: "storage", category: "electronics", subcategory: "phones" }, v: 0.5, d: "2018-01-01", l: null, u: "never", a: "low", i: "📱", desc: "iPhone 8, Galaxy S9 — drawer dwellers", det: {"brand": "Apple iPhone 8 (Silver), Samsung Galaxy S9 (Black)"}},
-  { n: "Old Tablet", t: { room: "storage", category: "electronics", subcategory: "tablets" }, v: 0.5, d: "2017-06-01", l: "2022-01-01", u: "never", a: "none", i: "📱", desc: "iPad Air 2, slow, cracked screen", det: {"brand": "Apple", "model": "iPad Air 2", "color": "Space grey"}},
-  { n: "Camera (DSLR)", t: { room: "storage", category: "electronics", subcategory: "camera" }, v: 3, d: "2016-08-01", l: "2023-07-15", u: "rarely", a: "medium", i: "📷", desc: "Canon EOS, phone replaced it", det: {"brand": "Canon", "model": "EOS Rebel T6i", "color": "Black"}},
-  { n: "Camera Bag & Lenses", t: { room: "storage", category: "electronics", subcategory: "camera" }, v: 8, d: "2016-08-01", l: "2023-07-15", u: "rarely", a: "medium", i: "📷", desc: "3 lenses, filters, bag", det: {"brand": "Lowepro (bag), Canon (lenses)", "contents": "18-55mm, 50mm f/1.8, 55-250mm, UV filter"}},
-  { n: "VHS Tapes", t: { room: "storage", category: "media", subcategory: "legacy" }, v: 8, d: "1998-01-01", l: null, u: "never", a: "medium", i: "📼", desc: "Family home videos, no VCR", det: {"contents": "Birthday parties (3), Christmas mornings (4), school play (1), vacation (2)"}},
-  { n: "CDs (box)", t: { room: "storage", category: "media", subcategory: "legacy" }, v: 5, d: "2005-01-01", l: null, u: "never", a: "low", i: "💿", desc: "~40 CDs, all on Spotify now", det: {"contents": "Nirvana Nevermind, Radiohead OK Computer, Daft Punk Discovery, Weezer Blue Album, and ~35 more"}},
-  { n: "Random Box 'To Sort'", t: { room: "storage", category: "supplies", subcategory: "misc" }, v: 30, d: "2018-03-10", l: null, u: "never", a: "none", i: "📦", desc: "From the move, still sealed", det: {"contents": "Unknown — sealed since March 2018 move. Label: 'Living Room Misc'"}},
-  { n: "Random Box 'To Sort' #2", t: { room: "storage", category: "supplies", subcategory: "misc" }, v: 30, d: "2018-03-10", l: null, u: "never", a: "none", i: "📦", desc: "Also from the move, label says 'misc'", det: {"contents": "Unknown — sealed since March 2018 move. Label: 'Misc'"}},
-  { n: "Luggage Tags & Travel Gear", t: { room: "storage", category: "supplies", subcategory: "travel" }, v: 1, d: "2019-06-01", l: "2025-10-20", u: "rarely", a: "none", i: "✈️", desc: "Neck pillow, eye mask, tags", det: {"brand": "Tumi (tags), Trtl (pillow), Manta (mask)", "contents": "2 leather tags, neck pillow, eye mask, adapter plug"}},
-  { n: "Gift Wrap Supplies", t: { room: "storage", category: "supplies", subcategory: "gifting" }, v: 5, d: "2020-12-01", l: "2025-12-24", u: "rarely", a: "none", i: "🎀", desc: "Tape, scissors, ribbon, bows", det: {"contents": "Scotch tape (2), scissors, curling ribbon (3 colors), bows, tags"}},
-  { n: "Emergency Kit", t: { room: "storage", category: "supplies", subcategory: "safety" }, v: 10, d: "2020-01-01", l: "2024-01-01", u: "rarely", a: "low", i: "🆘", desc: "Flashlight, radio, water, blanket", det: {"contents": "Maglite flashlight, Eton hand-crank radio, 6 water bottles, space blanket, first aid"}},
-  { n: "Pet Carrier", t: { room: "storage", category: "supplies", subcategory: "pets" }, v: 25, d: "2021-06-01", l: "2025-06-15", u: "rarely", a: "none", i: "🐕", desc: "For vet visits", det: {"brand": "Sherpa", "model": "Original Deluxe", "color": "Black"}},
-  { n: "Scrap Fabric Bag", t: { room: "storage", category: "supplies", subcategory: "craft" }, v: 5, d: "2019-01-01", l: "2024-03-01", u: "rarely", a: "none", i: "🧵", desc: "Leftover fabric from projects", det: {"contents": "Cotton remnants (5), fleece scraps (2), denim pieces (3)"}},
-
-  // ─── SUPPLIES / CONSUMABLES (~15 items) ───
-  { n: "Toilet Paper (bulk)", t: { room: "storage", category: "supplies", subcategory: "consumables" }, v: 25, d: "2025-12-01", l: "2026-02-09", u: "daily", a: "none", i: "🧻", desc: "Costco pack", det: {"brand": "Kirkland (Costco)", "contents": "30-roll pack, ~20 remaining"}},
-  { n: "Paper Towels (spare)", t: { room: "storage", category: "supplies", subcategory: "consumables" }, v: 15, d: "2025-12-01", l: "2026-02-01", u: "weekly", a: "none", i: "🧻", desc: "Extra Costco pack", det: {"brand": "Bounty", "contents": "12-roll pack, ~8 remaining"}},
-  { n: "Trash Bags (box)", t: { room: "storage", category: "supplies", subcategory: "consumables" }, v: 5, d: "2025-10-01", l: "2026-02-09", u: "daily", a: "none", i: "🗑️", desc: "13-gallon, Glad", det: {"brand": "Glad ForceFlex", "contents": "13-gallon, 80-count box"}},
-  { n: "Zip-lock Bags (assorted)", t: { room: "kitchen", category: "supplies", subcategory: "consumables" }, v: 1, d: "2025-06-01", l: "2026-02-07", u: "weekly", a: "none", i: "🫙", desc: "3 sizes", det: {"brand": "Ziploc", "contents": "Gallon, quart, sandwich sizes"}},
-  { n: "Dish Soap", t: { room: "kitchen", category: "supplies", subcategory: "cleaning" }, v: 0.5, d: "2025-11-01", l: "2026-02-09", u: "daily", a: "none", i: "🫧", desc: "Dawn", det: {"brand": "Dawn", "color": "Blue"}},
-  { n: "Sponges (pack)", t: { room: "kitchen", category: "supplies", subcategory: "cleaning" }, v: 0.3, d: "2025-09-01", l: "2026-02-09", u: "daily", a: "none", i: "🧽", desc: "3 new, 1 on the sink", det: {"brand": "Scotch-Brite"}},
-  { n: "Candle Collection (spare)", t: { room: "storage", category: "decor", subcategory: "candles" }, v: 3, d: "2023-01-01", l: null, u: "never", a: "none", i: "🕯️", desc: "Gifts, scents I don't like", det: {"brand": "Voluspa (1), Yankee Candle (2), Target (2), homemade (1)"}},
-  { n: "Air Fresheners", t: { room: "bathroom", category: "supplies", subcategory: "consumables" }, v: 0.5, d: "2025-08-01", l: "2026-02-09", u: "daily", a: "none", i: "🌸", desc: "Plug-in and spray", det: {"brand": "Glade PlugIn (1), Febreze spray (1)"}},
-  { n: "Stamps & Envelopes", t: { room: "office", category: "supplies", subcategory: "mail" }, v: 0.3, d: "2021-01-01", l: "2025-12-20", u: "rarely", a: "none", i: "📮", desc: "Book of stamps, mostly used for holidays", det: {"contents": "Forever stamps (12), holiday cards (5), legal envelopes (10)"}},
-  { n: "Sticky Notes", t: { room: "office", category: "supplies", subcategory: "desk" }, v: 0.2, d: "2023-06-01", l: "2026-01-28", u: "monthly", a: "none", i: "📝", desc: "3 pads, neon colors", det: {"brand": "Post-it", "color": "Neon pink, green, orange"}},
-
-  // ─── ADDITIONAL KITCHEN (~20 more) ───
-  { n: "Egg Timer", t: { room: "kitchen", category: "kitchenware", subcategory: "gadgets" }, v: 0.2, d: "2017-05-01", l: "2024-11-15", u: "rarely", a: "none", i: "⏱️", desc: "Mechanical, use phone timer instead", det: {"brand": "Bengt Ek Design", "material": "Stainless steel"}},
-  { n: "Garlic Press", t: { room: "kitchen", category: "kitchenware", subcategory: "gadgets" }, v: 0.3, d: "2018-09-01", l: "2025-12-10", u: "monthly", a: "none", i: "🧄", desc: "Hard to clean", det: {"brand": "OXO", "material": "Zinc alloy", "color": "Silver"}},
-  { n: "Mandoline Slicer", t: { room: "kitchen", category: "kitchenware", subcategory: "gadgets" }, v: 1, d: "2019-06-01", l: "2023-08-01", u: "never", a: "none", i: "🔪", desc: "Scared of it, used twice", det: {"brand": "Benriner", "material": "Plastic/stainless blade", "color": "Ivory"}},
-  { n: "Salad Spinner", t: { room: "kitchen", category: "kitchenware", subcategory: "gadgets" }, v: 5, d: "2020-03-01", l: "2025-06-15", u: "rarely", a: "none", i: "🥬", desc: "Takes up too much cabinet space", det: {"brand": "OXO", "material": "Plastic", "color": "Green/clear"}},
-  { n: "Ice Cream Maker", t: { room: "kitchen", category: "appliances", subcategory: "countertop" }, v: 10, d: "2021-07-04", l: "2022-08-15", u: "never", a: "none", i: "🍦", desc: "Used one summer", det: {"brand": "Cuisinart", "model": "ICE-21", "color": "White"}},
-  { n: "Fondue Set", t: { room: "kitchen", category: "kitchenware", subcategory: "specialty" }, v: 5, d: "2020-12-25", l: "2021-12-31", u: "never", a: "none", i: "🫕", desc: "Wedding gift, used on NYE once", det: {"brand": "Cuisinart", "material": "Ceramic pot, metal stand", "color": "White/chrome"}},
-  { n: "Cake Decorating Kit", t: { room: "kitchen", category: "kitchenware", subcategory: "bakeware" }, v: 3, d: "2019-04-15", l: "2021-10-01", u: "never", a: "none", i: "🎂", desc: "Piping bags, tips, rarely bake cakes", det: {"brand": "Wilton", "contents": "12 tips, 6 bags, 2 couplers, turntable"}},
-  { n: "Mortar & Pestle", t: { room: "kitchen", category: "kitchenware", subcategory: "prep" }, v: 2, d: "2018-08-01", l: "2024-05-20", u: "rarely", a: "low", i: "🪨", desc: "Granite, heavy", det: {"material": "Granite", "color": "Dark grey"}},
-  { n: "Chopsticks (assorted)", t: { room: "kitchen", category: "kitchenware", subcategory: "utensils" }, v: 0.3, d: "2017-01-01", l: "2026-01-25", u: "weekly", a: "none", i: "🥢", desc: "10 pairs from takeout and gifts", det: {"material": "Bamboo + melamine", "contents": "4 lacquered gift pairs, 6 takeout disposable"}},
-  { n: "Shot Glasses (8)", t: { room: "kitchen", category: "kitchenware", subcategory: "drinkware" }, v: 1, d: "2015-06-01", l: "2025-03-17", u: "rarely", a: "none", i: "🥃", desc: "Souvenir collection", det: {"contents": "Las Vegas, Cancún, Nashville, Portland, NYC, college logo (2), novelty"}},
-  { n: "Water Bottles (6)", t: { room: "kitchen", category: "kitchenware", subcategory: "drinkware" }, v: 4, d: "2019-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🥤", desc: "Use 2, rest in cabinet", det: {"brand": "Hydro Flask (2), Nalgene (1), S'well (1), promo (2)", "material": "Stainless + plastic"}},
-  { n: "Travel Mugs (4)", t: { room: "kitchen", category: "kitchenware", subcategory: "drinkware" }, v: 3, d: "2018-01-01", l: "2026-02-09", u: "weekly", a: "none", i: "☕", desc: "Lids keep going missing", det: {"brand": "Yeti (1), Contigo (2), free conference (1)", "material": "Stainless + plastic"}},
-  { n: "Placemats (set of 6)", t: { room: "kitchen", category: "linens", subcategory: "table" }, v: 1, d: "2020-11-01", l: "2025-11-28", u: "rarely", a: "none", i: "🍽️", desc: "Cork, only for holidays", det: {"material": "Cork", "color": "Natural brown"}},
-  { n: "Apron (2)", t: { room: "kitchen", category: "linens", subcategory: "kitchen" }, v: 0.5, d: "2019-12-25", l: "2025-12-24", u: "rarely", a: "low", i: "👨‍🍳", desc: "Novelty gift aprons", det: {"contents": "'Kiss the Cook' (novelty), striped blue (Williams Sonoma)"}},
-  { n: "Tea Collection", t: { room: "kitchen", category: "food", subcategory: "beverages" }, v: 2, d: "2022-01-01", l: "2026-02-09", u: "daily", a: "low", i: "🍵", desc: "30+ tea bags, 5 loose leaf tins", det: {"brand": "Harney & Sons, Twinings, Rishi", "contents": "Earl Grey, English Breakfast, chamomile, peppermint, green, jasmine, matcha"}},
-  { n: "Pasta (assorted dry)", t: { room: "kitchen", category: "food", subcategory: "pantry" }, v: 3, d: "2025-01-01", l: "2026-02-05", u: "weekly", a: "none", i: "🍝", desc: "6 boxes, various shapes", det: {"brand": "De Cecco, Barilla, Trader Joe's", "contents": "Spaghetti, penne, fusilli, farfalle, linguine, orzo"}},
-  { n: "Olive Oil Collection", t: { room: "kitchen", category: "food", subcategory: "pantry" }, v: 2, d: "2024-06-01", l: "2026-02-09", u: "daily", a: "none", i: "🫒", desc: "3 bottles, 1 fancy gift one", det: {"brand": "California Olive Ranch, Frantoia (gift), Trader Joe's", "contents": "2 extra virgin, 1 infused truffle oil"}},
-  { n: "Coffee Beans (3 bags)", t: { room: "kitchen", category: "food", subcategory: "beverages" }, v: 2, d: "2026-01-15", l: "2026-02-09", u: "daily", a: "low", i: "☕", desc: "Current, backup, and gifted bag", det: {"brand": "Counter Culture (Hologram), Blue Bottle (Three Africas), Hawaiian Kona (gift)"}},
-  { n: "Vitamins & Supplements", t: { room: "kitchen", category: "food", subcategory: "health" }, v: 2, d: "2024-01-01", l: "2026-02-09", u: "daily", a: "none", i: "💊", desc: "8 bottles, 3 expired", det: {"contents": "Vitamin D, B12, fish oil, magnesium, probiotics, zinc — 3 expired (biotin, collagen, iron)"}},
-  { n: "Snack Basket", t: { room: "kitchen", category: "food", subcategory: "snacks" }, v: 5, d: "2025-12-01", l: "2026-02-09", u: "daily", a: "none", i: "🍿", desc: "Crackers, chips, granola bars", det: {"contents": "Ritz crackers, Kettle chips, Nature Valley bars, popcorn kernels, trail mix, rice cakes"}},
-
-  // ─── ADDITIONAL CLOTHING (~30 more) ───
-  { n: "Workout Shorts (4)", t: { room: "closet", category: "clothing", subcategory: "activewear" }, v: 2, d: "2021-01-01", l: "2026-02-07", u: "weekly", a: "none", i: "🩳", desc: "Gym shorts", det: {"brand": "Nike (2), Lululemon (1), Champion (1)", "color": "Black (2), grey, navy"}},
-  { n: "Rain Boots", t: { room: "closet", category: "clothing", subcategory: "shoes" }, v: 6, d: "2019-10-01", l: "2025-12-15", u: "rarely", a: "none", i: "🥾", desc: "Rubber, barely worn", det: {"brand": "Hunter", "model": "Original Tall", "material": "Rubber", "color": "Black"}},
-  { n: "Slippers (2 pair)", t: { room: "closet", category: "clothing", subcategory: "shoes" }, v: 3, d: "2021-12-25", l: "2026-02-09", u: "daily", a: "low", i: "🩴", desc: "1 winter, 1 summer pair", det: {"brand": "L.L. Bean (winter), Birkenstock (summer)", "material": "Shearling, cork/leather", "color": "Brown, taupe"}},
-  { n: "Swim Trunks (2)", t: { room: "closet", category: "clothing", subcategory: "swimwear" }, v: 1, d: "2020-06-01", l: "2025-08-10", u: "rarely", a: "none", i: "🩱", desc: "For beach vacations", det: {"brand": "Patagonia (1), J.Crew (1)", "color": "Blue floral, solid navy"}},
-  { n: "Thermal Underwear", t: { room: "closet", category: "clothing", subcategory: "underwear" }, v: 1, d: "2018-12-01", l: "2025-01-20", u: "rarely", a: "none", i: "🧥", desc: "Long johns, worn skiing", det: {"brand": "Smartwool", "material": "Merino wool", "color": "Black"}},
-  { n: "Dress Socks (6 pair)", t: { room: "closet", category: "clothing", subcategory: "underwear" }, v: 0.5, d: "2018-06-01", l: "2025-05-15", u: "rarely", a: "none", i: "🧦", desc: "From office days", det: {"brand": "Gold Toe (4), Happy Socks (2)", "material": "Cotton/nylon", "color": "Black (4), patterned (2)"}},
-  { n: "Graphic Tees (8)", t: { room: "closet", category: "clothing", subcategory: "tops" }, v: 4, d: "2016-01-01", l: "2025-09-01", u: "monthly", a: "low", i: "👕", desc: "Band tees, event shirts, too small", det: {"contents": "Radiohead bear, brewery logo, Austin TX, 5K race (2), startup logo, national park, meme shirt"}},
-  { n: "Polo Shirts (3)", t: { room: "closet", category: "clothing", subcategory: "tops" }, v: 2, d: "2018-04-01", l: "2024-07-04", u: "rarely", a: "none", i: "👕", desc: "Company polo, 2 from gifts", det: {"brand": "Company Patagonia blank (1), Ralph Lauren (2)", "color": "Navy, white, black"}},
-  { n: "Fleece Vest", t: { room: "closet", category: "clothing", subcategory: "outerwear" }, v: 2, d: "2020-10-01", l: "2025-11-15", u: "monthly", a: "low", i: "🧥", desc: "Patagonia, company gift", det: {"brand": "Patagonia", "model": "Better Sweater Vest", "color": "Industrial green"}},
-  { n: "Linen Pants (2)", t: { room: "closet", category: "clothing", subcategory: "bottoms" }, v: 2, d: "2022-05-01", l: "2025-08-20", u: "rarely", a: "low", i: "👖", desc: "Summer only", det: {"brand": "J.Crew", "material": "Linen", "color": "Khaki, white"}},
-  { n: "Overalls", t: { room: "closet", category: "clothing", subcategory: "bottoms" }, v: 3, d: "2019-07-01", l: "2024-05-01", u: "rarely", a: "low", i: "👖", desc: "Trendy purchase, wore twice", det: {"brand": "Carhartt", "material": "Duck canvas", "color": "Hamilton brown"}},
-  { n: "Sunglasses (3 pair)", t: { room: "closet", category: "clothing", subcategory: "accessories" }, v: 0.5, d: "2018-01-01", l: "2025-09-15", u: "rarely", a: "low", i: "🕶️", desc: "1 good, 1 scratched, 1 cheap backup", det: {"brand": "Ray-Ban Wayfarer (1), Warby Parker (1), gas station (1)", "color": "Black, tortoise, neon green"}},
-  { n: "Watch (daily)", t: { room: "closet", category: "clothing", subcategory: "accessories" }, v: 0.1, d: "2022-06-01", l: "2026-02-09", u: "daily", a: "medium", i: "⌚", desc: "Apple Watch", det: {"brand": "Apple", "model": "Apple Watch Series 8", "color": "Midnight aluminum"}},
-  { n: "Old Watch", t: { room: "closet", category: "clothing", subcategory: "accessories" }, v: 0.1, d: "2018-06-01", l: "2022-06-01", u: "never", a: "low", i: "⌚", desc: "Fossil, battery dead", det: {"brand": "Fossil", "model": "Grant Chronograph", "material": "Stainless steel + leather", "color": "Silver/brown"}},
-  { n: "Fanny Pack", t: { room: "closet", category: "clothing", subcategory: "bags" }, v: 1, d: "2019-07-01", l: "2025-08-01", u: "rarely", a: "none", i: "👜", desc: "For concerts and hiking", det: {"brand": "Patagonia", "model": "Black Hole Waist Pack", "color": "Black"}},
-  { n: "Tote Bags (5)", t: { room: "closet", category: "clothing", subcategory: "bags" }, v: 3, d: "2018-01-01", l: "2026-02-08", u: "weekly", a: "none", i: "👜", desc: "Canvas, from events and stores", det: {"brand": "Baggu (2), NPR, bookstore, farmers market", "material": "Canvas + nylon"}},
-  { n: "Compression Socks", t: { room: "closet", category: "clothing", subcategory: "underwear" }, v: 0.3, d: "2023-06-01", l: "2025-10-20", u: "rarely", a: "none", i: "🧦", desc: "For flights", det: {"brand": "Sockwell", "material": "Merino wool blend", "color": "Charcoal"}},
-  { n: "Ski Jacket", t: { room: "closet", category: "clothing", subcategory: "outerwear" }, v: 5, d: "2018-12-01", l: "2025-02-15", u: "rarely", a: "low", i: "🧥", desc: "Insulated, bulky", det: {"brand": "Arc'teryx", "model": "Sabre AR", "color": "Dark navy"}},
-  { n: "Hawaiian Shirt", t: { room: "closet", category: "clothing", subcategory: "tops" }, v: 1, d: "2019-06-01", l: "2025-07-04", u: "rarely", a: "low", i: "👕", desc: "Theme party purchase", det: {"brand": "Reyn Spooner", "material": "Cotton", "color": "Blue palm print"}},
-  { n: "Leather Jacket", t: { room: "closet", category: "clothing", subcategory: "outerwear" }, v: 4, d: "2017-09-01", l: "2025-10-15", u: "monthly", a: "high", i: "🧥", desc: "Vintage, sentimental", det: {"brand": "Schott NYC", "model": "Perfecto 118", "material": "Cowhide leather", "color": "Black"}},
-  { n: "Cufflinks & Tie Clips", t: { room: "closet", category: "clothing", subcategory: "accessories" }, v: 0.1, d: "2016-06-01", l: "2023-06-15", u: "never", a: "low", i: "💎", desc: "From dressy era", det: {"material": "Sterling silver, stainless", "contents": "Monogrammed cufflinks, plain bar clip, novelty guitar clip"}},
-
-  // ─── ADDITIONAL BATHROOM (~15 more) ───
-  { n: "Curling Iron", t: { room: "bathroom", category: "appliances", subcategory: "personal_care" }, v: 1, d: "2019-05-01", l: "2025-12-31", u: "monthly", a: "low", i: "💇", desc: "For special occasions", det: {"brand": "T3", "model": "SinglePass Curl", "color": "White"}},
-  { n: "Hair Straightener", t: { room: "bathroom", category: "appliances", subcategory: "personal_care" }, v: 1, d: "2020-02-01", l: "2025-11-20", u: "monthly", a: "low", i: "💇", desc: "Chi flat iron", det: {"brand": "Chi", "model": "Original Flat Iron", "color": "Black"}},
-  { n: "Electric Razor", t: { room: "bathroom", category: "appliances", subcategory: "personal_care" }, v: 0.5, d: "2022-12-25", l: "2026-02-08", u: "weekly", a: "low", i: "🪒", desc: "Braun, with old one in drawer", det: {"brand": "Braun", "model": "Series 7", "color": "Silver"}},
-  { n: "Old Electric Razor", t: { room: "bathroom", category: "appliances", subcategory: "personal_care" }, v: 0.5, d: "2018-06-01", l: "2022-12-25", u: "never", a: "none", i: "🪒", desc: "Replaced, foils worn", det: {"brand": "Braun", "model": "Series 3", "color": "Black"}},
-  { n: "Dental Floss (4 spools)", t: { room: "bathroom", category: "toiletries", subcategory: "dental" }, v: 0.3, d: "2024-06-01", l: "2026-02-09", u: "daily", a: "none", i: "🦷", desc: "Bought in bulk", det: {"brand": "Oral-B Glide"}},
-  { n: "Mouthwash (2 bottles)", t: { room: "bathroom", category: "toiletries", subcategory: "dental" }, v: 1.5, d: "2025-06-01", l: "2026-02-09", u: "daily", a: "none", i: "🦷", desc: "Full and backup", det: {"brand": "Listerine (1), ACT (1)", "color": "Blue, purple"}},
-  { n: "Body Lotion (3)", t: { room: "bathroom", category: "toiletries", subcategory: "skincare" }, v: 1.5, d: "2024-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🧴", desc: "1 current, 2 gift scents", det: {"brand": "Eucerin (daily), Aesop (gift), Bath & Body Works (gift)"}},
-  { n: "Hair Products (5)", t: { room: "bathroom", category: "toiletries", subcategory: "hair" }, v: 2, d: "2023-01-01", l: "2026-02-09", u: "daily", a: "none", i: "💇", desc: "Pomade, gel, spray — most half-empty", det: {"brand": "Bumble and bumble (2), American Crew (1), Oribe (1), Garnier (1)"}},
-  { n: "Shower Caddy", t: { room: "bathroom", category: "decor", subcategory: "storage" }, v: 2, d: "2019-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🚿", desc: "Hanging, rusty corners", det: {"brand": "SimpleHuman", "material": "Stainless steel", "color": "Silver"}},
-  { n: "Deodorant (3)", t: { room: "bathroom", category: "toiletries", subcategory: "personal" }, v: 0.5, d: "2025-08-01", l: "2026-02-09", u: "daily", a: "none", i: "✨", desc: "1 current, 2 backup scents", det: {"brand": "Native (1), Old Spice (1), Dove (1)"}},
-  { n: "Razor Blades (old)", t: { room: "bathroom", category: "toiletries", subcategory: "personal" }, v: 0.2, d: "2021-01-01", l: "2022-12-25", u: "never", a: "none", i: "🪒", desc: "For old razor model, wrong type", det: {"brand": "Gillette Fusion", "contents": "8-pack, wrong cartridge for current razor"}},
-  { n: "Face Masks (packets)", t: { room: "bathroom", category: "toiletries", subcategory: "skincare" }, v: 0.5, d: "2023-12-25", l: "2025-04-01", u: "rarely", a: "none", i: "✨", desc: "Sheet masks, gift set, 8 left", det: {"brand": "Dr. Jart+ (3), TonyMoly (3), Saturday Skin (2)"}},
-  { n: "Bathroom Cup/Toothbrush Holder", t: { room: "bathroom", category: "decor", subcategory: "accessories" }, v: 0.3, d: "2019-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🪥", desc: "Ceramic, matches nothing", det: {"material": "Ceramic", "color": "Pale blue"}},
-  { n: "Tweezers & Nail Kit", t: { room: "bathroom", category: "toiletries", subcategory: "grooming" }, v: 0.2, d: "2017-01-01", l: "2026-01-30", u: "monthly", a: "none", i: "✂️", desc: "In a small pouch", det: {"brand": "Tweezerman", "contents": "Slant tweezers, nail clipper, file, cuticle pusher"}},
-  { n: "Bathroom Scale Mat", t: { room: "bathroom", category: "linens", subcategory: "bath" }, v: 0.5, d: "2021-01-02", l: "2026-02-01", u: "weekly", a: "none", i: "⚖️", desc: "Goes under scale", det: {"material": "Bamboo", "color": "Natural"}},
-
-  // ─── ADDITIONAL ELECTRONICS (~20 more) ───
-  { n: "Smart Speaker", t: { room: "kitchen", category: "electronics", subcategory: "smart_home" }, v: 1, d: "2021-11-26", l: "2026-02-09", u: "daily", a: "low", i: "🔊", desc: "Echo Dot, kitchen counter", det: {"brand": "Amazon", "model": "Echo Dot 4th gen", "color": "Charcoal"}},
-  { n: "Smart Speaker (bedroom)", t: { room: "bedroom", category: "electronics", subcategory: "smart_home" }, v: 1, d: "2022-12-25", l: "2026-02-09", u: "daily", a: "low", i: "🔊", desc: "Google Nest Mini", det: {"brand": "Google", "model": "Nest Mini 2nd gen", "color": "Chalk"}},
-  { n: "Smart Plugs (4)", t: { room: "living_room", category: "electronics", subcategory: "smart_home" }, v: 0.5, d: "2022-06-01", l: "2026-02-09", u: "daily", a: "none", i: "🔌", desc: "For lamps and coffee maker", det: {"brand": "TP-Link Kasa", "model": "EP10", "color": "White"}},
-  { n: "Wi-Fi Router", t: { room: "office", category: "electronics", subcategory: "networking" }, v: 1, d: "2021-03-01", l: "2026-02-09", u: "daily", a: "none", i: "📶", desc: "Mesh system, 2 nodes", det: {"brand": "Google", "model": "Nest Wifi Pro (2-pack)", "color": "Snow white"}},
-  { n: "Old Router", t: { room: "storage", category: "electronics", subcategory: "networking" }, v: 1, d: "2018-01-01", l: "2021-03-01", u: "never", a: "none", i: "📶", desc: "Replaced, in a drawer", det: {"brand": "Netgear", "model": "Nighthawk R7000", "color": "Black"}},
-  { n: "Kindle", t: { room: "bedroom", category: "electronics", subcategory: "tablets" }, v: 0.3, d: "2020-12-25", l: "2026-02-03", u: "weekly", a: "medium", i: "📱", desc: "Paperwhite, daily reader", det: {"brand": "Amazon", "model": "Kindle Paperwhite 11th gen", "color": "Black"}},
-  { n: "AirPods", t: { room: "closet", category: "electronics", subcategory: "audio" }, v: 0.1, d: "2023-06-01", l: "2026-02-09", u: "daily", a: "low", i: "🎧", desc: "Pro 2nd gen", det: {"brand": "Apple", "model": "AirPods Pro 2nd gen", "color": "White"}},
-  { n: "Old AirPods", t: { room: "storage", category: "electronics", subcategory: "audio" }, v: 0.1, d: "2019-12-25", l: "2023-06-01", u: "never", a: "none", i: "🎧", desc: "Battery lasts 20 min", det: {"brand": "Apple", "model": "AirPods 1st gen", "color": "White"}},
-  { n: "Power Bank", t: { room: "closet", category: "electronics", subcategory: "accessories" }, v: 0.3, d: "2021-08-01", l: "2025-10-20", u: "rarely", a: "none", i: "🔋", desc: "Anker 10000mAh", det: {"brand": "Anker", "model": "PowerCore 10000", "color": "Black"}},
-  { n: "Old Power Bank", t: { room: "storage", category: "electronics", subcategory: "accessories" }, v: 0.3, d: "2018-03-01", l: "2021-08-01", u: "never", a: "none", i: "🔋", desc: "Swollen battery, should be recycled", det: {"brand": "RAVPower", "model": "RP-PB052", "color": "Black"}},
-  { n: "HDMI Cables (5)", t: { room: "storage", category: "electronics", subcategory: "cables" }, v: 1, d: "2017-01-01", l: "2025-11-26", u: "rarely", a: "none", i: "🔌", desc: "Various lengths and versions", det: {"brand": "AmazonBasics (3), Monoprice (2)", "contents": "3ft (2), 6ft (2), 10ft (1)"}},
-  { n: "USB-C Dongles (3)", t: { room: "office", category: "electronics", subcategory: "peripherals" }, v: 0.2, d: "2020-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🔌", desc: "USB-A, SD card, HDMI adapters", det: {"brand": "Anker (2), Apple (1)", "contents": "USB-A adapter, SD reader, HDMI multiport"}},
-  { n: "Portable Monitor", t: { room: "office", category: "electronics", subcategory: "computer" }, v: 2, d: "2022-09-01", l: "2025-10-15", u: "rarely", a: "low", i: "🖥️", desc: "15.6 inch, for travel", det: {"brand": "ASUS", "model": "ZenScreen MB16AH", "color": "Dark grey"}},
-  { n: "Apple TV", t: { room: "living_room", category: "electronics", subcategory: "entertainment" }, v: 0.3, d: "2021-11-26", l: "2026-02-09", u: "daily", a: "low", i: "📺", desc: "4K, mounted behind TV", det: {"brand": "Apple", "model": "Apple TV 4K (2021)", "color": "Black"}},
-  { n: "Chromecast (old)", t: { room: "storage", category: "electronics", subcategory: "entertainment" }, v: 0.1, d: "2017-06-01", l: "2021-11-26", u: "never", a: "none", i: "📺", desc: "Replaced by Apple TV", det: {"brand": "Google", "model": "Chromecast 2nd gen", "color": "Black"}},
-  { n: "Ring Doorbell", t: { room: "entryway", category: "electronics", subcategory: "smart_home" }, v: 0.5, d: "2022-04-01", l: "2026-02-09", u: "daily", a: "low", i: "🔔", desc: "Video doorbell", det: {"brand": "Ring", "model": "Video Doorbell 4", "color": "Satin nickel"}},
-  { n: "Security Camera (indoor)", t: { room: "living_room", category: "electronics", subcategory: "smart_home" }, v: 0.3, d: "2023-01-15", l: "2026-02-09", u: "daily", a: "none", i: "📷", desc: "Wyze cam, watches the dog", det: {"brand": "Wyze", "model": "Cam v3", "color": "White"}},
-  { n: "Thermostat (smart)", t: { room: "living_room", category: "electronics", subcategory: "smart_home" }, v: 0.2, d: "2021-09-01", l: "2026-02-09", u: "daily", a: "none", i: "🌡️", desc: "Nest Learning", det: {"brand": "Google Nest", "model": "Learning Thermostat 3rd gen", "color": "Stainless steel"}},
-  { n: "Smoke Detectors (3)", t: { room: "storage", category: "electronics", subcategory: "safety" }, v: 0.5, d: "2019-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🔥", desc: "Nest Protect, interconnected", det: {"brand": "Google Nest", "model": "Nest Protect 2nd gen", "color": "White"}},
-  { n: "TV Wall Mount Hardware", t: { room: "storage", category: "electronics", subcategory: "accessories" }, v: 2, d: "2021-11-26", l: null, u: "never", a: "none", i: "📺", desc: "Leftover screws, old mount bracket", det: {"brand": "Mounting Dream", "contents": "Old bracket, screws, wall anchors, level"}},
-
-  // ─── ADDITIONAL BOOKS (~15 more) ───
-  { n: "Self-Help Books", t: { room: "living_room", category: "books", subcategory: "self_help" }, v: 5, d: "2020-01-01", l: "2024-06-01", u: "rarely", a: "low", i: "📚", desc: "Atomic Habits, 4-Hour Workweek, etc.", det: {"titles": [{"title": "Atomic Habits", "author": "James Clear"}, {"title": "The 4-Hour Workweek", "author": "Tim Ferriss"}, {"title": "Daring Greatly", "author": "Brené Brown"}, {"title": "The Power of Now", "author": "Eckhart Tolle"}]}},
-  { n: "Language Learning Books", t: { room: "office", category: "books", subcategory: "education" }, v: 3, d: "2019-09-01", l: "2020-03-15", u: "never", a: "none", i: "📖", desc: "Spanish, never got past chapter 3", det: {"titles": [{"title": "Fluent Forever", "author": "Gabriel Wyner"}, {"title": "Madrigal's Magic Key to Spanish", "author": "Margarita Madrigal"}]}},
-  { n: "Poetry Collection", t: { room: "living_room", category: "books", subcategory: "poetry" }, v: 2, d: "2017-02-14", l: "2024-02-14", u: "rarely", a: "medium", i: "📜", desc: "Gift from partner", det: {"titles": [{"title": "Milk and Honey", "author": "Rupi Kaur"}, {"title": "The Sun and Her Flowers", "author": "Rupi Kaur"}, {"title": "Devotions", "author": "Mary Oliver"}]}},
-  { n: "Graphic Novels (6)", t: { room: "living_room", category: "books", subcategory: "comics" }, v: 4, d: "2018-01-01", l: "2024-08-01", u: "rarely", a: "medium", i: "📚", desc: "Persepolis, Maus, Saga", det: {"titles": [{"title": "Persepolis", "author": "Marjane Satrapi"}, {"title": "Maus", "author": "Art Spiegelman"}, {"title": "Saga Vol. 1-3", "author": "Brian K. Vaughan"}, {"title": "Fun Home", "author": "Alison Bechdel"}]}},
-  { n: "Magazines (old subscriptions)", t: { room: "storage", category: "books", subcategory: "magazines" }, v: 10, d: "2017-01-01", l: null, u: "never", a: "none", i: "📰", desc: "4 years of Wired, National Geographic", det: {"brand": "Wired, National Geographic", "contents": "2017–2021 issues, ~48 each"}},
-  { n: "Fitness/Health Book", t: { room: "bedroom", category: "books", subcategory: "health" }, v: 1, d: "2021-01-02", l: "2021-03-15", u: "never", a: "none", i: "📖", desc: "New Year's purchase, read 20 pages", det: {"titles": [{"title": "Bigger Leaner Stronger", "author": "Michael Matthews"}]}},
-  { n: "History Books (3)", t: { room: "living_room", category: "books", subcategory: "nonfiction" }, v: 4, d: "2016-01-01", l: "2023-08-01", u: "rarely", a: "low", i: "📚", desc: "WWII, Roman Empire, Guns Germs Steel", det: {"titles": [{"title": "The Rise and Fall of the Third Reich", "author": "William L. Shirer"}, {"title": "SPQR: A History of Ancient Rome", "author": "Mary Beard"}, {"title": "Guns, Germs, and Steel", "author": "Jared Diamond"}]}},
-  { n: "Philosophy Books (4)", t: { room: "living_room", category: "books", subcategory: "nonfiction" }, v: 3, d: "2014-01-01", l: "2022-01-01", u: "rarely", a: "low", i: "📚", desc: "Meditations, Camus, Nietzsche", det: {"titles": [{"title": "Meditations", "author": "Marcus Aurelius"}, {"title": "The Stranger", "author": "Albert Camus"}, {"title": "Beyond Good and Evil", "author": "Friedrich Nietzsche"}, {"title": "Being and Nothingness", "author": "Jean-Paul Sartre"}]}},
-  { n: "Coloring Book (adult)", t: { room: "living_room", category: "books", subcategory: "activity" }, v: 1, d: "2020-04-15", l: "2020-06-01", u: "never", a: "none", i: "🖍️", desc: "Pandemic activity, 3 pages colored", det: {"brand": "Johanna Basford", "titles": [{"title": "Secret Garden", "author": "Johanna Basford"}]}},
-  { n: "Map/Atlas", t: { room: "living_room", category: "books", subcategory: "reference" }, v: 3, d: "2015-08-01", l: "2022-07-01", u: "never", a: "low", i: "🗺️", desc: "Large world atlas, beautiful but use Google Maps", det: {"brand": "National Geographic", "contents": "World Atlas, 11th Edition"}},
-  { n: "Baby Name Book", t: { room: "storage", category: "books", subcategory: "reference" }, v: 1, d: "2023-03-01", l: "2023-09-01", u: "never", a: "low", i: "📖", desc: "From when friends were expecting", det: {"titles": [{"title": "The Baby Name Wizard", "author": "Laura Wattenberg"}]}},
-  { n: "DIY Home Repair Book", t: { room: "garage", category: "books", subcategory: "reference" }, v: 2, d: "2019-08-01", l: "2024-05-01", u: "rarely", a: "none", i: "🔧", desc: "YouTube is better", det: {"titles": [{"title": "Home Improvement 1-2-3", "author": "Home Depot"}]}},
-  { n: "Meditation Book", t: { room: "bedroom", category: "books", subcategory: "self_help" }, v: 1, d: "2021-06-01", l: "2022-01-15", u: "never", a: "none", i: "🧘", desc: "Read half, use Headspace instead", det: {"titles": [{"title": "Wherever You Go, There You Are", "author": "Jon Kabat-Zinn"}]}},
-
-  // ─── ADDITIONAL DECOR & LIVING (~20 more) ───
-  { n: "Throw Pillows (old set)", t: { room: "storage", category: "decor", subcategory: "textiles" }, v: 10, d: "2017-06-01", l: "2019-04-20", u: "never", a: "none", i: "🛋️", desc: "From previous sofa, don't match", det: {"brand":"Target","material":"Cotton","color":"Teal and grey — clashed with new sofa"} },
-  { n: "Picture Frames (unused)", t: { room: "storage", category: "decor", subcategory: "accessories" }, v: 3, d: "2018-01-01", l: null, u: "never", a: "none", i: "🖼️", desc: "5 empty frames, wrong sizes", det: {"brand":"IKEA (3), Target (2)","material":"Wood + metal","color":"Black (3), white (2)"} },
-  { n: "Fake Flowers (vase)", t: { room: "dining_room", category: "decor", subcategory: "accessories" }, v: 3, d: "2020-06-01", l: "2026-02-09", u: "daily", a: "none", i: "🌸", desc: "Dusty silk flowers", det: {"material":"Silk + plastic stems","color":"Pink peonies, white hydrangea"} },
-  { n: "Curtains (living room)", t: { room: "living_room", category: "decor", subcategory: "window" }, v: 5, d: "2019-06-01", l: "2026-02-09", u: "daily", a: "none", i: "🪟", desc: "Blackout panels", det: {"brand": "West Elm", "material": "Cotton sateen", "color": "White, blackout lined"}},
-  { n: "Old Curtains", t: { room: "storage", category: "decor", subcategory: "window" }, v: 5, d: "2018-04-01", l: "2019-06-01", u: "never", a: "none", i: "🪟", desc: "Wrong length, from old apartment", det: {"brand":"IKEA","material":"Polyester","color":"Navy blue, 63\" (need 84\")"} },
-  { n: "Clock (wall)", t: { room: "kitchen", category: "decor", subcategory: "clocks" }, v: 1, d: "2019-05-01", l: "2026-02-09", u: "daily", a: "low", i: "🕐", desc: "Use phone, but it's decorative", det: {"brand":"Umbra","material":"Wood + metal","color":"Walnut frame, brass hands"} },
-  { n: "Coasters (set of 8)", t: { room: "living_room", category: "decor", subcategory: "accessories" }, v: 0.5, d: "2020-03-01", l: "2026-02-09", u: "daily", a: "none", i: "🍺", desc: "Cork, stained", det: {"material": "Cork", "color": "Natural with geometric print"}},
-  { n: "Vases (3)", t: { room: "living_room", category: "decor", subcategory: "accessories" }, v: 4, d: "2018-01-01", l: "2025-02-14", u: "rarely", a: "low", i: "🏺", desc: "Used when flowers arrive", det: {"contents": "Tall ceramic (white, CB2), glass cylinder (clear), small bud vase (blue, handmade)"}},
-  { n: "Bookends", t: { room: "living_room", category: "decor", subcategory: "accessories" }, v: 1, d: "2019-08-01", l: "2026-02-09", u: "daily", a: "low", i: "📚", desc: "Marble, holding up shelf", det: {"material": "Marble", "color": "White Carrara marble"}},
-  { n: "Woven Basket (decorative)", t: { room: "living_room", category: "decor", subcategory: "storage" }, v: 10, d: "2020-04-01", l: "2026-02-09", u: "daily", a: "low", i: "🧺", desc: "Holds blankets", det: {"brand": "Olli Ella", "material": "Seagrass", "color": "Natural"}},
-  { n: "Decorative Tray", t: { room: "living_room", category: "decor", subcategory: "accessories" }, v: 1, d: "2020-06-01", l: "2026-02-09", u: "daily", a: "none", i: "🪵", desc: "On coffee table, holds remotes", det: {"material": "Mango wood", "color": "Dark walnut"}},
-  { n: "Wall Calendar", t: { room: "kitchen", category: "decor", subcategory: "wall_art" }, v: 0.3, d: "2025-12-25", l: "2026-02-09", u: "daily", a: "none", i: "📅", desc: "Current year, from grandma", det: {"brand":"Lang","contents":"National Parks photography calendar, 2026"} },
-  { n: "Tapestry/Wall Hanging", t: { room: "bedroom", category: "decor", subcategory: "wall_art" }, v: 1, d: "2017-09-01", l: "2026-02-09", u: "daily", a: "medium", i: "🖼️", desc: "Woven, from travels", det: {"material":"Hand-woven cotton","color":"Indigo and cream","contents":"Purchased at market in Oaxaca, Mexico"} },
-  { n: "Wind Chimes", t: { room: "entryway", category: "decor", subcategory: "outdoor" }, v: 1, d: "2020-05-01", l: "2026-02-09", u: "daily", a: "low", i: "🎐", desc: "Bamboo, on porch", det: {"material": "Bamboo", "color": "Natural"}},
-  { n: "Door Mat (back)", t: { room: "garage", category: "decor", subcategory: "rugs" }, v: 2, d: "2019-06-01", l: "2026-02-09", u: "daily", a: "none", i: "🚪", desc: "Muddy, needs replacing", det: {"material": "Rubber/coir", "color": "Black"}},
-
-  // ─── ADDITIONAL GIFTS / SENTIMENTAL (~15 more) ───
-  { n: "Scrapbook", t: { room: "storage", category: "gifts", subcategory: "memories" }, v: 3, d: "2016-06-01", l: "2024-12-25", u: "rarely", a: "high", i: "📔", desc: "Partner made it, first anniversary", det: {"contents": "First anniversary gift — photos, ticket stubs, pressed flowers, handwritten notes"}},
-  { n: "Travel Snow Globes (4)", t: { room: "living_room", category: "gifts", subcategory: "travel" }, v: 2, d: "2015-01-01", l: "2026-02-09", u: "daily", a: "medium", i: "🌍", desc: "Paris, NYC, Tokyo, London", det: {"contents": "Paris (Eiffel Tower), NYC (Statue of Liberty), Tokyo (cherry blossom), London (Big Ben)"}},
-  { n: "Signed Baseball", t: { room: "office", category: "gifts", subcategory: "sports" }, v: 0.5, d: "2012-08-01", l: "2026-02-09", u: "daily", a: "high", i: "⚾", desc: "From dad, childhood game", det: {"brand": "Rawlings", "contents": "Signed by Ken Griffey Jr., father-son game at Safeco Field (2008)"}},
-  { n: "Graduation Cap & Gown", t: { room: "storage", category: "gifts", subcategory: "awards" }, v: 5, d: "2013-05-15", l: null, u: "never", a: "medium", i: "🎓", desc: "Worn once, can't throw away", det: {"color": "Maroon", "contents": "Cap, gown, tassel (2013), honor cord (gold)"}},
-  { n: "Wedding Guest Book", t: { room: "storage", category: "gifts", subcategory: "memories" }, v: 1, d: "2022-06-15", l: null, u: "never", a: "high", i: "💒", desc: "Messages from loved ones", det: {"material": "Leather-bound, cream pages", "contents": "Messages from 127 guests"}},
-  { n: "Housewarming Gifts (misc)", t: { room: "storage", category: "gifts", subcategory: "unwanted" }, v: 5, d: "2018-04-01", l: null, u: "never", a: "low", i: "🎁", desc: "Cheese board, cocktail set, diffuser", det: {"contents": "Cheese board (bamboo), cocktail shaker (copper), reed diffuser, coaster set (marble)"}},
-  { n: "Old Journals (3)", t: { room: "storage", category: "gifts", subcategory: "memories" }, v: 2, d: "2010-01-01", l: null, u: "never", a: "high", i: "📓", desc: "Personal diaries, 2010-2015", det: {"brand": "Moleskine (2), handmade leather (1)", "contents": "Personal diary entries 2010–2015"}},
-  { n: "Ticket Stubs Collection", t: { room: "storage", category: "gifts", subcategory: "memories" }, v: 0.3, d: "2008-01-01", l: null, u: "never", a: "high", i: "🎟️", desc: "Concerts, movies, flights", det: {"contents": "Radiohead (2012), Hamilton (2017), flights to Tokyo/Paris/Rome, movie tickets (20+)"}},
-  { n: "Pressed Flowers", t: { room: "storage", category: "gifts", subcategory: "memories" }, v: 0.2, d: "2019-02-14", l: null, u: "never", a: "high", i: "🌹", desc: "From first Valentine's Day", det: {"contents": "Red roses from first Valentine's Day, pressed between wax paper"}},
-  { n: "Retirement Gift (mom's)", t: { room: "storage", category: "gifts", subcategory: "family" }, v: 1, d: "2022-09-01", l: null, u: "never", a: "medium", i: "🎁", desc: "Crystal paperweight, inherited", det: {"brand": "Waterford", "material": "Crystal", "contents": "Engraved paperweight"}},
-  { n: "Novelty Mug Collection", t: { room: "kitchen", category: "gifts", subcategory: "unwanted" }, v: 3, d: "2016-01-01", l: "2025-12-25", u: "monthly", a: "low", i: "☕", desc: "8 joke mugs, 'World's Best' etc.", det: {"contents": "'World's Best Dog Dad', 'I Survived 2020', 'But First Coffee', cat memes (2), Secret Santa (3)"}},
-  { n: "Puzzle Box (wooden)", t: { room: "living_room", category: "gifts", subcategory: "travel" }, v: 0.5, d: "2018-07-01", l: "2024-12-25", u: "rarely", a: "medium", i: "🧩", desc: "From Japan trip, decorative", det: {"material": "Hinoki cypress", "contents": "Japanese Hakone yosegi marquetry, 12-step"}},
-  { n: "Name Plate / Door Sign", t: { room: "storage", category: "gifts", subcategory: "personalized" }, v: 0.5, d: "2018-04-01", l: null, u: "never", a: "low", i: "🏷️", desc: "Housewarming gift, never hung up", det: {"material": "Brass", "contents": "Engraved 'The [Last Name] Residence'"}},
-  { n: "Monogrammed Towels", t: { room: "storage", category: "gifts", subcategory: "personalized" }, v: 3, d: "2022-06-15", l: null, u: "never", a: "low", i: "🛁", desc: "Wedding gift, too nice to use", det: {"brand": "Pottery Barn", "material": "Egyptian cotton", "color": "White with navy monogram"}},
-
-  // ─── ADDITIONAL MISC / STORAGE (~20 more) ───
-  { n: "Suitcase (carry-on, old)", t: { room: "storage", category: "clothing", subcategory: "bags" }, v: 35, d: "2015-06-01", l: "2020-02-01", u: "never", a: "none", i: "🧳", desc: "Wheel broken, kept as backup", det: {"brand": "American Tourister", "material": "Nylon", "color": "Red"}},
-  { n: "Board Game (duplicate)", t: { room: "storage", category: "toys", subcategory: "games" }, v: 5, d: "2021-12-25", l: null, u: "never", a: "none", i: "🎲", desc: "Got Catan twice as gifts", det: {"brand": "Catan (Asmodee)", "contents": "Base game, received as gift twice"}},
-  { n: "Playing Cards (3 decks)", t: { room: "living_room", category: "toys", subcategory: "games" }, v: 0.3, d: "2019-01-01", l: "2025-12-25", u: "rarely", a: "none", i: "🃏", desc: "1 complete, 2 missing cards", det: {"brand": "Bicycle (2), Bee (1)"}},
-  { n: "Jigsaw Puzzle (completed)", t: { room: "storage", category: "toys", subcategory: "puzzles" }, v: 3, d: "2020-04-20", l: "2020-05-01", u: "never", a: "none", i: "🧩", desc: "Completed during lockdown, re-boxed", det: {"brand": "Ravensburger", "contents": "1000-piece, Van Gogh Starry Night"}},
-  { n: "Frisbee", t: { room: "garage", category: "sports", subcategory: "outdoor" }, v: 1, d: "2018-06-01", l: "2025-07-04", u: "rarely", a: "none", i: "🥏", desc: "For park days", det: {"brand": "Discraft", "model": "Ultra-Star 175g", "color": "White"}},
-  { n: "Kite", t: { room: "garage", category: "sports", subcategory: "outdoor" }, v: 3, d: "2019-04-01", l: "2022-06-15", u: "never", a: "none", i: "🪁", desc: "Flew once, string tangled", det: {"brand": "Prism", "model": "Stowaway Delta", "color": "Rainbow"}},
-  { n: "Picnic Blanket", t: { room: "garage", category: "linens", subcategory: "outdoor" }, v: 3, d: "2019-05-01", l: "2025-08-01", u: "rarely", a: "low", i: "🧶", desc: "Waterproof backed", det: {"brand": "Benevolence LA", "material": "Cotton/waterproof", "color": "Navy plaid"}},
-  { n: "Beach Towels (3)", t: { room: "storage", category: "linens", subcategory: "outdoor" }, v: 5, d: "2018-06-01", l: "2025-08-10", u: "rarely", a: "none", i: "🏖️", desc: "Faded, sandy corners", det: {"brand": "Sand Cloud (1), Target (2)", "material": "Cotton terry", "color": "Blue stripe, tropical, faded red"}},
-  { n: "Air Mattress", t: { room: "storage", category: "furniture", subcategory: "guest" }, v: 30, d: "2019-11-01", l: "2025-06-15", u: "rarely", a: "none", i: "🛏️", desc: "Queen, with pump, for guests", det: {"brand": "Intex", "model": "Comfort Plush Queen", "color": "Grey"}},
-  { n: "Sleeping Bag (extra)", t: { room: "storage", category: "sports", subcategory: "camping" }, v: 10, d: "2016-07-01", l: "2022-08-01", u: "never", a: "none", i: "🏕️", desc: "From college, musty smell", det: {"brand": "REI Co-op", "model": "Trailbreak 30", "color": "Blue"}},
-  { n: "Thermos", t: { room: "kitchen", category: "kitchenware", subcategory: "drinkware" }, v: 1, d: "2019-12-25", l: "2025-11-15", u: "rarely", a: "none", i: "🥤", desc: "Stanley, for road trips", det: {"brand": "Stanley", "model": "Classic Legendary", "color": "Hammertone green"}},
-  { n: "Lunch Box", t: { room: "kitchen", category: "kitchenware", subcategory: "containers" }, v: 3, d: "2020-09-01", l: "2024-06-01", u: "rarely", a: "none", i: "🍱", desc: "Insulated, from office days", det: {"brand": "PackIt", "color": "Black", "material": "Insulated fabric"}},
-  { n: "Slow Cooker Liners", t: { room: "kitchen", category: "supplies", subcategory: "consumables" }, v: 0.5, d: "2021-01-01", l: null, u: "never", a: "none", i: "🍲", desc: "Bought for slow cooker, never used", det: {"brand": "Reynolds", "contents": "Box of 8, unopened"}},
-  { n: "Ice Cube Trays (5)", t: { room: "kitchen", category: "kitchenware", subcategory: "gadgets" }, v: 1, d: "2018-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🧊", desc: "Silicone, novelty shapes, standard", det: {"brand": "Mixed", "material": "Silicone", "contents": "2 standard, 1 large sphere, 1 star-shaped, 1 herb-freezer"}},
-  { n: "Corkscrew/Wine Opener (3)", t: { room: "kitchen", category: "kitchenware", subcategory: "gadgets" }, v: 0.3, d: "2017-01-01", l: "2025-12-31", u: "monthly", a: "none", i: "🍷", desc: "Waiter's, winged, electric — use 1", det: {"contents": "Waiter's (Laguiole), winged (OXO), electric (Oster)"}},
-  { n: "Pet Bed", t: { room: "living_room", category: "supplies", subcategory: "pets" }, v: 20, d: "2021-06-01", l: "2026-02-09", u: "daily", a: "medium", i: "🐕", desc: "Large, memory foam", det: {"brand": "Big Barker", "model": "Sleek Edition", "material": "Memory foam", "color": "Charcoal grey"}},
-  { n: "Pet Toys (bag)", t: { room: "living_room", category: "supplies", subcategory: "pets" }, v: 5, d: "2021-06-01", l: "2026-02-09", u: "daily", a: "low", i: "🐕", desc: "Balls, ropes, squeaky toys", det: {"brand": "Kong (2), Chuckit (1), rope (3), squeaky (4)"}},
-  { n: "Pet Food & Bowls", t: { room: "kitchen", category: "supplies", subcategory: "pets" }, v: 10, d: "2025-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🐕", desc: "25 lb bag, 2 bowls", det: {"brand": "Blue Buffalo (food), Le Creuset (bowls)", "contents": "25 lb bag, 2 stoneware bowls (blue)"}},
-  { n: "Spare Keys (assorted)", t: { room: "storage", category: "supplies", subcategory: "misc" }, v: 0.1, d: "2015-01-01", l: null, u: "never", a: "none", i: "🔑", desc: "7 keys, unknown what they open", det: {"contents": "Old apartment (2), padlock (1), parents' house (1), filing cabinet (1), unknown (2)"}},
-  { n: "Instruction Manuals", t: { room: "storage", category: "supplies", subcategory: "paper" }, v: 2, d: "2017-01-01", l: null, u: "never", a: "none", i: "📋", desc: "For appliances, all available online", det: {"contents": "Dishwasher, washer, thermostat, router, printer, TV, coffee maker — all online as PDFs"}},
-
-  // ─── FINAL BATCH ───
-  { n: "Spatula (3)", t: { room: "kitchen", category: "kitchenware", subcategory: "utensils" }, v: 0.5, d: "2018-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🥄", desc: "Silicone, metal, wooden", det: {"brand": "OXO / GIR", "material": "Silicone (2), stainless (1)"}},
-  { n: "Can Opener", t: { room: "kitchen", category: "kitchenware", subcategory: "gadgets" }, v: 0.2, d: "2018-01-01", l: "2026-01-20", u: "monthly", a: "none", i: "🥫", desc: "Manual, rusty", det: {"brand": "EZ-DUZ-IT", "material": "Steel", "color": "Black handles"}},
-  { n: "Potato Peeler (2)", t: { room: "kitchen", category: "kitchenware", subcategory: "gadgets" }, v: 0.2, d: "2017-01-01", l: "2026-01-25", u: "weekly", a: "none", i: "🥔", desc: "Y-peeler and swivel", det: {"brand": "Kuhn Rikon (Y-peeler), OXO (swivel)", "material": "Steel/plastic"}},
-  { n: "Meat Thermometer", t: { room: "kitchen", category: "kitchenware", subcategory: "gadgets" }, v: 0.1, d: "2020-07-04", l: "2025-07-04", u: "rarely", a: "none", i: "🌡️", desc: "Instant read, for grilling", det: {"brand": "ThermoWorks", "model": "ThermoPop", "color": "Red"}},
-  { n: "Kitchen Shears", t: { room: "kitchen", category: "kitchenware", subcategory: "utensils" }, v: 0.2, d: "2019-03-01", l: "2026-02-05", u: "weekly", a: "none", i: "✂️", desc: "Come-apart for cleaning", det: {"brand": "Shun", "material": "Stainless steel", "color": "Black handles"}},
-  { n: "Rolling Pin", t: { room: "kitchen", category: "kitchenware", subcategory: "bakeware" }, v: 1, d: "2017-12-01", l: "2025-12-24", u: "rarely", a: "low", i: "🪵", desc: "French style, for holiday cookies", det: {"brand": "J.K. Adams", "material": "Maple", "color": "Natural"}},
-  { n: "Muffin Tin (2)", t: { room: "kitchen", category: "kitchenware", subcategory: "bakeware" }, v: 2, d: "2018-04-01", l: "2025-04-10", u: "rarely", a: "none", i: "🧁", desc: "12-cup and mini", det: {"brand": "USA Pan", "material": "Aluminized steel"}},
-  { n: "Pie Dish", t: { room: "kitchen", category: "kitchenware", subcategory: "bakeware" }, v: 2, d: "2017-11-20", l: "2025-11-28", u: "rarely", a: "low", i: "🥧", desc: "Ceramic, for Thanksgiving", det: {"brand": "Emile Henry", "material": "Ceramic", "color": "Burgundy"}},
-  { n: "Cooling Rack", t: { room: "kitchen", category: "kitchenware", subcategory: "bakeware" }, v: 1, d: "2019-12-01", l: "2025-12-24", u: "rarely", a: "none", i: "🍪", desc: "Wire, for cookies", det: {"brand": "Checkered Chef", "material": "Stainless steel wire"}},
-  { n: "Oven Mitts (3)", t: { room: "kitchen", category: "linens", subcategory: "kitchen" }, v: 1, d: "2019-01-01", l: "2026-02-08", u: "weekly", a: "none", i: "🧤", desc: "1 good pair, 1 thin, 1 novelty", det: {"brand": "OXO (1), Williams Sonoma (1), novelty lobster claw (1)", "material": "Silicone + cotton"}},
-  { n: "Kitchen Towels (8)", t: { room: "kitchen", category: "linens", subcategory: "kitchen" }, v: 2, d: "2020-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🧻", desc: "Mix of decorative and functional", det: {"brand": "Williams Sonoma (3), Target (3), novelty (2)", "material": "Cotton"}},
-  { n: "Tongs (3)", t: { room: "kitchen", category: "kitchenware", subcategory: "utensils" }, v: 0.5, d: "2018-06-01", l: "2026-02-08", u: "weekly", a: "none", i: "🥄", desc: "Small, medium, large", det: {"brand": "OXO", "material": "Stainless steel with silicone tips"}},
-  { n: "Grater/Zester", t: { room: "kitchen", category: "kitchenware", subcategory: "gadgets" }, v: 0.3, d: "2019-01-01", l: "2025-12-10", u: "monthly", a: "none", i: "🧀", desc: "Microplane", det: {"brand": "Microplane", "material": "Stainless steel", "color": "Black handle"}},
-  { n: "Pepper Mill", t: { room: "kitchen", category: "kitchenware", subcategory: "gadgets" }, v: 0.5, d: "2020-06-01", l: "2026-02-09", u: "daily", a: "none", i: "🧂", desc: "Wooden, needs refilling", det: {"brand": "Peugeot", "model": "Paris u'Select", "material": "Beechwood", "color": "Natural"}},
-  { n: "V-neck Tees (5)", t: { room: "closet", category: "clothing", subcategory: "tops" }, v: 2, d: "2019-01-01", l: "2026-02-09", u: "weekly", a: "none", i: "👕", desc: "Basics, 2 stretched out", det: {"brand": "Everlane (3), H&M (2)", "material": "Cotton", "color": "White (2), black, grey, heather"}},
-  { n: "Long Sleeve Tees (4)", t: { room: "closet", category: "clothing", subcategory: "tops" }, v: 3, d: "2019-01-01", l: "2026-01-15", u: "monthly", a: "none", i: "👕", desc: "Layering basics", det: {"brand": "Uniqlo (2), Target (2)", "material": "Cotton", "color": "Black, white, grey, olive"}},
-  { n: "Denim Jacket", t: { room: "closet", category: "clothing", subcategory: "outerwear" }, v: 2, d: "2018-04-01", l: "2025-10-01", u: "monthly", a: "medium", i: "🧥", desc: "Classic, slightly faded", det: {"brand": "Levi's", "model": "Trucker Jacket", "material": "Denim", "color": "Medium stonewash"}},
-  { n: "Noise Machine", t: { room: "bedroom", category: "electronics", subcategory: "sleep" }, v: 0.5, d: "2021-06-01", l: "2026-02-09", u: "daily", a: "low", i: "🔊", desc: "Yogasleep Dohm", det: {"brand": "Yogasleep", "model": "Dohm Classic", "color": "White"}},
-  { n: "Humidifier", t: { room: "bedroom", category: "appliances", subcategory: "climate" }, v: 5, d: "2022-01-15", l: "2026-01-15", u: "monthly", a: "none", i: "💨", desc: "For winter, needs cleaning", det: {"brand": "Levoit", "model": "Classic 300S", "color": "White"}},
-  { n: "Heating Pad", t: { room: "bedroom", category: "electronics", subcategory: "health" }, v: 1, d: "2021-03-01", l: "2025-12-10", u: "monthly", a: "low", i: "🔥", desc: "For back pain", det: {"brand": "Sunbeam", "model": "King Size XpressHeat", "color": "Teal"}},
-  { n: "Yoga Blocks (2)", t: { room: "closet", category: "sports", subcategory: "fitness" }, v: 2, d: "2020-04-15", l: "2025-11-01", u: "monthly", a: "none", i: "🧘", desc: "Foam, for stretching", det: {"brand": "Manduka", "material": "Foam", "color": "Thunder grey"}},
-  { n: "Foam Roller", t: { room: "closet", category: "sports", subcategory: "fitness" }, v: 5, d: "2020-06-01", l: "2025-12-01", u: "monthly", a: "low", i: "🏋️", desc: "High-density, for recovery", det: {"brand": "TriggerPoint", "model": "GRID", "color": "Orange"}},
-  { n: "Jump Rope", t: { room: "closet", category: "sports", subcategory: "fitness" }, v: 0.5, d: "2021-01-02", l: "2023-06-01", u: "never", a: "none", i: "🏃", desc: "New Year's resolution, used once", det: {"brand": "Crossrope", "model": "Get Lean Set", "color": "Green"}},
-  { n: "Fishing Rod", t: { room: "garage", category: "sports", subcategory: "fishing" }, v: 10, d: "2018-05-01", l: "2023-06-15", u: "rarely", a: "low", i: "🎣", desc: "Spinning reel, used 4 times", det: {"brand": "Ugly Stik", "model": "GX2", "contents": "Spinning reel, 6'6\" medium"}},
-  { n: "Helmet (bike)", t: { room: "garage", category: "sports", subcategory: "cycling" }, v: 3, d: "2018-06-15", l: "2025-04-20", u: "rarely", a: "none", i: "⛑️", desc: "Giro, sweat-stained", det: {"brand": "Giro", "model": "Register MIPS", "color": "Matte black"}},
-  { n: "Gardening Gloves", t: { room: "garage", category: "tools", subcategory: "garden" }, v: 0.5, d: "2019-04-01", l: "2025-10-01", u: "rarely", a: "none", i: "🧤", desc: "Muddy, torn thumb", det: {"brand": "Pine Tree Tools", "material": "Bamboo/nitrile", "color": "Green"}},
-  { n: "Plant Pots (empty, 6)", t: { room: "garage", category: "tools", subcategory: "garden" }, v: 10, d: "2019-01-01", l: "2024-05-01", u: "rarely", a: "none", i: "🪴", desc: "Various sizes, terracotta and plastic", det: {"material": "Terracotta (4), plastic (2)", "contents": "4\", 6\", 8\", 10\" terracotta; 6\", 12\" plastic"}},
-  { n: "Tape Measure (2)", t: { room: "garage", category: "tools", subcategory: "measuring" }, v: 0.5, d: "2018-01-01", l: "2025-09-01", u: "monthly", a: "none", i: "📏", desc: "25ft and 12ft", det: {"brand": "Stanley", "contents": "25ft FatMax, 12ft pocket"}},
-  { n: "Screwdriver Set", t: { room: "garage", category: "tools", subcategory: "hand_tools" }, v: 2, d: "2017-06-01", l: "2025-11-15", u: "monthly", a: "none", i: "🔧", desc: "Phillips, flathead, various sizes", det: {"brand": "Craftsman", "contents": "4 Phillips, 3 flathead, 2 Torx"}},
-  { n: "Allen Wrench Set", t: { room: "garage", category: "tools", subcategory: "hand_tools" }, v: 0.3, d: "2018-01-01", l: "2025-01-15", u: "rarely", a: "none", i: "🔧", desc: "Metric and SAE, from IKEA builds", det: {"brand": "Bondhus", "contents": "Metric (1.5–10mm), SAE (1/16–3/8)"}},
-  { n: "Flashlight (2)", t: { room: "garage", category: "tools", subcategory: "equipment" }, v: 0.5, d: "2019-01-01", l: "2025-10-01", u: "rarely", a: "none", i: "🔦", desc: "LED, one dim", det: {"brand": "Maglite (1), Anker (1)", "contents": "LED handheld, Maglite 2-D cell"}},
-  { n: "Bubble Wrap (roll)", t: { room: "storage", category: "supplies", subcategory: "packing" }, v: 5, d: "2018-03-10", l: "2025-12-20", u: "rarely", a: "none", i: "📦", desc: "Saved from move, partly popped", det: {"contents": "12\" wide roll, ~50% popped, saved from 2018 move"}},
-  { n: "Hand Sanitizer (5 bottles)", t: { room: "storage", category: "toiletries", subcategory: "consumables" }, v: 1, d: "2020-04-01", l: "2025-06-01", u: "rarely", a: "none", i: "🧴", desc: "Pandemic stockpile", det: {"brand": "Purell (3), Bath & Body Works (2)"}},
-  { n: "Face Masks (disposable, box)", t: { room: "storage", category: "supplies", subcategory: "health" }, v: 2, d: "2020-04-01", l: "2025-01-15", u: "rarely", a: "none", i: "😷", desc: "500-count, barely dented", det: {"brand": "3M", "contents": "Blue surgical masks, ~450 of 500 remaining"}},
-  { n: "Plunger", t: { room: "bathroom", category: "tools", subcategory: "plumbing" }, v: 3, d: "2018-04-01", l: "2025-09-01", u: "rarely", a: "none", i: "🪠", desc: "Behind toilet", det: {"brand": "Korky", "model": "99-4A", "color": "Red/black"}},
-  { n: "Lint Roller (3)", t: { room: "closet", category: "supplies", subcategory: "clothing_care" }, v: 0.5, d: "2024-01-01", l: "2026-02-09", u: "daily", a: "none", i: "🧹", desc: "Dog hair essential", det: {"brand": "Scotch-Brite"}},
-  { n: "Reading Glasses (spare)", t: { room: "office", category: "supplies", subcategory: "personal" }, v: 0.1, d: "2023-03-01", l: "2026-02-09", u: "daily", a: "none", i: "👓", desc: "3 pairs scattered around house", det: {"brand": "Warby Parker", "contents": "3 pairs: office, nightstand, kitchen counter"}},
-  { n: "Nails & Screws (jar)", t: { room: "garage", category: "supplies", subcategory: "hardware" }, v: 1, d: "2018-01-01", l: "2025-09-01", u: "rarely", a: "none", i: "🔩", desc: "Assorted, from various projects", det: {"contents": "Drywall screws, finishing nails, wood screws, picture hangers — assorted"}},
-  { n: "Command Strips (box)", t: { room: "storage", category: "supplies", subcategory: "hanging" }, v: 0.3, d: "2021-01-01", l: "2025-09-01", u: "rarely", a: "none", i: "📌", desc: "Various sizes, half used", det: {"brand": "3M Command", "contents": "Medium strips (8), small hooks (4), large strips (2)"}},
-  { n: "Super Glue (dried)", t: { room: "garage", category: "supplies", subcategory: "repair" }, v: 0.1, d: "2020-06-01", l: "2023-01-01", u: "never", a: "none", i: "🧴", desc: "Cap glued shut", det: {"brand": "Loctite"}},
-  { n: "Paint Brushes (assorted)", t: { room: "garage", category: "tools", subcategory: "painting" }, v: 1, d: "2019-08-01", l: "2022-03-01", u: "never", a: "none", i: "🖌️", desc: "Dried paint, should be tossed", det: {"brand": "Purdy (2), generic (4)", "contents": "2\" angled, 3\" flat, roller frame, mini rollers"}},
-  { n: "Drop Cloth", t: { room: "garage", category: "supplies", subcategory: "painting" }, v: 3, d: "2019-08-01", l: "2022-03-01", u: "never", a: "none", i: "🎨", desc: "Canvas, paint-splattered", det: {"material": "Canvas", "color": "Off-white with paint splatter"}},
-  { n: "Rubber Gloves (cleaning)", t: { room: "storage", category: "supplies", subcategory: "cleaning" }, v: 0.3, d: "2024-06-01", l: "2026-02-02", u: "weekly", a: "none", i: "🧤", desc: "Yellow, for dishes", det: {"brand": "Playtex Living", "color": "Yellow", "material": "Latex"}},
-  { n: "Toilet Brush", t: { room: "bathroom", category: "tools", subcategory: "cleaning" }, v: 1, d: "2022-01-01", l: "2026-02-02", u: "weekly", a: "none", i: "🧹", desc: "With holder", det: {"brand": "OXO", "material": "Plastic/stainless", "color": "White/silver"}},
-  { n: "Dehumidifier", t: { room: "storage", category: "appliances", subcategory: "climate" }, v: 15, d: "2020-07-01", l: "2025-08-30", u: "rarely", a: "none", i: "💧", desc: "For basement, summer only", det: {"brand": "Frigidaire", "model": "FFAD5033W1", "color": "White"}},
-];
+// Precomputed catalog: ids, sizes and defaults are already filled in, so the
+// page parses one minified JSON document instead of a JS literal plus RAW.map.
+async function loadCatalog() {
+  const res = await fetch(new URL('../data/catalog.json', import.meta.url));
+  if (!res.ok) throw new Error(`catalog.json: HTTP ${res.status} (run scripts/build-catalog.py)`);
+  return (await res.json()).items;
+}
 
-// Expand raw data into full objects
-let idCounter = 0;
-export const OBJECTS = RAW.map(raw => {
-  idCounter++;
-  const id = `obj-${String(idCounter).padStart(3, '0')}`;
-  const volume = raw.v;
-  return {
-    id,
-    name: raw.n,
-    tags: raw.t,
-    volume_liters: volume,
-    size: deriveSize(volume),
-    dateObtained: raw.d,
-    lastUsed: raw.l,
-    usageFrequency: raw.u,
-    attachment: raw.a,
-    status: 'keeping',
-    description: raw.desc,
-    icon: raw.i,
-    detail: raw.det || null,
-  };
-});
+export const OBJECTS = await loadCatalog();
@@ -1,34 +1,242 @@
 // images.js — Shared image URL helpers for AI-generated item photos
 // Images are stored in shared/images/ as {id}.webp (512x512) and {id}-thumb.webp (128x128).
+// Items listed in shared/images/ladder.js also have a responsive ladder,
+// {id}-{width}w.{avif,webp}, which createPhotoEl / setPhotoSources expose via srcset.
+// Every image URL carries the item's content version from ladder.js (?v=), so
+// the server can mark it long-lived and a regenerated photo gets a new URL.
+// Thumbnails are also packed into a few thumbs-NN.bin pages (index: thumbs.json).
+// Views render them with setThumbSource(), which leaves the <img> without a src
+// until bundleThumbs() fills it with a blob URL sliced from its page, one page at
+// a time as they near the viewport; imageUrl(id, true) returns the blob URL once
+// its page has loaded.
 // If an image doesn't exist, graceful fallback via onerror.
 
+import { IMAGE_VERSIONS, LADDER_FORMATS, LADDER_WIDTHS } from '../images/ladder.js';
+
 // Derive base from this module's own URL so paths work on both
 // localhost (root = repo) and GitHub Pages (root = /dailydays/).
 const BASE = new URL('../images/', import.meta.url).href;
 
+// Default `sizes` hints: thumbnails render small, full photos up to card width.
+const THUMB_SIZES = '128px';
+const FULL_SIZES = '(max-width: 600px) 100vw, 512px';
+
+// Thumbnail bundle state: thumbs.json, pages fetched (page → Promise), id → blob URL
+let bundleIndex = null;
+const bundlePages = new Map();
+const bundledThumbs = new Map();
+let thumbObserver = null;
+
+// Append the item's content version, if ladder.js lists one
+function versioned(url, id) {
+  const version = IMAGE_VERSIONS[id];
+  return version ? `${url}?v=${version}` : url;
+}
+
 /**
  * Get the URL for an item's photo.
  * @param {string} id - Item ID (e.g. "obj-001")
- * @param {boolean} thumb - If true, returns the 128x128 thumbnail path
+ * @param {boolean} thumb - If true, returns the 128x128 thumbnail (from the bundle once loaded)
  * @returns {string} Relative URL to the image
  */
 export function imageUrl(id, thumb = false) {
-  return `${BASE}${id}${thumb ? '-thumb' : ''}.webp`;
+  if (thumb) return thumbUrl(id);
+  return versioned(`${BASE}${id}.webp`, id);
+}
+
+/**
+ * Get the URL for an item's 128x128 thumbnail: a blob URL if its bundle
+ * page has been loaded, otherwise the individual {id}-thumb.webp file.
+ * @param {string} id - Item ID
+ * @returns {string}
+ */
+export function thumbUrl(id) {
+  return bundledThumbs.get(id) ?? versioned(`${BASE}${id}-thumb.webp`, id);
+}
+
+async function loadBundlePage(page) {
+  const entry = bundleIndex.pages[page];
+  const res = await fetch(`${BASE}${entry.file}`);
+  if (!res.ok) return;
+  const buf = await res.arrayBuffer();
+  if (buf.byteLength !== entry.bytes) return; // stale or partial page: keep file URLs
+  for (const [id, [p, offset, length]] of Object.entries(bundleIndex.items)) {
+    if (String(p) !== page || bundledThumbs.has(id)) continue;
+    const blob = new Blob([new Uint8Array(buf, offset, length)], { type: 'image/webp' });
+    bundledThumbs.set(id, URL.createObjectURL(blob));
+  }
 }
 
 /**
- * Create an <img> element for an item's photo with lazy loading and graceful fallback.
+ * Fetch the bundle pages holding these items' thumbnails (all items by default).
+ * Never rejects: anything missing from the bundle keeps its per-file URL.
+ * Views use bundleThumbs() instead, which only fetches pages as they are needed.
+ * @param {string[]|null} ids - Item IDs the view will show
+ * @returns {Promise<number>} Number of thumbnails now served from the bundle
+ */
+export async function loadThumbBundle(ids = null) {
+  try {
+    if (!bundleIndex) {
+      const res = await fetch(`${BASE}thumbs.json`);
+      if (!res.ok) return 0;
+      bundleIndex = await res.json();
+    }
+    const wanted = ids ?? Object.keys(bundleIndex.items);
+    const pages = new Set();
+    for (const id of wanted) {
+      const slot = bundleIndex.items[id];
+      if (slot) pages.add(String(slot[0]));
+    }
+    await Promise.all([...pages].map(page => {
+      if (!bundlePages.has(page)) bundlePages.set(page, loadBundlePage(page).catch(() => {}));
+      return bundlePages.get(page);
+    }));
+  } catch {
+    // Offline or malformed index: per-file thumbnails still work
+  }
+  return bundledThumbs.size;
+}
+
+/**
+ * Show an item's thumbnail in an <img> rendered by a view that calls bundleThumbs().
+ * Uses the blob URL if its bundle page has loaded and the per-file thumbnail if
+ * the bundle has no entry for it; otherwise the <img> is left without a src (so
+ * the browser fetches nothing) until bundleThumbs() sees it near the viewport.
+ * @param {HTMLImageElement} img
+ * @param {string} id - Item ID
+ * @param {string|null} sizes - `sizes` for the ladder srcset if the per-file thumbnail is used
+ */
+export function setThumbSource(img, id, sizes = null) {
+  const bundled = bundledThumbs.get(id);
+  const unbundled = typeof IntersectionObserver === 'undefined'
+    || (bundleIndex && !bundleIndex.items[id]);
+  if (bundled || unbundled) {
+    img.src = thumbUrl(id);
+    if (sizes) setPhotoSources(img, id, sizes);
+    return;
+  }
+  img.dataset.thumbId = id;
+  if (sizes) img.dataset.thumbSizes = sizes;
+}
+
+// Give a placeholder <img> its thumbnail: the blob URL, else the per-file one
+function fillThumb(img) {
+  const { thumbId: id, thumbSizes: sizes } = img.dataset;
+  delete img.dataset.thumbId;
+  delete img.dataset.thumbSizes;
+  thumbObserver?.unobserve(img);
+  img.src = thumbUrl(id);
+  if (sizes) setPhotoSources(img, id, sizes);
+}
+
+async function onThumbsNearView(entries) {
+  const near = [];
+  for (const entry of entries) {
+    if (!entry.isIntersecting || !entry.target.dataset.thumbId) continue;
+    thumbObserver.unobserve(entry.target);
+    near.push(entry.target);
+  }
+  if (!near.length) return;
+  await loadThumbBundle(near.map(img => img.dataset.thumbId));
+  // These fall back to their per-file URL if the index or page failed to load
+  for (const img of near) {
+    if (img.dataset.thumbId) fillThumb(img);
+  }
+  // Other placeholders whose page came with them
+  for (const img of document.querySelectorAll('img[data-thumb-id]')) {
+    if (bundledThumbs.has(img.dataset.thumbId)) fillThumb(img);
+  }
+}
+
+/**
+ * Fill the thumbnail placeholders under `root` from the bundle as they near
+ * the viewport. Call after each render: when a placeholder comes within a
+ * screen of view, its bundle page is fetched and every placeholder from that
+ * page gets its blob URL, so pages nobody scrolls to are never downloaded and
+ * thumbnails in the bundle are never fetched as individual files.
+ * @param {ParentNode} root - Element the view rendered into
+ */
+export function bundleThumbs(root = document) {
+  const placeholders = root.querySelectorAll('img[data-thumb-id]');
+  if (typeof IntersectionObserver === 'undefined') {
+    placeholders.forEach(fillThumb);
+    return;
+  }
+  thumbObserver ??= new IntersectionObserver(onThumbsNearView, { rootMargin: '100% 0px' });
+  for (const img of placeholders) thumbObserver.observe(img);
+}
+
+/**
+ * Get the URL of one responsive ladder variant.
+ * @param {string} id - Item ID
+ * @param {number} width - Ladder width in px (e.g. 256)
+ * @param {string} format - 'avif' or 'webp'
+ * @returns {string}
+ */
+export function ladderUrl(id, width, format = 'webp') {
+  return versioned(`${BASE}${id}-${width}w.${format}`, id);
+}
+
+/**
+ * Build a `srcset` string for an item, or '' if it has no ladder variants.
+ * @param {string} id - Item ID
+ * @param {string} format - 'avif' or 'webp'
+ * @returns {string} e.g. "…/obj-001-64w.webp 64w, …/obj-001-128w.webp 128w"
+ */
+export function imageSrcset(id, format = 'webp') {
+  const widths = LADDER_WIDTHS[id];
+  if (!widths || !LADDER_FORMATS.includes(format)) return '';
+  return widths.map(w => `${ladderUrl(id, w, format)} ${w}w`).join(', ');
+}
+
+/**
+ * Let an existing <img> pick the smallest adequate WebP variant.
+ * Keeps its legacy src as the fallback; no-op for items without a ladder,
+ * and for an <img> already showing its bundled thumbnail (a srcset would
+ * override it).
+ * @param {HTMLImageElement} img
+ * @param {string} id - Item ID
+ * @param {string} sizes - `sizes` attribute (rendered CSS width)
+ */
+export function setPhotoSources(img, id, sizes) {
+  const srcset = imageSrcset(id, 'webp');
+  if (!srcset || img.getAttribute('src') === bundledThumbs.get(id)) return;
+  img.sizes = sizes;
+  img.srcset = srcset;
+}
+
+/**
+ * Create a photo element for an item with lazy loading and graceful fallback.
+ * Items with a ladder get a <picture> (AVIF source, WebP srcset on the <img>),
+ * so the browser downloads the smallest file adequate for `sizes`.
+ * Other items get a plain <img> with the legacy src.
  * @param {object} item - Item object with .id and .name
  * @param {boolean} thumb - If true, loads the thumbnail version
  * @param {string} className - CSS class(es) for the img element
- * @returns {HTMLImageElement}
+ * @param {string} sizes - `sizes` attribute; defaults by thumb/full
+ * @returns {HTMLPictureElement|HTMLImageElement}
  */
-export function createPhotoEl(item, thumb = false, className = '') {
+export function createPhotoEl(item, thumb = false, className = '', sizes = thumb ? THUMB_SIZES : FULL_SIZES) {
   const img = document.createElement('img');
   img.src = imageUrl(item.id, thumb);
   img.alt = item.name;
   if (className) img.className = className;
   img.loading = 'lazy';
   img.onerror = function () { this.style.display = 'none'; };
-  return img;
+  setPhotoSources(img, item.id, sizes);
+
+  const widths = LADDER_WIDTHS[item.id];
+  if (!widths) return img;
+
+  const picture = document.createElement('picture');
+  for (const format of LADDER_FORMATS) {
+    if (format === 'webp') continue; // WebP lives on the <img> itself
+    const source = document.createElement('source');
+    source.type = `image/${format}`;
+    source.srcset = imageSrcset(item.id, format);
+    source.sizes = sizes;
+    picture.appendChild(source);
+  }
+  picture.appendChild(img);
+  return picture;
 }